@@ -0,0 +1,352 @@
+"""Implementations of the heavier SkillOps CLI commands.
+
+Kept out of main.py so that building the CLI (and ``--help``) does not
+import rich panels, monitoring or the data import/export machinery.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, NoReturn, Optional
+
+import typer
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from src.lms.monitoring import ErrorAggregator, MetricsCollector
+
+
+# CLI logger; logging_config is only imported when --verbose asks for it
+_LOGGER = logging.getLogger("src.lms.main")
+
+
+def _setup_logger(verbose: bool) -> logging.Logger:
+    """Enable debug logging if requested and return the CLI logger."""
+    if verbose:
+        from src.lms.logging_config import setup_logging
+
+        setup_logging(verbose=True)
+    return _LOGGER
+
+
+@lru_cache(maxsize=1)
+def _alert_type() -> str:
+    """Resolve alert type from environment (email/webhook/both).
+
+    Read once per process; call ``_alert_type.cache_clear()`` after
+    changing SKILLOPS_ALERT_TYPE.
+    """
+    return os.getenv("SKILLOPS_ALERT_TYPE", "email")
+
+
+@dataclass
+class _StepRun:
+    """Outcome of a monitored step, filled in by the caller."""
+
+    success: bool = False
+    # Recorded as a failure on exit even though nothing was raised
+    error: Optional[Exception] = None
+
+
+@lru_cache(maxsize=1)
+def _aggregator() -> ErrorAggregator:
+    """Return the process-wide error aggregator."""
+    from src.lms.monitoring import ErrorAggregator
+
+    return ErrorAggregator()
+
+
+@lru_cache(maxsize=1)
+def _metrics() -> MetricsCollector:
+    """Return the process-wide metrics collector."""
+    from src.lms.monitoring import MetricsCollector
+
+    return MetricsCollector()
+
+
+@contextmanager
+def _monitored(
+    step_id: str,
+    enabled: bool,
+    metadata: dict,
+    context: Optional[dict] = None,
+) -> Iterator[_StepRun]:
+    """Record the duration, outcome and new errors of a step.
+
+    Does no bookkeeping at all when monitoring is disabled.
+    """
+    run = _StepRun()
+    if not enabled:
+        yield run
+        return
+
+    from src.lms.monitoring import schedule_alert_from_aggregator
+
+    aggregator = _aggregator()
+    metrics = _metrics()
+    started_ns = time.perf_counter_ns()
+    try:
+        yield run
+    except Exception as exc:  # pragma: no cover - passthrough to Typer
+        run.error = exc
+        raise
+    finally:
+        if run.error is not None and aggregator.record_error(
+            run.error, step_id, context=context
+        ):
+            schedule_alert_from_aggregator(aggregator, _alert_type())
+        metrics.record_step_execution(
+            step_id,
+            (time.perf_counter_ns() - started_ns) / 1e9,
+            run.success,
+            metadata=metadata,
+        )
+
+
+def run_notify(
+    verbose: bool,
+    storage_path: Optional[Path],
+    respect_schedule: bool,
+    enable_monitoring: bool,
+) -> bool:
+    """Send today's notification to Telegram, recording metrics if enabled."""
+    from src.lms.steps.notify import notify_step
+
+    logger = _setup_logger(verbose)
+    logger.debug(
+        "Starting notify_step with storage_path=%s, respect_schedule=%s",
+        storage_path,
+        respect_schedule,
+    )
+    with _monitored(
+        "notify",
+        enable_monitoring,
+        metadata={"respect_schedule": respect_schedule},
+    ) as run:
+        run.success = notify_step(
+            storage_path=storage_path, respect_schedule=respect_schedule
+        )
+
+    if run.success:
+        logger.debug("notify_step completed successfully")
+    else:
+        logger.warning("notify_step completed without sending notification")
+    return run.success
+
+
+def run_share(
+    verbose: bool,
+    labs_path: Optional[str],
+    github_token: Optional[str],
+    github_username: Optional[str],
+    enable_monitoring: bool,
+) -> None:
+    """Share lab projects to GitHub, recording metrics if enabled."""
+    from src.lms.steps.share import share_step
+
+    logger = _setup_logger(verbose)
+    details = {"labs_path": labs_path, "github_username": github_username}
+    logger.debug(
+        "Starting share_step with labs_path=%s, github_username=%s",
+        labs_path,
+        github_username,
+    )
+    try:
+        with _monitored(
+            "share", enable_monitoring, metadata=details, context=details
+        ) as run:
+            run.success = share_step(
+                labs_path=labs_path,
+                github_token=github_token,
+                github_username=github_username,
+            )
+            if not run.success:
+                run.error = RuntimeError("share_step returned False")
+    except Exception as exc:  # pragma: no cover - passthrough to Typer
+        logger.error("share_step raised exception: %s", exc)
+        raise
+
+    if not run.success:
+        logger.error("share_step failed")
+        raise typer.Exit(code=1)
+    logger.debug("share_step completed successfully")
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the console shared by the commands, created on first use."""
+    return Console()
+
+
+def _error_panel(title: str, body: str) -> Panel:
+    """Build the red panel used to report a failed command.
+
+    rich.panel is only imported once a command has actually failed.
+    """
+    from rich.panel import Panel
+
+    return Panel(body, title=f"[red]❌ {title}[/red]", border_style="red")
+
+
+def _fail(title: str, body: str, code: int = 1) -> NoReturn:
+    """Report a failed command in an error panel and exit."""
+    _console().print(_error_panel(title, body))
+    raise typer.Exit(code=code)
+
+
+def run_export(export_format: str, output: Optional[Path]) -> None:
+    """Export progress data, printing a diagnostic panel on failure."""
+    from src.lms.commands.export import DataExporter
+
+    console = _console()
+
+    try:
+        exporter = DataExporter()
+
+        if export_format.lower() == "json":
+            result = exporter.export_to_json(output_path=output)
+            console.print(f"\n[green]✓ Exported to {result}[/green]\n")
+        elif export_format.lower() == "csv":
+            results = exporter.export_to_csv(output_dir=output)
+            console.print(f"\n[green]✓ Exported {len(results)} CSV files[/green]\n")
+        else:
+            console.print("[red]✗ Invalid format. Use 'json' or 'csv'[/red]\n")
+            raise typer.Exit(code=1)
+
+        exporter.display_export_summary()
+
+    except FileNotFoundError as exc:
+        _fail(
+            "Export Failed",
+            f"[red]Directory not found:[/red] {exc}\n\n"
+            "[yellow]Suggestion:[/yellow] Ensure the output directory "
+            "exists or create it first:\n"
+            f"  mkdir -p {output if output else './skillops_exports'}",
+        )
+    except PermissionError:
+        _fail(
+            "Export Failed",
+            "[red]Permission denied:[/red] Cannot write to output location\n\n"
+            "[yellow]Suggestion:[/yellow] Check write permissions or "
+            "choose a different directory:\n"
+            "  skillops export -f json -o ~/skillops_backup.json",
+        )
+    except Exception as exc:
+        _fail(
+            "Export Error",
+            f"[red]Export failed:[/red] {exc}\n\n"
+            "[yellow]Tips:[/yellow]\n"
+            "  • Use --verbose flag for detailed error logs\n"
+            "  • Ensure all API keys are configured\n"
+            "  • Check available disk space",
+        )
+
+
+def run_import_data(file: Path, import_format: Optional[str], merge: bool) -> None:
+    """Import progress data after validation and confirmation."""
+    from src.lms.commands.data_import import DataImporter
+
+    console = _console()
+
+    if not file.exists():
+        _fail(
+            "Import Failed",
+            f"[red]File not found:[/red] {file}\n\n"
+            "[yellow]Suggestions:[/yellow]\n"
+            "  • Double-check the file path\n"
+            "  • Try: skillops export -f json -o backup.json\n"
+            "  • Use absolute path: /home/user/backups/skillops_export.json",
+        )
+
+    try:
+        importer = DataImporter()
+
+        # Auto-detect format if not specified
+        if import_format is None:
+            if file.is_file() and file.suffix == ".json":
+                import_format = "json"
+            elif file.is_file() and file.suffix == ".csv":
+                import_format = "csv"
+            elif file.is_dir():
+                import_format = "csv"
+            else:
+                _fail(
+                    "Format Detection Failed",
+                    "[red]Could not auto-detect format[/red]\n\n"
+                    "[yellow]Please specify format:[/yellow]\n"
+                    f"  skillops import-data {file} --format json\n"
+                    f"  skillops import-data {file} --format csv",
+                )
+
+        # Validate before importing
+        if not importer.validate_import(file):
+            _fail(
+                "Validation Failed",
+                f"[red]Invalid import file:[/red] {file}\n\n"
+                "[yellow]Check:[/yellow]\n"
+                "  • JSON files must be valid JSON\n"
+                "  • CSV files must have: date, steps, time, cards\n"
+                "  • File is not corrupted",
+            )
+
+        # Show confirmation
+        merge_note = " (merging)" if merge else " (replacing existing data)"
+        console.print(f"\n[yellow]⚠️  Importing from {file}{merge_note}[/yellow]")
+        console.print(
+            "[dim]A backup of current data will be created before import[/dim]"
+        )
+
+        from rich.prompt import Confirm
+
+        if not Confirm.ask("Continue with import?"):
+            console.print("[yellow]Import cancelled[/yellow]\n")
+            raise typer.Exit(code=0)
+
+        # Perform import
+        if import_format.lower() == "json":
+            success = importer.import_from_json(file, merge=merge, backup=True)
+        elif import_format.lower() == "csv":
+            success = importer.import_from_csv(file, merge=merge, backup=True)
+        else:
+            console.print("[red]✗ Invalid format. Use 'json' or 'csv'[/red]\n")
+            raise typer.Exit(code=1)
+
+        if success:
+            console.print("\n[green]✓ Import completed successfully[/green]\n")
+        else:
+            _fail(
+                "Import Error",
+                "[red]Import failed[/red]\n\n"
+                "[yellow]Try:[/yellow]\n"
+                "  • Check file format is correct\n"
+                "  • Use --verbose flag for details\n"
+                "  • Restore from backup in "
+                "~/.skillops/profiles/backups/",
+            )
+
+    except typer.Exit:
+        raise
+    except FileNotFoundError:
+        _fail(
+            "File Access Failed",
+            "[red]File access error: Unable to read file[/red]\n\n"
+            "[yellow]Ensure:[/yellow]\n"
+            "  • File has correct permissions\n"
+            "  • Directory exists and is readable",
+        )
+    except Exception as exc:
+        _fail(
+            "Unexpected Error",
+            f"[red]Import failed:[/red] {exc}\n\n"
+            "[yellow]Debug tips:[/yellow]\n"
+            "  • Run: skillops health (check system status)\n"
+            f"  • Run: skillops import-data {file} --verbose (logs)\n"
+            "  • Check file is not corrupted",
+        )
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Optional
 
 import yaml
-from google import genai
 from rich.console import Console
 from rich.table import Table
 
@@ -164,6 +163,10 @@ class BooksManager:
 
         console.print(f"Found {len(pdf_files)} PDF(s) to process:\n")
 
+        # Imported here: the Gemini SDK is slow to load and only needed
+        # for the commands that talk to the API
+        from google import genai
+
         # Initialize Gemini client
         client = genai.Client(api_key=gemini_api_key)
 
@@ -372,6 +375,8 @@ class BooksManager:
         """Fetch results from completed batch jobs."""
         console.print("\n[bold cyan]📥 Fetching Completed Books[/bold cyan]\n")
 
+        from google import genai
+
         # Initialize Gemini client
         client = genai.Client(api_key=gemini_api_key)
 
@@ -2,6 +2,7 @@
 
 import sqlite3
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -9,7 +10,53 @@ from typing import Optional
 from src.lms.paths import get_storage_path
 
 DB_NAME = "skillops.db"
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 9
+
+# code_sessions.date is derived from commit_time by SQLite itself when the
+# library supports generated columns (and DROP COLUMN for the migration).
+SUPPORTS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+if SUPPORTS_GENERATED_COLUMNS:
+    CODE_SESSIONS_DATE_COLUMN = (
+        "date TEXT GENERATED ALWAYS AS (substr(commit_time, 1, 10)) VIRTUAL"
+    )
+else:
+    CODE_SESSIONS_DATE_COLUMN = "date TEXT NOT NULL"
+
+# Inserts for a generated date column and for a plain one; pick the one
+# matching the database with code_session_insert_sql()
+INSERT_CODE_SESSION_SQL = """
+    INSERT OR IGNORE INTO code_sessions
+    (commit_hash, commit_time, commit_msg, files_changed, lines_added, lines_deleted)
+    VALUES (?, ?, ?, ?, ?, ?)
+    """
+INSERT_CODE_SESSION_WITH_DATE_SQL = """
+    INSERT OR IGNORE INTO code_sessions
+    (commit_hash, commit_time, commit_msg, files_changed, lines_added, lines_deleted, date)
+    VALUES (?1, ?2, ?3, ?4, ?5, ?6, substr(?2, 1, 10))
+    """
+
+# performance_metrics.timestamp holds unix-epoch microseconds, so range
+# filters are integer comparisons served by the timestamp indexes.
+PERFORMANCE_METRICS_TABLE = """
+    CREATE TABLE IF NOT EXISTS performance_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL, -- unix epoch, microseconds
+        step_id TEXT NOT NULL,
+        duration_seconds REAL NOT NULL,
+        success BOOLEAN NOT NULL,
+        api_calls INTEGER DEFAULT 0,
+        items_processed INTEGER DEFAULT 0,
+        metadata TEXT -- JSON
+    );
+    """
+
+
+def epoch_micros(moment: Optional[datetime] = None) -> int:
+    """Return a (local, naive) datetime, or now, as unix-epoch microseconds."""
+    if moment is None:
+        return time.time_ns() // 1000
+    return round(moment.timestamp() * 1_000_000)
 
 
 def get_db_path(storage_path: Optional[Path] = None) -> Path:
@@ -24,6 +71,10 @@ def get_connection(storage_path: Optional[Path] = None) -> sqlite3.Connection:
     conn = sqlite3.connect(get_db_path(storage_path))
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    # Safe with WAL: a crash may lose the last commits but never corrupts
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
     conn.execute("PRAGMA busy_timeout = 5000")
     return conn
 
@@ -145,20 +196,7 @@ def init_db(storage_path: Optional[Path] = None):
     )
 
     # Performance Metrics
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS performance_metrics (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        timestamp TEXT NOT NULL,
-        step_id TEXT NOT NULL,
-        duration_seconds REAL NOT NULL,
-        success BOOLEAN NOT NULL,
-        api_calls INTEGER DEFAULT 0,
-        items_processed INTEGER DEFAULT 0,
-        metadata TEXT -- JSON
-    );
-    """
-    )
+    cursor.execute(PERFORMANCE_METRICS_TABLE)
 
     # Chaos Events
     cursor.execute(
@@ -294,6 +332,14 @@ def _apply_migrations(conn: sqlite3.Connection) -> None:
         _migration_add_passive_tracking_tables(cursor)
         cursor.execute("INSERT INTO schema_version (version) VALUES (7)")
 
+    if current_version < 8:
+        _migration_generated_code_session_date(cursor)
+        cursor.execute("INSERT INTO schema_version (version) VALUES (8)")
+
+    if current_version < 9:
+        _migration_performance_metrics_epoch_timestamps(cursor)
+        cursor.execute("INSERT INTO schema_version (version) VALUES (9)")
+
 
 def _column_exists(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
     cursor.execute(f"PRAGMA table_info({table})")
@@ -452,11 +498,8 @@ def cleanup_old_records(
     total_deleted = 0
 
     cursor.execute(
-        """
-        DELETE FROM performance_metrics
-        WHERE timestamp < datetime('now', ?)
-        """,
-        (cutoff,),
+        "DELETE FROM performance_metrics WHERE timestamp < ?",
+        (epoch_micros(datetime.now() - timedelta(days=retention_raw)),),
     )
     total_deleted += cursor.rowcount
 
@@ -564,3 +607,94 @@ def _migration_add_passive_tracking_tables(cursor: sqlite3.Cursor) -> None:
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_tracking_summary_date ON tracking_summary(date)"
     )
+
+
+def _has_generated_session_date(cursor: sqlite3.Cursor) -> bool:
+    """Return True if code_sessions.date is a generated column."""
+    cursor.execute("PRAGMA table_xinfo(code_sessions)")
+    # hidden == 2/3 marks a virtual/stored generated column
+    return any(row[1] == "date" and row[6] in (2, 3) for row in cursor.fetchall())
+
+
+def code_session_insert_sql(conn: sqlite3.Connection) -> str:
+    """Return the code_sessions INSERT matching this database's date column.
+
+    The schema, not the running SQLite, decides: a database created or
+    migrated by an SQLite without generated columns keeps a plain date
+    column even when opened by a newer library.
+    """
+    if _has_generated_session_date(conn.cursor()):
+        return INSERT_CODE_SESSION_SQL
+    return INSERT_CODE_SESSION_WITH_DATE_SQL
+
+
+def validate_commit_time(commit_time: str) -> None:
+    """Reject commit timestamps that do not start with a YYYY-MM-DD date.
+
+    code_sessions.date is the first ten characters of commit_time, so a
+    malformed timestamp would otherwise store a garbage date.
+
+    Raises:
+        ValueError: If commit_time does not start with a valid date
+    """
+    datetime.strptime(commit_time[:10], "%Y-%m-%d")
+
+
+def _migration_generated_code_session_date(cursor: sqlite3.Cursor) -> None:
+    """Turn code_sessions.date into a column generated from commit_time."""
+    if not SUPPORTS_GENERATED_COLUMNS or _has_generated_session_date(cursor):
+        return
+
+    # Indexes referencing the column must go before it can be dropped
+    cursor.execute("DROP INDEX IF EXISTS idx_code_sessions_date")
+    cursor.execute("DROP INDEX IF EXISTS idx_code_sessions_date_time")
+    cursor.execute("ALTER TABLE code_sessions DROP COLUMN date")
+    cursor.execute(f"ALTER TABLE code_sessions ADD COLUMN {CODE_SESSIONS_DATE_COLUMN}")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_code_sessions_date ON code_sessions(date)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_code_sessions_date_time "
+        "ON code_sessions(date, commit_time)"
+    )
+
+
+def _migration_performance_metrics_epoch_timestamps(cursor: sqlite3.Cursor) -> None:
+    """Store performance_metrics timestamps as epoch microseconds."""
+    cursor.execute("PRAGMA table_info(performance_metrics)")
+    columns = {row[1]: row[2] for row in cursor.fetchall()}
+    if columns.get("timestamp", "").upper() != "INTEGER":
+        # Column types cannot be altered in place: rebuild the table.
+        # Old rows hold naive local ISO strings (converted to the millisecond).
+        cursor.execute("DROP INDEX IF EXISTS idx_performance_metrics_timestamp")
+        cursor.execute(
+            "ALTER TABLE performance_metrics RENAME TO performance_metrics_old"
+        )
+        cursor.execute(PERFORMANCE_METRICS_TABLE)
+        cursor.execute(
+            """
+            INSERT INTO performance_metrics
+            (id, timestamp, step_id, duration_seconds, success, api_calls,
+             items_processed, metadata)
+            SELECT id,
+                   COALESCE(
+                       CAST(strftime('%s', timestamp, 'utc') AS INTEGER) * 1000000
+                       + CAST(ROUND(strftime('%f', timestamp) * 1000000) AS INTEGER)
+                       % 1000000,
+                       0
+                   ),
+                   step_id, duration_seconds, success, api_calls,
+                   items_processed, metadata
+            FROM performance_metrics_old
+            """
+        )
+        cursor.execute("DROP TABLE performance_metrics_old")
+
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_performance_metrics_timestamp "
+        "ON performance_metrics(timestamp)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_performance_metrics_step_timestamp "
+        "ON performance_metrics(step_id, timestamp)"
+    )
@@ -4,12 +4,37 @@ Automatically records commit metadata to track coding sessions.
 Integrates with WakaTime for time-tracking intelligence.
 """
 
-from datetime import datetime
+import sqlite3
+import subprocess
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
-from src.lms.database import get_connection, init_db
+from src.lms.database import get_connection, get_db_path, init_db
 from src.lms.database import get_logical_date
+from src.lms.database import CODE_SESSIONS_DATE_COLUMN, code_session_insert_sql
+from src.lms.database import validate_commit_time
+from src.lms.tracking_optimization import batch_insert_code_sessions, chunked
+
+# Database paths whose code_sessions schema is already known to exist,
+# mapped to the INSERT matching that schema. The post-commit hook can fire
+# many times per process (rebase replays), so the DDL and the schema lookup
+# only need to run once per database.
+_SCHEMA_READY: dict[str, str] = {}
+
+# One git invocation yields hash, author date, message and per-file stats.
+# Each commit starts with \x1e; header fields are NUL-separated.
+_GIT_LOG_FORMAT = "--format=%x1e%H%x00%aI%x00%B%x00"
+
+# date is derived from commit_time by SQLite (see database.code_session_insert_sql)
+CommitRow = Tuple[str, str, str, int, int, int]
+_COMMIT_FIELDS = (
+    "commit_hash",
+    "commit_time",
+    "commit_msg",
+    "files_changed",
+    "lines_added",
+    "lines_deleted",
+)
 
 
 def install_post_commit_hook(repo_path: Optional[Path] = None) -> bool:
@@ -40,26 +65,12 @@ def install_post_commit_hook(repo_path: Optional[Path] = None) -> bool:
 # SkillOps auto-tracking hook
 # Records commit metadata for passive coding session tracking
 
-COMMIT_HASH=$(git rev-parse HEAD)
-COMMIT_TIME=$(git log -1 --format=%aI)
-COMMIT_MSG=$(git log -1 --format=%B)
-FILES_CHANGED=$(git diff-tree --no-commit-id --name-only -r HEAD | wc -l)
-LINES_ADDED=$(git diff-tree --no-commit-id --numstat -r HEAD | awk '{sum+=$1} END {print sum}')
-LINES_DELETED=$(git diff-tree --no-commit-id --numstat -r HEAD | awk '{sum+=$2} END {print sum}')
-
-# Call Python to record this to SQLite
+# Python reads the commit metadata itself (single git call)
 python3 -c "
 import sys
 sys.path.insert(0, '.')
-from src.lms.git_hooks import record_commit_to_db
-record_commit_to_db(
-    commit_hash='$COMMIT_HASH',
-    commit_time='$COMMIT_TIME',
-    commit_msg='$COMMIT_MSG',
-    files_changed=$FILES_CHANGED,
-    lines_added=${LINES_ADDED:-0},
-    lines_deleted=${LINES_DELETED:-0}
-)
+from src.lms.git_hooks import run_post_commit_hook
+run_post_commit_hook()
 " 2>/dev/null || true
 """
 
@@ -96,40 +107,12 @@ def record_commit_to_db(
         True if recorded successfully, False otherwise
     """
     try:
-        init_db(storage_path=storage_path)
-        conn = get_connection(storage_path=storage_path)
+        validate_commit_time(commit_time)
+        conn, insert_sql = _connect_with_schema(storage_path)
         cursor = conn.cursor()
 
-        # Ensure code_sessions table exists
-        cursor.execute(
-            """
-        CREATE TABLE IF NOT EXISTS code_sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            commit_hash TEXT UNIQUE NOT NULL,
-            commit_time TEXT NOT NULL,
-            commit_msg TEXT,
-            files_changed INTEGER,
-            lines_added INTEGER,
-            lines_deleted INTEGER,
-            recorded_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            date TEXT NOT NULL
-        );
-        """
-        )
-
-        # Extract date from commit_time (YYYY-MM-DD)
-        try:
-            commit_datetime = datetime.fromisoformat(commit_time.replace("Z", "+00:00"))
-            date_str = commit_datetime.strftime("%Y-%m-%d")
-        except Exception:
-            date_str = get_logical_date()
-
         cursor.execute(
-            """
-        INSERT OR IGNORE INTO code_sessions
-        (commit_hash, commit_time, commit_msg, files_changed, lines_added, lines_deleted, date)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+            insert_sql,
             (
                 commit_hash,
                 commit_time,
@@ -137,7 +120,6 @@ def record_commit_to_db(
                 files_changed,
                 lines_added,
                 lines_deleted,
-                date_str,
             ),
         )
 
@@ -147,8 +129,219 @@ def record_commit_to_db(
         return True
 
     except Exception:
+        # Re-check the schema next time in case the database was removed
+        _SCHEMA_READY.pop(str(get_db_path(storage_path)), None)
+        return False
+
+
+def run_post_commit_hook(
+    repo_path: Optional[Path] = None, storage_path: Optional[Path] = None
+) -> bool:
+    """Record the HEAD commit; entry point for the installed post-commit hook.
+
+    The git subprocess is started before the database is opened so that
+    SQLite setup overlaps with git producing its output.
+
+    Args:
+        repo_path: Git repository path (default: current dir)
+        storage_path: Optional custom storage directory
+
+    Returns:
+        True if recorded successfully, False otherwise
+    """
+    try:
+        proc = subprocess.Popen(
+            ["git", "log", "-1", _GIT_LOG_FORMAT, "--numstat", "HEAD"],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+
+    conn = None
+    try:
+        conn, insert_sql = _connect_with_schema(storage_path)
+        output, _ = proc.communicate()
+        if proc.returncode != 0:
+            return False
+
+        rows = list(_parse_git_log(output))
+        if not rows:
+            return False
+
+        conn.execute(insert_sql, rows[0])
+        conn.commit()
+        return True
+
+    except Exception:
+        _SCHEMA_READY.pop(str(get_db_path(storage_path)), None)
         return False
 
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        if conn is not None:
+            conn.close()
+
+
+def iter_commit_history(
+    repo_path: Optional[Path] = None,
+    since: Optional[str] = None,
+    chunk_size: int = 500,
+) -> Iterator[List[CommitRow]]:
+    """Stream historical commits from git log in fixed-size chunks.
+
+    Args:
+        repo_path: Git repository path (default: current dir)
+        since: Optional date accepted by ``git log --since``
+        chunk_size: Number of commits per chunk
+
+    Yields:
+        Lists of commit row tuples
+    """
+    cmd = ["git", "log", _GIT_LOG_FORMAT, "--numstat"]
+    if since:
+        cmd.append(f"--since={since}")
+    cmd.append("HEAD")
+
+    with subprocess.Popen(
+        cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ) as proc:
+        assert proc.stdout is not None
+        yield from chunked(_parse_git_log_stream(proc.stdout), chunk_size)
+
+
+def backfill_commit_history(
+    repo_path: Optional[Path] = None,
+    since: Optional[str] = None,
+    storage_path: Optional[Path] = None,
+    chunk_size: int = 500,
+) -> int:
+    """Import historical commits, one transaction per chunk.
+
+    Args:
+        repo_path: Git repository path (default: current dir)
+        since: Optional date accepted by ``git log --since``
+        storage_path: Optional custom storage directory
+        chunk_size: Number of commits per transaction
+
+    Returns:
+        Number of commits inserted
+    """
+    _connect_with_schema(storage_path)[0].close()
+    return sum(
+        batch_insert_code_sessions(
+            (dict(zip(_COMMIT_FIELDS, row)) for row in chunk),
+            storage_path=storage_path,
+        )
+        for chunk in iter_commit_history(repo_path, since, chunk_size)
+    )
+
+
+def _parse_git_log_stream(stream: Any, block_size: int = 65536) -> Iterator[CommitRow]:
+    """Parse git log output incrementally from a binary stream."""
+    pending = b""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        pending += block
+        # Keep the last (possibly incomplete) record for the next read
+        complete, sep, pending = pending.rpartition(b"\x1e")
+        if complete:
+            yield from _parse_git_log(complete)
+        pending = sep + pending
+    if pending:
+        yield from _parse_git_log(pending)
+
+
+def _parse_git_log(output: bytes) -> Iterator[CommitRow]:
+    """Parse ``git log`` output produced with _GIT_LOG_FORMAT and --numstat.
+
+    Args:
+        output: Raw stdout of git log
+
+    Yields:
+        Row tuples ready for the code_sessions INSERT
+    """
+    for record in output.split(b"\x1e"):
+        parts = record.split(b"\0", 3)
+        if len(parts) < 4:
+            continue
+
+        commit_hash = parts[0].decode().strip()
+        commit_time = parts[1].decode().strip()
+        commit_msg = parts[2].decode("utf-8", errors="replace").strip()
+
+        files_changed = lines_added = lines_deleted = 0
+        for line in parts[3].splitlines():
+            fields = line.split(b"\t", 2)
+            if len(fields) != 3:
+                continue
+            files_changed += 1
+            # Binary files report "-" instead of line counts
+            if fields[0].isdigit():
+                lines_added += int(fields[0])
+            if fields[1].isdigit():
+                lines_deleted += int(fields[1])
+
+        yield (
+            commit_hash,
+            commit_time,
+            commit_msg,
+            files_changed,
+            lines_added,
+            lines_deleted,
+        )
+
+
+def _connect_with_schema(
+    storage_path: Optional[Path] = None,
+) -> Tuple[sqlite3.Connection, str]:
+    """Open a connection, creating the code_sessions schema on first use.
+
+    Args:
+        storage_path: Optional custom storage directory
+
+    Returns:
+        SQLite connection with the code_sessions table available, and the
+        code_sessions INSERT matching its schema
+    """
+    storage_key = str(get_db_path(storage_path))
+    insert_sql = _SCHEMA_READY.get(storage_key)
+    if insert_sql is None:
+        init_db(storage_path=storage_path)
+        conn = get_connection(storage_path=storage_path)
+        _ensure_schema(conn)
+        insert_sql = _SCHEMA_READY[storage_key] = code_session_insert_sql(conn)
+        return conn, insert_sql
+    return get_connection(storage_path=storage_path), insert_sql
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create the code_sessions table and its indexes in one transaction."""
+    conn.executescript(
+        f"""
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS code_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        commit_hash TEXT UNIQUE NOT NULL,
+        commit_time TEXT NOT NULL,
+        commit_msg TEXT,
+        files_changed INTEGER,
+        lines_added INTEGER,
+        lines_deleted INTEGER,
+        recorded_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        {CODE_SESSIONS_DATE_COLUMN}
+    );
+    CREATE INDEX IF NOT EXISTS idx_code_sessions_date_time
+        ON code_sessions(date, commit_time);
+    COMMIT;
+    """
+    )
+
 
 def get_today_commits(storage_path: Optional[Path] = None) -> list[Dict[str, Any]]:
     """Get all commits recorded today.
@@ -1,17 +1,43 @@
 """Exercise generation using Gemini AI with local caching."""
 
+import functools
+import hashlib
 import json
 import os
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
 from google import genai
 from src.lms.ai_config import get_gemini_model
+from src.lms.json_utils import json_loads
+
+# Strip an optional ```json ... ``` fence in a single pass over the bytes
+_FENCE_RE = re.compile(rb"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.S)
 
 
 class ExerciseGenerator:
     """Generate DevOps exercises using Gemini AI."""
 
+    # Progressive difficulty mapping
+    _DIFF_LEVELS = {
+        "Débutant": ("Débutant", "Débutant+", "Intermédiaire"),
+        "Intermédiaire": ("Intermédiaire", "Intermédiaire+", "Avancé"),
+        "Avancé": ("Avancé", "Avancé+", "Expert"),
+    }
+
+    # Contextes variés pour éviter le par cœur
+    _CONTEXTS = (
+        "en production avec haute disponibilité",
+        "dans un environnement de staging avec contraintes de sécurité",
+        "pour une startup avec budget limité",
+        "dans une infrastructure multi-cloud (AWS + Azure)",
+        "avec monitoring et alerting intégrés",
+        "en respectant les bonnes pratiques DevSecOps",
+        "avec intégration CI/CD complète",
+        "dans un cluster Kubernetes existant",
+    )
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Gemini AI client.
 
@@ -23,6 +49,7 @@ class ExerciseGenerator:
             raise ValueError("GEMINI_API_KEY environment variable not set")
 
         self.client = genai.Client(api_key=self.api_key)
+        self._memory_cache: Dict[str, Dict[str, str]] = {}
         # Using gemini-2.5-flash: best balance of speed, quality, and cost
         # - 1M token context for understanding complex DevOps topics
         # - Hybrid reasoning for structured educational content
@@ -35,15 +62,20 @@ class ExerciseGenerator:
         difficulty: str = "Débutant",
         duration: str = "15min",
         completion_count: int = 0,
+        cache_dir: Optional[Path] = None,
     ) -> Dict[str, str]:
         """Generate a complete DevOps exercise with instructions.
 
+        Identical prompts are served from memory, then from ``cache_dir``
+        (keyed by prompt hash), before Gemini is called.
+
         Args:
             topic: Exercise topic (e.g., "Docker Basics", "Kubernetes Pods")
             difficulty: Difficulty level (Débutant, Intermédiaire, Avancé)
             duration: Expected duration (e.g., "15min", "30min")
             completion_count: Number of times this exercise was completed
                 (for progressive difficulty)
+            cache_dir: Optional directory for persisting generated exercises
 
         Returns:
             Dict with exercise content (instructions, objectives, validation, hints, solution)
@@ -51,6 +83,14 @@ class ExerciseGenerator:
         prompt = self._build_exercise_prompt(
             topic, difficulty, duration, completion_count
         )
+        cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+        cached = self._memory_cache.get(cache_key)
+        if cached is None and cache_dir is not None:
+            cached = self.load_cached_exercise(cache_key, cache_dir)
+        if cached is not None:
+            self._memory_cache[cache_key] = cached
+            return cached
 
         try:
             response = self.client.models.generate_content(
@@ -61,43 +101,31 @@ class ExerciseGenerator:
 
             # Parse the response into structured format
             exercise_content = self._parse_exercise_response(response.text)
-            return exercise_content
 
         except Exception as e:
             raise ValueError(f"Exercise generation failed: {e}") from e
 
+        self._memory_cache[cache_key] = exercise_content
+        if cache_dir is not None:
+            self.cache_exercise(cache_key, exercise_content, cache_dir)
+        return exercise_content
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _build_exercise_prompt(
-        self, topic: str, difficulty: str, duration: str, completion_count: int = 0
+        topic: str, difficulty: str, duration: str, completion_count: int = 0
     ) -> str:
         """Build the complete prompt for exercise generation.
 
-        Full context is reprocessed each time, but response is cached locally
-        in JSON. Before reaching 1M tokens, we'll have time to optimize.
+        Prompts are memoized on their (hashable) inputs; generated exercises
+        are cached by prompt hash in generate_exercise().
         """
-        # Progressive difficulty mapping
-        difficulty_levels = {
-            "Débutant": ["Débutant", "Débutant+", "Intermédiaire"],
-            "Intermédiaire": ["Intermédiaire", "Intermédiaire+", "Avancé"],
-            "Avancé": ["Avancé", "Avancé+", "Expert"],
-        }
-
         # Augmenter la difficulté tous les 2 succès
         level_index = min(completion_count // 2, 2)
-        adjusted_difficulty = difficulty_levels.get(difficulty, [difficulty])[
-            level_index
-        ]
-
-        # Contextes variés pour éviter le par cœur
-        contexts = [
-            "en production avec haute disponibilité",
-            "dans un environnement de staging avec contraintes de sécurité",
-            "pour une startup avec budget limité",
-            "dans une infrastructure multi-cloud (AWS + Azure)",
-            "avec monitoring et alerting intégrés",
-            "en respectant les bonnes pratiques DevSecOps",
-            "avec intégration CI/CD complète",
-            "dans un cluster Kubernetes existant",
-        ]
+        levels = ExerciseGenerator._DIFF_LEVELS.get(difficulty)
+        adjusted_difficulty = levels[level_index] if levels else difficulty
+
+        contexts = ExerciseGenerator._CONTEXTS
         context_variation = (
             contexts[completion_count % len(contexts)]
             if completion_count > 0
@@ -172,18 +200,11 @@ Réponds UNIQUEMENT avec le JSON, sans markdown ni texte additionnel."""
             Structured exercise dictionary
         """
         # Remove markdown code blocks if present
-        cleaned = response_text.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-
-        cleaned = cleaned.strip()
+        raw = response_text.encode("utf-8")
+        match = _FENCE_RE.match(raw)
 
         try:
-            exercise = json.loads(cleaned)
+            exercise = json_loads(match.group(1) if match else raw)
             # Validate required fields
             required_fields = [
                 "title",
@@ -253,8 +274,7 @@ Réponds UNIQUEMENT avec le JSON, sans markdown ni texte additionnel."""
 
         if cache_file.exists():
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return json_loads(cache_file.read_bytes())
             except (json.JSONDecodeError, IOError):
                 return None
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,10 @@ from rich.console import Console
 
 console = Console()
 
+# Concurrent repository creations; keeps bulk publishing well inside
+# GitHub's secondary rate limits for content-creating requests.
+MAX_CONCURRENT_REQUESTS = 5
+
 
 class GitHubAutomation:
     """Handle GitHub repository creation and git operations."""
@@ -177,6 +182,29 @@ class GitHubAutomation:
             console.print(f"[red]Error creating repository: {e}[/red]")
             return None
 
+    def create_remote_repositories(
+        self,
+        specs: list[dict],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[Optional[dict]]:
+        """Create several GitHub repositories concurrently.
+
+        Args:
+            specs: Keyword arguments for create_remote_repository(), one
+                dict per repository (``repo_name`` is required).
+            max_workers: Maximum number of requests in flight.
+
+        Returns:
+            Repository info (or None on failure) for each spec, in order.
+        """
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            return list(
+                executor.map(lambda spec: self.create_remote_repository(**spec), specs)
+            )
+
     def push_to_github(
         self,
         project_path: str | Path,
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 from pathlib import Path
 import json
+import os
 from enum import Enum
 
 from rich.console import Console
 
+from src.lms.json_utils import dump_json_bytes, json_loads
+
 console = Console()
 
 
@@ -21,10 +26,86 @@ class LearnerLevel(str, Enum):
     SENIOR = "senior"
 
 
+# Direct value -> member map; avoids the Enum call machinery on load
+_LEVEL_BY_VALUE = {level.value: level for level in LearnerLevel}
+
+# Inclusive upper score bounds for junior/intermediate; above is senior
+_LEVEL_BOUNDS = (40, 75)
+_LEVELS = (LearnerLevel.JUNIOR, LearnerLevel.INTERMEDIATE, LearnerLevel.SENIOR)
+
+
+# Common DevOps skills every learner is expected to cover
+_EXPECTED_SKILLS = frozenset(
+    {
+        "Python",
+        "Bash",
+        "Docker",
+        "Kubernetes",
+        "Terraform",
+        "CI/CD",
+        "Monitoring",
+        "Git",
+    }
+)
+
+
+# (progression_level, star_count) indexed by completed missions in a role;
+# the last entry applies to every count beyond it
+_ROLE_PROGRESSION = (
+    ("Beginner", 0),
+    ("Junior", 2),
+    ("Junior", 3),
+    ("Intermediate", 3),
+    ("Intermediate", 4),
+    ("Senior", 4),
+    ("Senior", 5),
+)
+
+
+# Scoring arithmetic works on plain numbers; the dict lookups happen once in
+# the LearnerProfiler._calculate_*_score wrappers.
+
+
+def _reinforce_score(completed: int, total: int, accuracy: int) -> int:
+    """Score REINFORCE progress: 60% completion rate, 40% accuracy."""
+    completion_rate = min(100, (completed / total * 100)) if total > 0 else 0
+    return min(100, int((completion_rate * 0.6) + (accuracy * 0.4)))
+
+
+def _anki_score(retention: int, deck_count: int) -> int:
+    """Score Anki retention, with a small bonus for deck breadth."""
+    deck_bonus = min(20, deck_count * 2)
+    return min(100, int(retention + (deck_bonus * 0.2)))
+
+
+def _github_score(commits_per_week: int, repos: int, stars: int) -> int:
+    """Score GitHub activity from normalized commit, repo and star counts."""
+    commit_score = min(50, commits_per_week * 5)
+    repo_score = min(30, repos * 3)
+    star_score = min(20, stars * 2)
+    return min(100, int(commit_score + repo_score + star_score) // 10)
+
+
+def _overall_score(reinforce: int, anki: int, github: int, self_score: int) -> int:
+    """Weighted average (reinforce=35%, anki=25%, github=20%, self=20%)."""
+    return int(
+        (reinforce * 0.35) + (anki * 0.25) + (github * 0.20) + (self_score * 0.20)
+    )
+
+
 @dataclass
 class SkillAssessment:
     """Assessment of a specific skill."""
 
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "skill_name",
+        "score",
+        "hours_practice",
+        "last_used_date",
+        "confidence",
+    )
+
     skill_name: str
     score: int  # 0-100
     hours_practice: int
@@ -33,7 +114,13 @@ class SkillAssessment:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "skill_name": self.skill_name,
+            "score": self.score,
+            "hours_practice": self.hours_practice,
+            "last_used_date": self.last_used_date,
+            "confidence": self.confidence,
+        }
 
 
 @dataclass
@@ -49,6 +136,15 @@ class LearnerProfile:
     missions_by_role: dict[str, list[str]]  # role -> [mission_ids]
     last_evaluation_date: Optional[str]
 
+    @cached_property
+    def skills_by_name(self) -> dict[str, SkillAssessment]:
+        """Index of skills by name, built once per profile.
+
+        The index is not refreshed if ``skills`` is modified afterwards;
+        treat profiles as immutable once evaluated or loaded.
+        """
+        return {s.skill_name: s for s in self.skills}
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -66,13 +162,6 @@ class LearnerProfile:
 class LearnerProfiler:
     """Analyzes learner progression and determines readiness for missions."""
 
-    # Scoring thresholds
-    LEVEL_THRESHOLDS = {
-        "junior": (0, 40),
-        "intermediate": (41, 75),
-        "senior": (76, 100),
-    }
-
     def __init__(self, storage_path: Optional[Path] = None):
         """Initialize profiler.
 
@@ -110,12 +199,8 @@ class LearnerProfiler:
         github_score = self._calculate_github_score(github_activity)
         self_score = self_assessment.get("score", 50) if self_assessment else 50
 
-        # Weighted average (reinforce=35%, anki=25%, github=20%, self=20%)
-        overall_score = int(
-            (reinforce_score * 0.35)
-            + (anki_score * 0.25)
-            + (github_score * 0.20)
-            + (self_score * 0.20)
+        overall_score = _overall_score(
+            reinforce_score, anki_score, github_score, self_score
         )
 
         # Determine level
@@ -141,61 +226,57 @@ class LearnerProfiler:
 
         return profile
 
+    def evaluate_cohort(self, batch: list[dict]) -> list[LearnerProfile]:
+        """Evaluate many learners at once (e.g. for cohort reports).
+
+        Args:
+            batch: One dict per learner with ``reinforce_stats``,
+                ``anki_stats``, ``github_activity`` and optional
+                ``self_assessment`` keys
+
+        Returns:
+            LearnerProfiles in the same order as ``batch``
+        """
+        evaluate = self.evaluate_learner_level
+        return [
+            evaluate(
+                entry.get("reinforce_stats") or {},
+                entry.get("anki_stats") or {},
+                entry.get("github_activity") or {},
+                entry.get("self_assessment"),
+            )
+            for entry in batch
+        ]
+
     def _calculate_reinforce_score(self, stats: dict) -> int:
         """Calculate score from REINFORCE statistics."""
         if not stats:
             return 50
-
-        completed = stats.get("completed_exercises", 0)
-        total = stats.get("total_exercises", 1)
-        completion_rate = min(100, (completed / total * 100)) if total > 0 else 0
-
-        accuracy = stats.get("average_accuracy", 50)
-
-        # 60% completion, 40% accuracy
-        score = int((completion_rate * 0.6) + (accuracy * 0.4))
-        return min(100, score)
+        return _reinforce_score(
+            stats.get("completed_exercises", 0),
+            stats.get("total_exercises", 1),
+            stats.get("average_accuracy", 50),
+        )
 
     def _calculate_anki_score(self, stats: dict) -> int:
         """Calculate score from Anki statistics."""
         if not stats:
             return 50
-
-        # Use retention rate as primary metric
-        retention = stats.get("retention_rate", 50)
-        deck_count = stats.get("decks", 0)
-
-        # Bonus for multiple decks (shows breadth)
-        deck_bonus = min(20, deck_count * 2)
-
-        score = int(retention + (deck_bonus * 0.2))
-        return min(100, score)
+        return _anki_score(stats.get("retention_rate", 50), stats.get("decks", 0))
 
     def _calculate_github_score(self, stats: dict) -> int:
         """Calculate score from GitHub activity."""
         if not stats:
             return 50
-
-        commits_per_week = stats.get("commits_per_week", 0)
-        repos_contributed = stats.get("repos_contributed", 0)
-        stars_received = stats.get("stars_received", 0)
-
-        # Normalize metrics
-        commit_score = min(50, commits_per_week * 5)
-        repo_score = min(30, repos_contributed * 3)
-        star_score = min(20, stars_received * 2)
-
-        score = int(commit_score + repo_score + star_score) // 10
-        return min(100, score)
+        return _github_score(
+            stats.get("commits_per_week", 0),
+            stats.get("repos_contributed", 0),
+            stats.get("stars_received", 0),
+        )
 
     def _score_to_level(self, score: int) -> LearnerLevel:
         """Convert numeric score to proficiency level."""
-        if score <= 40:
-            return LearnerLevel.JUNIOR
-        elif score <= 75:
-            return LearnerLevel.INTERMEDIATE
-        else:
-            return LearnerLevel.SENIOR
+        return _LEVELS[bisect_left(_LEVEL_BOUNDS, score)]
 
     def _extract_skills(
         self, reinforce_stats: dict, anki_stats: dict, github_stats: dict
@@ -244,31 +325,20 @@ class LearnerProfiler:
     def _identify_gaps(
         self, reinforce_stats: dict, skills: list[SkillAssessment]
     ) -> list[str]:
-        """Identify skill gaps for learning recommendations."""
-        gaps = []
-
-        # Common DevOps skills to check
-        expected_skills = {
-            "Python",
-            "Bash",
-            "Docker",
-            "Kubernetes",
-            "Terraform",
-            "CI/CD",
-            "Monitoring",
-            "Git",
-        }
-
-        existing_skills = {s.skill_name for s in skills}
-        missing = expected_skills - existing_skills
+        """Identify skill gaps for learning recommendations.
 
-        # Identify weak skills (score < 60)
-        weak_skills = {s.skill_name for s in skills if s.score < 60}
-
-        gaps.extend(list(missing)[:3])  # Top 3 missing
-        gaps.extend(list(weak_skills)[:2])  # Top 2 weak
+        Returns up to 3 missing expected skills (alphabetical) followed by up
+        to 2 weak skills (score < 60) in profile order, so the output is stable.
+        """
+        existing: set[str] = set()
+        weak: list[str] = []
+        for skill in skills:
+            existing.add(skill.skill_name)
+            if skill.score < 60:
+                weak.append(skill.skill_name)
 
-        return gaps
+        missing = sorted(_EXPECTED_SKILLS - existing)[:3]
+        return missing + weak[:2]
 
     def save_profile(self, profile: LearnerProfile) -> bool:
         """Save learner profile to disk.
@@ -280,14 +350,66 @@ class LearnerProfiler:
             True if successful, False otherwise
         """
         try:
-            filepath = self.storage_path / f"{profile.username}.json"
-            with open(filepath, "w") as f:
-                json.dump(profile.to_dict(), f, indent=2)
-            return True
+            self._write_profile(profile)
         except (IOError, OSError) as e:
             console.print(f"[red]Error saving profile: {e}[/red]")
             return False
 
+        self._fsync_storage_dir()
+        return True
+
+    def save_profiles(self, profiles: list[LearnerProfile]) -> bool:
+        """Save several learner profiles, syncing the directory once.
+
+        Args:
+            profiles: LearnerProfiles to save
+
+        Returns:
+            True if every profile was saved, False otherwise
+        """
+        try:
+            for profile in profiles:
+                self._write_profile(profile)
+        except (IOError, OSError) as e:
+            console.print(f"[red]Error saving profiles: {e}[/red]")
+            return False
+
+        self._fsync_storage_dir()
+        return True
+
+    def _write_profile(self, profile: LearnerProfile) -> Path:
+        """Atomically replace a profile file via a temporary sibling.
+
+        The temporary file is flushed to disk before the rename, so a crash
+        leaves either the old or the new profile, never a torn one.
+        """
+        filepath = self.storage_path / f"{profile.username}.json"
+        tmp_path = filepath.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(dump_json_bytes(profile.to_dict(), indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return filepath
+
+    def _fsync_storage_dir(self) -> None:
+        """Flush directory entries so renamed profiles survive a crash."""
+        try:
+            dir_fd = os.open(self.storage_path, os.O_RDONLY)
+        except OSError:
+            # Directories cannot be opened this way on every platform
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
     def load_profile(self, username: str) -> Optional[LearnerProfile]:
         """Load learner profile from disk.
 
@@ -302,34 +424,20 @@ class LearnerProfiler:
             if not filepath.exists():
                 return None
 
-            with open(filepath, "r") as f:
-                data = json.load(f)
-
-            # Reconstruct profile
-            skills = [
-                SkillAssessment(
-                    skill_name=s["skill_name"],
-                    score=s["score"],
-                    hours_practice=s["hours_practice"],
-                    last_used_date=s["last_used_date"],
-                    confidence=s["confidence"],
-                )
-                for s in data["skills"]
-            ]
+            data = json_loads(filepath.read_bytes())
 
+            # Reconstruct profile (stored keys match the field names)
+            skills = [SkillAssessment(**s) for s in data["skills"]]
             profile = LearnerProfile(
-                username=data["username"],
-                current_level=LearnerLevel(data["current_level"]),
-                overall_score=data["overall_score"],
-                completed_missions=data["completed_missions"],
-                skills=skills,
-                learning_gaps=data["learning_gaps"],
-                missions_by_role=data["missions_by_role"],
-                last_evaluation_date=data["last_evaluation_date"],
+                **{
+                    **data,
+                    "current_level": _LEVEL_BY_VALUE[data["current_level"]],
+                    "skills": skills,
+                }
             )
 
             return profile
-        except (IOError, OSError, json.JSONDecodeError, KeyError) as e:
+        except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError) as e:
             console.print(f"[red]Error loading profile: {e}[/red]")
             return None
 
@@ -349,19 +457,19 @@ class LearnerProfiler:
         Returns:
             (is_ready, missing_or_weak_skills)
         """
+        skills_by_name = profile.skills_by_name
         issues = []
-        existing_skills = {s.skill_name: s.score for s in profile.skills}
 
         for skill in mission_required_skills:
-            if skill not in existing_skills:
-                issues.append(f"Missing: {skill}")
-            elif existing_skills[skill] < threshold:
+            assessment = skills_by_name.get(skill)
+            if assessment is None:
+                issues.append("Missing: " + skill)
+            elif assessment.score < threshold:
                 issues.append(
-                    f"Weak: {skill} ({existing_skills[skill]}/100) - need {threshold}+"
+                    f"Weak: {skill} ({assessment.score}/100) - need {threshold}+"
                 )
 
-        is_ready = len(issues) == 0
-        return is_ready, issues
+        return not issues, issues
 
     def get_role_progression(
         self, profile: LearnerProfile, role: str
@@ -372,20 +480,5 @@ class LearnerProfiler:
             (progression_level, star_count)
             Examples: ("Junior", 2), ("Intermediate", 4), ("Senior", 5)
         """
-        missions_count = len(profile.missions_by_role.get(role, []))
-
-        # Progression logic
-        if missions_count == 0:
-            return ("Beginner", 0)
-        elif missions_count == 1:
-            return ("Junior", 2)
-        elif missions_count == 2:
-            return ("Junior", 3)
-        elif missions_count == 3:
-            return ("Intermediate", 3)
-        elif missions_count == 4:
-            return ("Intermediate", 4)
-        elif missions_count == 5:
-            return ("Senior", 4)
-        else:
-            return ("Senior", 5)
+        missions_count = len(profile.missions_by_role.get(role, ()))
+        return _ROLE_PROGRESSION[min(missions_count, len(_ROLE_PROGRESSION) - 1)]
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
 from typing import Optional
@@ -12,21 +17,126 @@ from rich.console import Console
 
 console = Console()
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Inclusive upper score bounds for each level / star rating
+_LEVEL_BOUNDS = (40, 75)
+_LEVEL_NAMES = ("junior", "intermediate", "senior")
+_STAR_BOUNDS = (20, 40, 60, 80)
+
+# Files counted as project configuration in code stats
+_CONFIG_FILES = frozenset(
+    {"docker-compose.yml", "Dockerfile", "pyproject.toml", "package.json"}
+)
+
+# Dependency, VCS and build directories are never part of the submission
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        "target",
+    }
+)
+
+# Only source-like files are line-counted; binaries and blobs are skipped
+_CODE_SUFFIXES = frozenset(
+    {".py", ".ts", ".js", ".yml", ".yaml", ".md", ".sh", ".go", ".rs", ".tf"}
+)
+_CODE_FILENAMES = frozenset({"Dockerfile", "Makefile"})
+_MAX_LINE_COUNT_BYTES = 5 * 1024 * 1024
+_READ_CHUNK_BYTES = 1 << 20
+
+# Line counting is I/O bound; large projects read files on a thread pool.
+# Below the threshold, pool startup costs more than it saves.
+_PARALLEL_COUNT_THRESHOLD = 200
+_COUNT_WORKERS = 8
+
+# Built prompts kept per evaluator, keyed by evaluation fingerprint
+_PROMPT_CACHE_SIZE = 64
+
+# Feedback used by the fallback evaluation; such results are never cached
+_PARSE_FAILED_FEEDBACK = "Evaluation parsing failed"
+
+
+# Evaluation prompt template, filled by _build_evaluation_prompt
+_EVALUATION_PROMPT = """
+You are a senior DevOps architect evaluating a junior engineer's project submission.
+
+MISSION BRIEF:
+- Project Name: {project_name}
+- Description: {project_description}
+- Required Tech: {tech_stack}
+- MVP Features: {mvp_features}
+- Success Criteria: {success_criteria}
+
+SUBMITTED PROJECT:
+- Has README: {has_readme}
+- Has Dockerfile: {has_dockerfile}
+- Has CI/CD: {has_ci_cd}
+- Has Tests: {has_tests}
+- Has Git: {has_git}
+- Total Lines of Code: {total_lines}
+- Test Files: {test_files}
+- Config Files: {config_files}
+
+LEARNER LEVEL: {learner_level}
+
+EVALUATION CRITERIA (100 points total):
+1. Completeness (20 pts): All MVP features implemented?
+2. Code Quality (25 pts): Structure, naming, documentation?
+3. Testing (20 pts): Tests present and meaningful (>80% coverage)?
+4. DevOps Practices (20 pts): CI/CD, Docker, IaC, monitoring?
+5. Documentation (15 pts): README, comments, architecture docs?
+
+RESPONSE FORMAT:
+Return ONLY a JSON object (no markdown, no explanation):
+{{
+    "overall_score": 85,
+    "level_achieved": "intermediate",
+    "stars": 4,
+    "scores": {{
+        "completeness": 18,
+        "code_quality": 20,
+        "testing": 17,
+        "devops_practices": 18,
+        "documentation": 12
+    }},
+    "strengths": ["...", "..."],
+    "improvements": ["...", "..."],
+    "feedback": "...",
+    "next_steps": ["...", "..."]
+}}
+"""
+
 
 class MissionEvaluator:
     """Evaluate completed DevOps projects using Gemini AI."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[Path] = None):
         """Initialize Gemini AI client.
 
         Args:
             api_key: Google API key. Defaults to GEMINI_API_KEY env var
+            cache_dir: Directory for cached evaluations.
+                Defaults to ~/.skillops/eval_cache/
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
 
         self.client = genai.Client(api_key=self.api_key)
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else Path.home() / ".skillops" / "eval_cache"
+        )
+        self._prompt_cache: OrderedDict[str, str] = OrderedDict()
         # Using gemini-2.5-flash: best balance of speed, quality, and cost
         # - 1M token context for detailed code/project evaluation
         # - Hybrid reasoning for constructive feedback generation
@@ -37,13 +147,20 @@ class MissionEvaluator:
         project_path: str,
         mission_spec: dict,
         learner_level: str,
+        force_refresh: bool = False,
     ) -> dict:
         """Evaluate a completed project against mission requirements.
 
+        Evaluations are cached on disk by a fingerprint of the mission, the
+        learner level and the collected project info, so re-evaluating an
+        unchanged project does not call Gemini again. Missing projects and
+        projects without any files are scored locally without an API call.
+
         Args:
             project_path: Path to project directory
             mission_spec: Original mission specification
             learner_level: Learner's current level
+            force_refresh: Ignore any cached evaluation
 
         Returns:
             Evaluation result dict with score and feedback
@@ -51,9 +168,21 @@ class MissionEvaluator:
         # Collect project information
         project_info = self._collect_project_info(project_path)
 
+        # Only a submission with no files at all is scored locally; code in
+        # languages outside _CODE_SUFFIXES still goes to Gemini
+        if "error" in project_info or not project_info["files"]:
+            return self._empty_project_evaluation(project_info)
+
+        fingerprint = self._fingerprint(mission_spec, learner_level, project_info)
+        cache_file = self.cache_dir / f"{fingerprint}.json"
+        if not force_refresh:
+            cached = self._load_cached_evaluation(cache_file)
+            if cached is not None:
+                return cached
+
         # Build evaluation prompt
-        prompt = self._build_evaluation_prompt(
-            mission_spec, project_info, learner_level
+        prompt = self._get_evaluation_prompt(
+            fingerprint, mission_spec, project_info, learner_level
         )
 
         # Call Gemini for evaluation
@@ -67,16 +196,62 @@ class MissionEvaluator:
         # Parse evaluation response
         evaluation = self._parse_evaluation_response(response.text)
 
+        if evaluation.get("feedback") != _PARSE_FAILED_FEEDBACK:
+            self._save_cached_evaluation(cache_file, evaluation)
+
         return evaluation
 
+    @staticmethod
+    def _empty_project_evaluation(project_info: dict) -> dict:
+        """Evaluation for submissions with nothing to review."""
+        return {
+            "overall_score": 0,
+            "level_achieved": "junior",
+            "stars": 1,
+            "scores": {},
+            "strengths": [],
+            "improvements": ["Submit a project containing code"],
+            "feedback": project_info.get("error", "Empty project"),
+            "next_steps": ["Resubmit"],
+        }
+
+    @staticmethod
+    def _fingerprint(mission_spec: dict, learner_level: str, project_info: dict) -> str:
+        """Hash evaluation inputs into a stable cache key."""
+        payload = json.dumps(
+            {"spec": mission_spec, "level": learner_level, "info": project_info},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _load_cached_evaluation(cache_file: Path) -> Optional[dict]:
+        """Return a cached evaluation, or None if missing or unreadable."""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _save_cached_evaluation(cache_file: Path, evaluation: dict) -> None:
+        """Persist an evaluation; caching failures are not fatal."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(evaluation, f, indent=2)
+        except OSError:
+            pass
+
     def _collect_project_info(self, project_path: str) -> dict:
         """Collect information about project structure and quality."""
-        from pathlib import Path
-
         project = Path(project_path)
         if not project.exists():
             return {"error": f"Project path not found: {project_path}"}
 
+        files, code_stats, snapshot = self._walk(project)
+
         info = {
             "path": str(project),
             "has_readme": (project / "README.md").exists(),
@@ -84,115 +259,190 @@ class MissionEvaluator:
             "has_ci_cd": (project / ".github" / "workflows").exists(),
             "has_tests": (project / "tests").exists(),
             "has_git": (project / ".git").exists(),
-            "files": self._analyze_file_structure(project),
-            "code_stats": self._analyze_code_stats(project),
+            "files": files,
+            "code_stats": code_stats,
+            # Digest of every file's path, size and mtime, so edits that
+            # leave the counts unchanged still invalidate cached evaluations
+            "snapshot": snapshot,
         }
 
         return info
 
-    def _analyze_file_structure(self, project_path: Path) -> dict:
-        """Analyze project file structure."""
-        file_types: dict[str, int] = {}
-        for file in project_path.rglob("*"):
-            if file.is_file() and not str(file).startswith("."):
-                ext = file.suffix or "no_extension"
-                file_types[ext] = file_types.get(ext, 0) + 1
+    def _walk(self, root: Path) -> tuple[dict, dict, str]:
+        """Walk the project once, collecting file types and code stats.
 
-        return file_types
+        Uses ``os.scandir`` so file/dir checks come from the cached
+        directory entry type instead of a stat call per path. Hidden,
+        dependency and build directories (see _SKIP_DIRS) are pruned.
+        Symlinks are never followed and each directory is entered at most
+        once (keyed on device and inode), so the walk is bounded even for
+        submissions containing link or bind-mount cycles. Code files are
+        line-counted after the walk, on a thread pool when there are more
+        than _PARALLEL_COUNT_THRESHOLD of them.
 
-    def _analyze_code_stats(self, project_path: Path) -> dict:
-        """Basic code statistics."""
-        total_lines = 0
+        Returns:
+            Tuple of (file type counts by extension, code statistics,
+            digest of each file's relative path, size and mtime)
+        """
+        file_types: dict[str, int] = {}
+        signatures: list[tuple[str, int, int]] = []
+        root_prefix = len(str(root)) + 1
+        code_entries: list[os.DirEntry] = []
         test_files = 0
         config_files = 0
 
-        for file in project_path.rglob("*"):
-            if file.is_file():
-                if "test" in file.name:
-                    test_files += 1
-                if file.name in [
-                    "docker-compose.yml",
-                    "Dockerfile",
-                    "pyproject.toml",
-                    "package.json",
-                ]:
-                    config_files += 1
-                try:
-                    with open(file, "r", encoding="utf-8", errors="ignore") as f:
-                        total_lines += len(f.readlines())
-                except OSError:
-                    pass
+        stack = [str(root)]
+        try:
+            root_stat = os.stat(root)
+            visited = {(root_stat.st_dev, root_stat.st_ino)}
+        except OSError:
+            visited = set()
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name in _SKIP_DIRS or name.startswith("."):
+                            continue
+                        try:
+                            st_dev = entry.stat(follow_symlinks=False).st_dev
+                        except OSError:
+                            continue
+                        key = (st_dev, entry.inode())
+                        if key not in visited:
+                            visited.add(key)
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    signatures.append(
+                        (entry.path[root_prefix:], st.st_size, st.st_mtime_ns)
+                    )
+                    name = entry.name
+                    suffix = os.path.splitext(name)[1]
+                    ext = suffix or "no_extension"
+                    file_types[ext] = file_types.get(ext, 0) + 1
+
+                    if "test" in name:
+                        test_files += 1
+                    if name in _CONFIG_FILES:
+                        config_files += 1
+                    if suffix in _CODE_SUFFIXES or name in _CODE_FILENAMES:
+                        code_entries.append(entry)
+
+        if len(code_entries) > _PARALLEL_COUNT_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=_COUNT_WORKERS) as pool:
+                total_lines = sum(pool.map(self._count_lines, code_entries))
+        else:
+            total_lines = sum(map(self._count_lines, code_entries))
+
+        snapshot = hashlib.blake2b(
+            json.dumps(sorted(signatures)).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return (
+            file_types,
+            {
+                "total_lines": total_lines,
+                "test_files": test_files,
+                "config_files": config_files,
+            },
+            snapshot,
+        )
 
-        return {
-            "total_lines": total_lines,
-            "test_files": test_files,
-            "config_files": config_files,
-        }
+    @staticmethod
+    def _count_lines(entry: os.DirEntry) -> int:
+        """Count lines by scanning raw bytes for newlines, without decoding."""
+        try:
+            if entry.stat().st_size > _MAX_LINE_COUNT_BYTES:
+                return 0
+            lines = 0
+            last = b""
+            with open(entry.path, "rb") as f:
+                while chunk := f.read(_READ_CHUNK_BYTES):
+                    lines += chunk.count(b"\n")
+                    last = chunk
+            # A final line without a trailing newline still counts
+            if last and not last.endswith(b"\n"):
+                lines += 1
+            return lines
+        except OSError:
+            return 0
 
-    def _build_evaluation_prompt(
-        self, mission_spec: dict, project_info: dict, learner_level: str
-    ) -> str:
-        """Build evaluation prompt for Gemini."""
-        return f"""
-You are a senior DevOps architect evaluating a junior engineer's project submission.
+    def _analyze_file_structure(self, project_path: Path) -> dict:
+        """Analyze project file structure."""
+        return self._walk(project_path)[0]
 
-MISSION BRIEF:
-- Project Name: {mission_spec.get('project_name', 'Unknown')}
-- Description: {mission_spec.get('project_description', '')}
-- Required Tech: {', '.join(mission_spec.get('tech_stack', []))}
-- MVP Features: {', '.join(mission_spec.get('mvp_features', []))}
-- Success Criteria: {', '.join(mission_spec.get('success_criteria', []))}
+    def _analyze_code_stats(self, project_path: Path) -> dict:
+        """Basic code statistics."""
+        return self._walk(project_path)[1]
 
-SUBMITTED PROJECT:
-- Has README: {project_info.get('has_readme', False)}
-- Has Dockerfile: {project_info.get('has_dockerfile', False)}
-- Has CI/CD: {project_info.get('has_ci_cd', False)}
-- Has Tests: {project_info.get('has_tests', False)}
-- Has Git: {project_info.get('has_git', False)}
-- Total Lines of Code: {project_info.get('code_stats', {}).get('total_lines', 0)}
-- Test Files: {project_info.get('code_stats', {}).get('test_files', 0)}
-- Config Files: {project_info.get('code_stats', {}).get('config_files', 0)}
+    def _get_evaluation_prompt(
+        self,
+        fingerprint: str,
+        mission_spec: dict,
+        project_info: dict,
+        learner_level: str,
+    ) -> str:
+        """Return the evaluation prompt, reusing one built for the same inputs.
 
-LEARNER LEVEL: {learner_level.upper()}
+        The fingerprint already identifies (mission_spec, learner_level,
+        project_info), so it doubles as the key for a small LRU of prompts.
+        """
+        prompt = self._prompt_cache.get(fingerprint)
+        if prompt is not None:
+            self._prompt_cache.move_to_end(fingerprint)
+            return prompt
 
-EVALUATION CRITERIA (100 points total):
-1. Completeness (20 pts): All MVP features implemented?
-2. Code Quality (25 pts): Structure, naming, documentation?
-3. Testing (20 pts): Tests present and meaningful (>80% coverage)?
-4. DevOps Practices (20 pts): CI/CD, Docker, IaC, monitoring?
-5. Documentation (15 pts): README, comments, architecture docs?
+        prompt = self._build_evaluation_prompt(
+            mission_spec, project_info, learner_level
+        )
+        self._prompt_cache[fingerprint] = prompt
+        if len(self._prompt_cache) > _PROMPT_CACHE_SIZE:
+            self._prompt_cache.popitem(last=False)
+        return prompt
 
-RESPONSE FORMAT:
-Return ONLY a JSON object (no markdown, no explanation):
-{{
-    "overall_score": 85,
-    "level_achieved": "intermediate",
-    "stars": 4,
-    "scores": {{
-        "completeness": 18,
-        "code_quality": 20,
-        "testing": 17,
-        "devops_practices": 18,
-        "documentation": 12
-    }},
-    "strengths": ["...", "..."],
-    "improvements": ["...", "..."],
-    "feedback": "...",
-    "next_steps": ["...", "..."]
-}}
-"""
+    def _build_evaluation_prompt(
+        self, mission_spec: dict, project_info: dict, learner_level: str
+    ) -> str:
+        """Build evaluation prompt for Gemini."""
+        get = mission_spec.get
+        info = project_info.get
+        code_stats = info("code_stats") or {}
+        return _EVALUATION_PROMPT.format_map(
+            {
+                "project_name": get("project_name", "Unknown"),
+                "project_description": get("project_description", ""),
+                "tech_stack": ", ".join(get("tech_stack", [])),
+                "mvp_features": ", ".join(get("mvp_features", [])),
+                "success_criteria": ", ".join(get("success_criteria", [])),
+                "has_readme": info("has_readme", False),
+                "has_dockerfile": info("has_dockerfile", False),
+                "has_ci_cd": info("has_ci_cd", False),
+                "has_tests": info("has_tests", False),
+                "has_git": info("has_git", False),
+                "total_lines": code_stats.get("total_lines", 0),
+                "test_files": code_stats.get("test_files", 0),
+                "config_files": code_stats.get("config_files", 0),
+                "learner_level": learner_level.upper(),
+            }
+        )
 
     def _parse_evaluation_response(self, response_text: str) -> dict:
         """Parse Gemini evaluation response."""
         try:
-            json_str = response_text.strip()
-            if json_str.startswith("```"):
-                json_str = json_str.split("```")[1]
-                if json_str.startswith("json"):
-                    json_str = json_str[4:]
-            json_str = json_str.strip()
-
-            evaluation = json.loads(json_str)
+            # Decode the first JSON object in place; any ``` fence or prose
+            # around it is simply ignored
+            start = response_text.index("{")
+            evaluation, _ = _JSON_DECODER.raw_decode(response_text, start)
 
             # Ensure all required fields
             defaults = {
@@ -207,7 +457,7 @@ Return ONLY a JSON object (no markdown, no explanation):
             }
 
             return {**defaults, **evaluation}
-        except (json.JSONDecodeError, IndexError, ValueError) as e:
+        except ValueError as e:
             console.print(f"[red]Failed to parse evaluation: {e}[/red]")
             return {
                 "overall_score": 50,
@@ -216,30 +466,18 @@ Return ONLY a JSON object (no markdown, no explanation):
                 "scores": {},
                 "strengths": ["Project submitted"],
                 "improvements": ["Review evaluation prompt"],
-                "feedback": "Evaluation parsing failed",
+                "feedback": _PARSE_FAILED_FEEDBACK,
                 "next_steps": ["Resubmit"],
             }
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def calculate_level_from_score(score: int) -> str:
         """Convert numeric score to proficiency level."""
-        if score <= 40:
-            return "junior"
-        elif score <= 75:
-            return "intermediate"
-        else:
-            return "senior"
+        return _LEVEL_NAMES[bisect_left(_LEVEL_BOUNDS, score)]
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def calculate_stars(score: int) -> int:
         """Convert score to star rating (1-5)."""
-        if score <= 20:
-            return 1
-        elif score <= 40:
-            return 2
-        elif score <= 60:
-            return 3
-        elif score <= 80:
-            return 4
-        else:
-            return 5
+        return bisect_left(_STAR_BOUNDS, score) + 1
@@ -2,15 +2,125 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, MutableMapping, Optional
 import json
+import re
 
-from google import genai
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from rich.console import Console
 
 console = Console()
 
+# Payload of an optional ```json fence; anything after the closing fence is dropped
+_FENCE_RE = re.compile(r"\A\s*```(?:json)?\s*(.*?)\s*(?:```.*)?\Z", re.S)
+
+_MODEL = "gemini-2.5-flash"
+
+# Cached Gemini responses older than this are regenerated
+MISSION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Gemini requests in flight during batch generation (API rate limits)
+MAX_CONCURRENT_REQUESTS = 8
+
+_RESPONSE_FORMAT = """RESPONSE FORMAT:
+Return ONLY JSON (no markdown, no explanation):
+{"project_name": "...", "project_description": "...", "tech_stack": [],
+"scope": [], "learning_needs": [{"skill": "...", "priority": "high|medium|low"}],
+"mvp_features": [], "excellence_features": [], "success_criteria": [],
+"estimated_hours": 40}
+"""
+
+
+# Keys Gemini uses instead of "skill" for a learning need
+_SKILL_ALIASES = ("name", "technology", "topic")
+
+
+class LearningNeed(BaseModel):
+    """A skill the learner has to pick up for a mission."""
+
+    model_config = ConfigDict(extra="allow")
+
+    skill: str = ""
+    priority: str = "low"
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_skill_name(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return {"skill": value}
+        if isinstance(value, dict) and "skill" not in value:
+            # Gemini sometimes names the skill under another key
+            for key in _SKILL_ALIASES:
+                if isinstance(value.get(key), str):
+                    return {**value, "skill": value[key]}
+        return value
+
+
+class MissionPayload(BaseModel):
+    """Validated mission specification returned by Gemini."""
+
+    model_config = ConfigDict(extra="allow")
+
+    project_name: str
+    project_description: str = ""
+    tech_stack: list[Any] = Field(default_factory=list)
+    scope: list[Any] = Field(default_factory=list)
+    learning_needs: list[LearningNeed] = Field(default_factory=list)
+    mvp_features: list[Any] = Field(default_factory=list)
+    excellence_features: list[Any] = Field(default_factory=list)
+    success_criteria: list[Any] = Field(default_factory=list)
+
+    @field_validator(
+        "tech_stack",
+        "scope",
+        "learning_needs",
+        "mvp_features",
+        "excellence_features",
+        "success_criteria",
+        mode="before",
+    )
+    @classmethod
+    def split_comma_separated(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+
+# Static instructions shared by every request; only the CONTEXT block
+# built per request changes between calls
+AI_SUGGESTED_PREAMBLE = f"""
+You are an expert technical curriculum designer. Generate a complete DevOps mission brief
+for the learner described in CONTEXT.
+
+REQUIREMENTS:
+1. Project Name: Should be realistic and achievable
+2. Project Description: 2-3 sentences explaining the business need
+3. Tech Stack: Based on role, list 3-5 technologies to use
+4. Scope: Outline major features/components
+5. Learning Path:
+   - If learner missing skills: Suggest 2-3 skills to learn
+   - If learner has gaps: Recommend specific learning resources
+6. MVP Features: Core features that are achievable (60% of time)
+7. Excellence Features: Stretch goals for advanced learning
+8. Success Criteria: How to measure if project is successful
+9. Estimated Duration: Total hours to complete
+
+{_RESPONSE_FORMAT}"""
+
+PO_PREAMBLE = f"""
+You are an expert DevOps architect. Transform a user's idea into a technical mission.
+
+TASK:
+Transform the user's idea given in CONTEXT into a production-ready DevOps project.
+Recommend learning first.
+
+{_RESPONSE_FORMAT}"""
+
 
 class MissionGenerator:
     """Generate realistic DevOps mission briefs using Gemini AI."""
@@ -73,17 +183,38 @@ class MissionGenerator:
         },
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        cache: Optional[MutableMapping[str, str]] = None,
+        cache_ttl: float = MISSION_CACHE_TTL_SECONDS,
+    ):
         """Initialize Gemini AI client.
 
         Args:
             api_key: Google API key. Defaults to GEMINI_API_KEY env var
+            cache_dir: Directory for cached Gemini responses.
+                Defaults to ~/.skillops/mission_cache/
+            cache: In-memory response cache checked before cache_dir
+            cache_ttl: Seconds before an on-disk cached response expires
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
 
+        # Imported here: the Gemini SDK is slow to load and only needed once
+        # a generator is actually created
+        from google import genai
+
         self.client = genai.Client(api_key=self.api_key)
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir
+            else Path.home() / ".skillops" / "mission_cache"
+        )
+        self.cache: MutableMapping[str, str] = {} if cache is None else cache
+        self.cache_ttl = cache_ttl
         # Using gemini-2.5-flash: best balance of speed, quality, and cost
         # - 1M token context for understanding learner profiles
         # - Hybrid reasoning for adaptive mission generation
@@ -96,15 +227,24 @@ class MissionGenerator:
         learner_skills: list[str],
         mode: str = "ai_suggested",
         user_idea: Optional[str] = None,
+        force_refresh: bool = False,
+        on_chunk: Optional[Callable[[str], None]] = None,
     ) -> dict:
         """Generate a complete mission specification.
 
+        Gemini responses are cached by a hash of the request, so asking
+        for the same mission again does not call the API. Uncached
+        responses are streamed, so on_chunk can report progress while the
+        mission is being written.
+
         Args:
             role: Role to generate mission for (from ROLES.keys())
             learner_level: "junior", "intermediate", or "senior"
             learner_skills: List of skills learner already has
             mode: "ai_suggested" or "po_mode" (product owner idea)
             user_idea: If mode="po_mode", the user's project idea
+            force_refresh: Ignore any cached response
+            on_chunk: Called with each streamed piece of response text
 
         Returns:
             Mission specification dict
@@ -116,63 +256,156 @@ class MissionGenerator:
 
         role_info = self.ROLES[role]
 
-        # Build prompt based on mode
+        # Build the per-request context; the preamble is static per mode
         if mode == "po_mode" and user_idea:
-            prompt = self._build_po_prompt(
+            preamble = PO_PREAMBLE
+            context = self._build_po_prompt(
                 role, learner_level, learner_skills, user_idea
             )
         else:
-            prompt = self._build_ai_suggested_prompt(
+            preamble = AI_SUGGESTED_PREAMBLE
+            context = self._build_ai_suggested_prompt(
                 role, role_info, learner_level, learner_skills
             )
 
-        # Call Gemini
-        response = self.client.models.generate_content(
-            model="gemini-2.5-flash", contents=prompt
+        cache_key = self._cache_key(
+            role, learner_level, learner_skills, mode, user_idea
         )
+        response_text = None if force_refresh else self._get_cached(cache_key)
+
+        if response_text is None:
+            response_text = self._call_gemini(preamble, context, on_chunk)
 
-        if not response.text:
-            raise ValueError("Failed to generate mission from Gemini")
+            if not response_text:
+                raise ValueError("Failed to generate mission from Gemini")
+
+            try:
+                mission_spec = self._decode_mission(response_text)
+            except ValueError as e:
+                mission_spec = self._default_mission(response_text, e)
+            else:
+                self._put_cached(cache_key, response_text)
+        else:
+            mission_spec = self._parse_mission_response(response_text)
 
-        # Parse response
-        mission_spec = self._parse_mission_response(response.text)
         mission_spec["role"] = role
         mission_spec["mode"] = mode
         mission_spec["learner_level"] = learner_level
 
         return mission_spec
 
+    def generate_missions_batch(
+        self,
+        specs: list[dict],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[dict]:
+        """Generate several missions concurrently.
+
+        Args:
+            specs: Keyword arguments for generate_mission(), one dict per
+                mission (``role``, ``learner_level`` and ``learner_skills``
+                are required).
+            max_workers: Maximum number of Gemini requests in flight.
+
+        Returns:
+            Mission specifications, in the same order as ``specs``.
+
+        Raises:
+            ValueError: If any mission cannot be generated.
+        """
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            return list(executor.map(lambda spec: self.generate_mission(**spec), specs))
+
+    def _call_gemini(
+        self,
+        preamble: str,
+        context: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Stream a Gemini response to the preamble followed by the context.
+
+        Returns:
+            The concatenated response text
+        """
+        return self._collect_stream(
+            self.client.models.generate_content_stream(
+                model=_MODEL, contents=preamble + context
+            ),
+            on_chunk,
+        )
+
+    @staticmethod
+    def _collect_stream(
+        stream: Iterable[Any], on_chunk: Optional[Callable[[str], None]]
+    ) -> str:
+        """Join the text of streamed response chunks, reporting each one."""
+        parts = []
+        for chunk in stream:
+            text = chunk.text
+            if not text:
+                continue
+            parts.append(text)
+            if on_chunk is not None:
+                on_chunk(text)
+        return "".join(parts)
+
+    @staticmethod
+    def _cache_key(
+        role: str,
+        learner_level: str,
+        skills: list[str],
+        mode: str,
+        user_idea: Optional[str],
+    ) -> str:
+        """Hash a mission request into a stable cache key."""
+        payload = json.dumps(
+            [role, learner_level, sorted(skills), mode, user_idea, _MODEL]
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached(self, cache_key: str) -> Optional[str]:
+        """Return a cached response from memory or disk, or None."""
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            cached = cache_file.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        self.cache[cache_key] = cached
+        return cached
+
+    def _put_cached(self, cache_key: str, response_text: str) -> None:
+        """Store a validated response; caching failures are not fatal."""
+        self.cache[cache_key] = response_text
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{cache_key}.json").write_text(
+                response_text, encoding="utf-8"
+            )
+        except OSError:
+            pass
+
     def _build_ai_suggested_prompt(
         self, role: str, role_info: dict, learner_level: str, skills: list[str]
     ) -> str:
-        """Build prompt for AI-suggested mission."""
-        return f"""
-You are an expert technical curriculum designer. Generate a complete DevOps mission brief.
+        """Build the per-learner context for an AI-suggested mission.
 
+        Sent after AI_SUGGESTED_PREAMBLE.
+        """
+        return f"""
 CONTEXT:
 - Role: {role_info['title']}
 - Learner Level: {learner_level.upper()}
 - Current Skills: {', '.join(skills) if skills else 'None yet'}
 - Goal: Build a complete, production-ready project (not a fragment)
-
-REQUIREMENTS:
-1. Project Name: Should be realistic and achievable
-2. Project Description: 2-3 sentences explaining the business need
-3. Tech Stack: Based on role, list 3-5 technologies to use
-4. Scope: Outline major features/components
-5. Learning Path:
-   - If learner missing skills: Suggest 2-3 skills to learn
-   - If learner has gaps: Recommend specific learning resources
-6. MVP Features: Core features that are achievable (60% of time)
-7. Excellence Features: Stretch goals for advanced learning
-8. Success Criteria: How to measure if project is successful
-9. Estimated Duration: Total hours to complete
-
-RESPONSE FORMAT:
-Return ONLY JSON (no markdown, no explanation):
-{{"project_name": "...", "project_description": "...", "tech_stack": [],
-"scope": [], "learning_needs": [], "mvp_features": [], "excellence_features": [],
-"success_criteria": [], "estimated_hours": 40}}
 """
 
     def _build_po_prompt(
@@ -182,70 +415,73 @@ Return ONLY JSON (no markdown, no explanation):
         skills: list[str],
         user_idea: str,
     ) -> str:
-        """Build prompt for Product Owner mode."""
-        return f"""
-You are an expert DevOps architect. Transform a user's idea into a technical mission.
+        """Build the per-learner context for Product Owner mode.
 
+        Sent after PO_PREAMBLE.
+        """
+        return f"""
 CONTEXT:
 - Role: {role.replace('_', ' ').title()}
 - Learner Level: {learner_level.upper()}
 - Current Skills: {', '.join(skills) if skills else 'None yet'}
 - User's Idea: {user_idea}
-
-TASK:
-Transform the user's idea into a production-ready DevOps project. Recommend learning first.
-
-RESPONSE FORMAT:
-Return ONLY JSON (no markdown, no explanation):
-{{"project_name": "...", "project_description": "...", "tech_stack": [],
-"scope": [], "learning_needs": [], "mvp_features": [], "excellence_features": [],
-"success_criteria": [], "estimated_hours": 40}}
 """
 
     def _parse_mission_response(self, response_text: str) -> dict:
         """Parse Gemini response into mission dict."""
         try:
-            # Try to extract JSON from response
-            json_str = response_text.strip()
-            if json_str.startswith("```"):
-                # Remove markdown code blocks if present
-                json_str = json_str.split("```")[1]
-                if json_str.startswith("json"):
-                    json_str = json_str[4:]
-            json_str = json_str.strip()
-
-            mission = json.loads(json_str)
-            return mission
-        except (json.JSONDecodeError, IndexError, ValueError) as e:
-            console.print(f"[red]Failed to parse Gemini response: {e}[/red]")
-            # Return default mission structure on parse error
-            return {
-                "project_name": "Default Project",
-                "project_description": response_text[:200],
-                "tech_stack": ["Python", "Docker"],
-                "scope": ["Setup", "Implementation", "Testing"],
-                "learning_needs": [],
-                "mvp_features": ["Core feature"],
-                "excellence_features": [],
-                "success_criteria": ["Tests pass", "Documented"],
-                "estimated_hours": 20,
-            }
+            return self._decode_mission(response_text)
+        except ValueError as e:
+            return self._default_mission(response_text, e)
+
+    def _decode_mission(self, response_text: str) -> dict:
+        """Decode and validate a response, raising ValueError if it is invalid.
+
+        Learning needs given as bare skill names are normalized to dicts.
+        """
+        payload = MissionPayload.model_validate_json(self._strip_fences(response_text))
+        return payload.model_dump()
+
+    @staticmethod
+    def _default_mission(response_text: str, error: ValueError) -> dict:
+        """Return the fallback mission used when a response cannot be parsed."""
+        console.print(f"[red]Failed to parse Gemini response: {error}[/red]")
+        return {
+            "project_name": "Default Project",
+            "project_description": response_text[:200],
+            "tech_stack": ["Python", "Docker"],
+            "scope": ["Setup", "Implementation", "Testing"],
+            "learning_needs": [],
+            "mvp_features": ["Core feature"],
+            "excellence_features": [],
+            "success_criteria": ["Tests pass", "Documented"],
+            "estimated_hours": 20,
+        }
+
+    @staticmethod
+    def _strip_fences(response_text: str) -> str:
+        """Extract the JSON payload from a possibly fenced response."""
+        match = _FENCE_RE.match(response_text)
+        return match.group(1) if match else response_text.strip()
 
     def validate_mission_feasibility(
-        self, mission: dict, learner_skills: list[str]
+        self, mission: dict, learner_skills: Iterable[str]
     ) -> tuple[bool, list[str]]:
         """Validate if mission is feasible with learner's skills.
 
+        High-priority learning needs the learner already has (compared
+        case-insensitively) do not count as missing.
+
         Returns:
             (is_feasible, missing_skills)
         """
-        learning_needs = mission.get("learning_needs", [])
-        missing_skills = []
-
-        # Check if too many missing skills
-        for need in learning_needs:
-            if need.get("priority") == "high":
-                missing_skills.append(need["skill"])
+        known_skills = frozenset(skill.lower() for skill in learner_skills)
+        missing_skills = [
+            need["skill"]
+            for need in mission.get("learning_needs", [])
+            if need.get("priority") == "high"
+            and need["skill"].lower() not in known_skills
+        ]
 
         # Feasible if <= 3 high priority learning needs
         is_feasible = len(missing_skills) <= 3
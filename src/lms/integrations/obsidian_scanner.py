@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +13,13 @@ from rich.console import Console
 
 console = Console()
 
+# Vaults with more notes than this are read on a thread pool to overlap
+# file I/O; smaller ones are not worth the pool startup
+PARALLEL_SCAN_THRESHOLD = 100
+
+# Vault config, VCS and dependency folders never contain notes
+_SKIP_DIRS = frozenset({".git", ".obsidian", ".trash", "node_modules", ".venv"})
+
 
 class Flashcard:
     """Represent a single flashcard."""
@@ -43,6 +53,17 @@ class ObsidianScanner:
         r"^Q::\s*(.+?)\n?A::\s*(.+?)(?:\n|$)", re.MULTILINE | re.DOTALL
     )
     PATTERN_INLINE = re.compile(r"^(.+?)::\s*(.+?)$", re.MULTILINE)
+    # All formats in one scan; Q::/A:: is tried before Q:/A: so its lines are
+    # not re-read as other formats. Each alternative has a (question, answer)
+    # group pair, so the last matched group is the answer.
+    PATTERN_ALL = re.compile(
+        f"(?s:{PATTERN_Q_COLON_A.pattern})"
+        f"|(?s:{PATTERN_Q_A.pattern})"
+        f"|{PATTERN_INLINE.pattern}",
+        re.MULTILINE,
+    )
+    # Case-insensitive tag search on the raw bytes of a note
+    PATTERN_TAG = re.compile(rb"#flashcard", re.IGNORECASE)
 
     def __init__(self, vault_path: Optional[str] = None):
         if not vault_path:
@@ -56,10 +77,28 @@ class ObsidianScanner:
     def scan_vault(self) -> list[Path]:
         """Recursively scan vault for markdown files.
 
+        Hidden directories and those in _SKIP_DIRS (``.obsidian``,
+        ``.trash``, ...) are not descended into.
+
         Returns:
             List of Path objects for all .md files in vault.
         """
-        return list(self.vault_path.rglob("*.md"))
+        files = []
+        stack = [str(self.vault_path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SKIP_DIRS and not name.startswith("."):
+                            stack.append(entry.path)
+                    elif name.endswith(".md"):
+                        files.append(Path(entry.path))
+        return files
 
     def extract_flashcards_from_file(self, file_path: Path) -> list[Flashcard]:
         """Extract flashcards from a single markdown file.
@@ -70,35 +109,33 @@ class ObsidianScanner:
         Returns:
             List of Flashcard objects found in the file.
         """
-        if not file_path.exists():
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return []
+
+        # Check if file has #flashcard tag before paying for the decode
+        if not self.PATTERN_TAG.search(data):
             return []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
             return []
 
         flashcards = []
 
-        # Check if file has #flashcard tag
-        if "#flashcard" not in content.lower():
-            return []
-
-        # Extract Q:/A: format
-        for match in self.PATTERN_Q_A.finditer(content):
-            q, a = match.groups()
-            flashcards.append(Flashcard(q, a, tags=["flashcard"]))
-
-        # Extract Q::A:: format
-        for match in self.PATTERN_Q_COLON_A.finditer(content):
-            q, a = match.groups()
-            flashcards.append(Flashcard(q, a, tags=["flashcard"]))
-
-        # Extract inline :: format (but avoid duplicates with above)
-        for match in self.PATTERN_INLINE.finditer(content):
-            q, a = match.groups()
-            card = Flashcard(q, a, tags=["flashcard"])
-            if card not in flashcards:
+        seen: set[tuple[str, str]] = set()
+        for match in self.PATTERN_ALL.finditer(content):
+            answer_group = match.lastindex
+            card = Flashcard(
+                match.group(answer_group - 1),
+                match.group(answer_group),
+                tags=["flashcard"],
+            )
+            key = (card.question, card.answer)
+            if key not in seen:
+                seen.add(key)
                 flashcards.append(card)
 
         return flashcards
@@ -107,16 +144,23 @@ class ObsidianScanner:
         """Extract all flashcards from vault.
 
         Returns:
-            List of all Flashcard objects found in the vault.
+            List of all Flashcard objects found in the vault, in scan order.
         """
         files = self.scan_vault()
-        flashcards = []
 
-        for file_path in files:
-            try:
-                cards = self.extract_flashcards_from_file(file_path)
-                flashcards.extend(cards)
-            except Exception as e:
-                console.print(f"[warning]Warning scanning {file_path}: {e}[/warning]")
+        if len(files) > PARALLEL_SCAN_THRESHOLD:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._extract_safely, files))
+        else:
+            results = [self._extract_safely(file_path) for file_path in files]
 
-        return flashcards
+        return list(chain.from_iterable(results))
+
+    def _extract_safely(self, file_path: Path) -> list[Flashcard]:
+        """Extract flashcards from a file, warning instead of raising."""
+        try:
+            return self.extract_flashcards_from_file(file_path)
+        except Exception as e:
+            console.print(f"[warning]Warning scanning {file_path}: {e}[/warning]")
+            return []
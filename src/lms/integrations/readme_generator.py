@@ -2,18 +2,53 @@
 
 from __future__ import annotations
 
+import functools
+import string
 from pathlib import Path
 
 from rich.console import Console
 
 console = Console()
 
-
-class ReadmeGenerator:
-    """Generate README.md files for lab projects."""
-
-    def __init__(self):
-        self.template = """# {project_name}
+# Shields.io badge per known technology
+_BADGE_MAP = {
+    "Python": (
+        "![Python](https://img.shields.io/badge/python-3670A0?"
+        "style=flat-square&logo=python&logoColor=ffdd54)"
+    ),
+    "Node.js": (
+        "![Node.js](https://img.shields.io/badge/node.js-339933?"
+        "style=flat-square&logo=node.js&logoColor=white)"
+    ),
+    "Go": (
+        "![Go](https://img.shields.io/badge/go-00ADD8?"
+        "style=flat-square&logo=go&logoColor=white)"
+    ),
+    "Docker": (
+        "![Docker](https://img.shields.io/badge/docker-2496ED?"
+        "style=flat-square&logo=docker&logoColor=white)"
+    ),
+    "Make": "![Make](https://img.shields.io/badge/make-427819?style=flat-square)",
+    "Docker Compose": (
+        "![Docker Compose](https://img.shields.io/badge/"
+        "docker--compose-2496ED?style=flat-square&logo=docker"
+        "&logoColor=white)"
+    ),
+    "Terraform": (
+        "![Terraform](https://img.shields.io/badge/terraform-7B42BC?"
+        "style=flat-square&logo=terraform&logoColor=white)"
+    ),
+}
+
+# Install command per technology, in README order
+_INSTALL_SNIPPETS = (
+    ("Node.js", "```bash\nnpm install\n```"),
+    ("Python", "```bash\npip install -r requirements.txt\n```"),
+    ("Docker", "```bash\ndocker build -t project-name .\n```"),
+)
+_DEFAULT_INSTALL = "```bash\n# Installation instructions\n```"
+
+README_TEMPLATE = """# {project_name}
 
 > {description}
 
@@ -54,6 +89,21 @@ This is a personal lab project. Feel free to fork and adapt as needed.
 MIT License - See LICENSE file for details
 """
 
+
+@functools.lru_cache(maxsize=8)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a format template once into (literal, field name) pairs."""
+    return tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+class ReadmeGenerator:
+    """Generate README.md files for lab projects."""
+
+    def __init__(self):
+        self.template = README_TEMPLATE
+
     def generate_tech_badges(self, tech_stack: list[str]) -> str:
         """Generate markdown badges for technologies.
 
@@ -66,43 +116,9 @@ MIT License - See LICENSE file for details
         if not tech_stack:
             return "- Project uses multiple technologies"
 
-        badge_map = {
-            "Python": (
-                "![Python](https://img.shields.io/badge/python-3670A0?"
-                "style=flat-square&logo=python&logoColor=ffdd54)"
-            ),
-            "Node.js": (
-                "![Node.js](https://img.shields.io/badge/node.js-339933?"
-                "style=flat-square&logo=node.js&logoColor=white)"
-            ),
-            "Go": (
-                "![Go](https://img.shields.io/badge/go-00ADD8?"
-                "style=flat-square&logo=go&logoColor=white)"
-            ),
-            "Docker": (
-                "![Docker](https://img.shields.io/badge/docker-2496ED?"
-                "style=flat-square&logo=docker&logoColor=white)"
-            ),
-            "Make": (
-                "![Make](https://img.shields.io/badge/make-427819?" "style=flat-square)"
-            ),
-            "Docker Compose": (
-                "![Docker Compose](https://img.shields.io/badge/"
-                "docker--compose-2496ED?style=flat-square&logo=docker"
-                "&logoColor=white)"
-            ),
-            "Terraform": (
-                "![Terraform](https://img.shields.io/badge/terraform-7B42BC?"
-                "style=flat-square&logo=terraform&logoColor=white)"
-            ),
-        }
-
-        badges = []
-        for tech in tech_stack:
-            if tech in badge_map:
-                badges.append(badge_map[tech])
-
-        return "\n".join(f"- {badge}" for badge in badges) if badges else ""
+        return "\n".join(
+            f"- {_BADGE_MAP[tech]}" for tech in tech_stack if tech in _BADGE_MAP
+        )
 
     def generate_installation_instructions(self, tech_stack: list[str]) -> str:
         """Generate installation instructions based on tech stack.
@@ -113,21 +129,10 @@ MIT License - See LICENSE file for details
         Returns:
             Markdown text with installation instructions.
         """
-        instructions = []
-
-        if "Node.js" in tech_stack:
-            instructions.append("```bash\nnpm install\n```")
-
-        if "Python" in tech_stack:
-            instructions.append("```bash\npip install -r requirements.txt\n```")
-
-        if "Docker" in tech_stack:
-            instructions.append("```bash\ndocker build -t project-name .\n```")
-
-        if not instructions:
-            instructions.append("```bash\n# Installation instructions\n```")
-
-        return "\n\n".join(instructions)
+        instructions = [
+            snippet for tech, snippet in _INSTALL_SNIPPETS if tech in tech_stack
+        ]
+        return "\n\n".join(instructions) if instructions else _DEFAULT_INSTALL
 
     def generate_readme_content(
         self,
@@ -151,17 +156,20 @@ MIT License - See LICENSE file for details
         tech_badges = self.generate_tech_badges(tech_stack)
         installation = self.generate_installation_instructions(tech_stack)
 
-        content = self.template.format(
-            project_name=project_name,
-            description=description,
-            tech_stack_text=tech_stack_text,
-            tech_badges=tech_badges,
-            installation_instructions=installation,
-            project_name_lower=project_name.lower(),
+        values = {
+            "project_name": project_name,
+            "description": description,
+            "tech_stack_text": tech_stack_text,
+            "tech_badges": tech_badges,
+            "installation_instructions": installation,
+            "project_name_lower": project_name.lower(),
+        }
+        # Template parsed once; each call only joins literals and values
+        return "".join(
+            literal + (str(values[field]) if field is not None else "")
+            for literal, field in _compile_template(self.template)
         )
 
-        return content
-
     def write_readme(
         self,
         project_path: str | Path,
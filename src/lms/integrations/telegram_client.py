@@ -3,7 +3,24 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Messages in flight during send_many (the session pool holds 10)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Telegram rejects messages over 4096 characters; keep headroom for markup
+DIGEST_CHUNK_CHARS = 4000
+
+# Legacy Markdown entity delimiters; a piece with an odd count of any of
+# them (or unmatched link brackets) opens an entity it does not close,
+# which Telegram rejects
+_MARKDOWN_DELIMITERS = ("*", "_", "`")
 
 
 class TelegramClient:
@@ -11,7 +28,9 @@ class TelegramClient:
 
     Handles basic messaging for daily notifications without pulling extra
     dependencies. Uses HTTP requests to call Telegram's sendMessage and getMe
-    endpoints.
+    endpoints. A single keep-alive session is reused for all calls, so
+    bursts of notifications share one TLS connection; use the client as a
+    context manager (or call close()) to release it.
     """
 
     API_URL = "https://api.telegram.org"
@@ -23,6 +42,29 @@ class TelegramClient:
             raise ValueError("TELEGRAM_CHAT_ID is required")
         self.token = token
         self.chat_id = chat_id
+        self._session = requests.Session()
+        # Only idempotent requests are retried on error statuses; a failed
+        # sendMessage may already have been delivered
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry),
+        )
+
+    def __enter__(self) -> "TelegramClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
 
     @classmethod
     def from_env(cls) -> "TelegramClient":
@@ -34,12 +76,12 @@ class TelegramClient:
     def _build_url(self, method: str) -> str:
         return f"{self.API_URL}/bot{self.token}/{method}"
 
-    def send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
+    def send_message(self, text: str, parse_mode: Optional[str] = "Markdown") -> bool:
         """Send a simple text message.
 
         Args:
             text: Message content.
-            parse_mode: Telegram parse mode (Markdown/HTML).
+            parse_mode: Telegram parse mode (Markdown/HTML), None for plain text.
         Returns:
             True if Telegram API responded with ok=True.
         """
@@ -47,20 +89,127 @@ class TelegramClient:
         payload = {
             "chat_id": self.chat_id,
             "text": text,
-            "parse_mode": parse_mode,
             "disable_web_page_preview": True,
         }
-        response = requests.post(url, json=payload, timeout=10)
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+        response = self._session.post(url, json=payload, timeout=10)
         if response.status_code >= 400:
             response.raise_for_status()
         data = response.json()
         return bool(data.get("ok"))
 
+    def send_many(
+        self,
+        texts: list[str],
+        parse_mode: str = "Markdown",
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[bool]:
+        """Send several messages concurrently.
+
+        Round-trips overlap, so Telegram may deliver the messages out of
+        order; use send_message() in a loop when order matters.
+
+        Args:
+            texts: Message contents.
+            parse_mode: Telegram parse mode (Markdown/HTML).
+            max_workers: Maximum number of requests in flight.
+        Returns:
+            send_message() result for each text, in input order.
+        """
+        if not texts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(
+                executor.map(lambda text: self.send_message(text, parse_mode), texts)
+            )
+
+    def send_digest(self, lines: list[str], sep: str = "\n\n") -> bool:
+        """Send many short notifications as one message where possible.
+
+        Lines are packed greedily into messages of at most
+        DIGEST_CHUNK_CHARS characters, trading per-line messages for one or
+        two round-trips. A single line longer than the limit is split on
+        newlines or whitespace where possible; pieces that cut through a
+        Markdown entity are sent as plain text.
+
+        Args:
+            lines: Notification texts, in display order.
+            sep: Separator placed between lines within a message.
+        Returns:
+            True if every message was sent successfully.
+        """
+        return all(
+            [
+                self.send_message(chunk, "Markdown" if markdown else None)
+                for chunk, markdown in _pack_digest(lines, sep)
+            ]
+        )
+
     def test_connection(self) -> bool:
         """Call getMe to validate token."""
         url = self._build_url("getMe")
-        response = requests.get(url, timeout=5)
+        response = self._session.get(url, timeout=5)
         if response.status_code >= 400:
             response.raise_for_status()
         data = response.json()
         return bool(data.get("ok"))
+
+
+def _pack_digest(lines: list[str], sep: str) -> list[tuple[str, bool]]:
+    """Pack lines into as few messages as fit within DIGEST_CHUNK_CHARS.
+
+    Returns:
+        (text, markdown) pairs; markdown is False for pieces of a split line
+        that would leave a Markdown entity unclosed.
+    """
+    chunks: list[tuple[str, bool]] = []
+    current = ""
+    for line in lines:
+        # Oversized lines become chunks of their own
+        if len(line) > DIGEST_CHUNK_CHARS:
+            if current:
+                chunks.append((current, True))
+                current = ""
+            chunks.extend(
+                (piece, _markdown_balanced(piece)) for piece in _split_line(line)
+            )
+            continue
+        if not current:
+            current = line
+        elif len(current) + len(sep) + len(line) <= DIGEST_CHUNK_CHARS:
+            current = f"{current}{sep}{line}"
+        else:
+            chunks.append((current, True))
+            current = line
+    if current:
+        chunks.append((current, True))
+    return chunks
+
+
+def _split_line(line: str) -> list[str]:
+    """Split a line into DIGEST_CHUNK_CHARS pieces at newline or space boundaries."""
+    pieces = []
+    while len(line) > DIGEST_CHUNK_CHARS:
+        window = line[: DIGEST_CHUNK_CHARS + 1]
+        cut = window.rfind("\n")
+        if cut <= 0:
+            cut = max(window.rfind(" "), window.rfind("\t"))
+        if cut <= 0:
+            # No boundary to split on: hard cut, dropping nothing
+            pieces.append(line[:DIGEST_CHUNK_CHARS])
+            line = line[DIGEST_CHUNK_CHARS:]
+        else:
+            pieces.append(line[:cut])
+            line = line[cut + 1 :]
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def _markdown_balanced(text: str) -> bool:
+    """Return True if no Markdown entity is left open in text."""
+    if text.count("[") != text.count("]"):
+        return False
+    return all(text.count(mark) % 2 == 0 for mark in _MARKDOWN_DELIMITERS)
@@ -0,0 +1,34 @@
+"""Shared JSON helpers for SkillOps, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_loads(data: bytes | str) -> Any:
+        """Decode a JSON document from bytes or text."""
+        return orjson.loads(data)
+
+    def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+        """Encode data as UTF-8 JSON, compact unless indent is set."""
+        if indent:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(data)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def json_loads(data: bytes | str) -> Any:
+        """Decode a JSON document from bytes or text."""
+        return json.loads(data)
+
+    def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+        """Encode data as UTF-8 JSON, compact unless indent is set."""
+        # Non-ASCII text is written verbatim, as orjson does
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
@@ -0,0 +1,33 @@
+"""Console entry point for SkillOps.
+
+Answers version probes before importing typer or any command module;
+everything else is handed to the typer app in src.lms.main.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Sequence
+
+VERSION_BANNER = "SkillOps LMS v0.5.0 (Labs & Polish)"
+
+# Arguments answered without building the typer app
+_VERSION_ARGS = frozenset({"version", "--version", "-V"})
+
+
+def print_version_if_requested(argv: Sequence[str]) -> bool:
+    """Print the version banner if it is all argv asks for."""
+    if len(argv) == 1 and argv[0] in _VERSION_ARGS:
+        print(VERSION_BANNER)
+        return True
+    return False
+
+
+def main() -> None:
+    """Main entry point for console_scripts."""
+    if print_version_if_requested(sys.argv[1:]):
+        return
+
+    from src.lms.main import run
+
+    run(sys.argv[1:])
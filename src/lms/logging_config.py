@@ -8,31 +8,72 @@ import os
 import sys
 from datetime import datetime, timezone
 
+from src.lms.json_utils import dump_json_bytes
+
+
+def _dumps(payload: dict) -> str:
+    """Serialize a log payload; never raises for odd record contents."""
+    try:
+        return dump_json_bytes(payload).decode("utf-8")
+    except (TypeError, ValueError):
+        # orjson rejects lone surrogates (e.g. undecodable file names) and
+        # the UTF-8 decode fails on them; ASCII-escaped JSON keeps them
+        return json.dumps(payload, separators=(",", ":"), default=str)
+
 
 class JsonFormatter(logging.Formatter):
     """Structured JSON log formatter."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted date/time) reused for records in that second
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record creation time as ISO 8601 UTC with microseconds."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1e6):06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return _dumps(payload)
 
 
 def setup_logging(verbose: bool = False, log_format: str | None = None) -> None:
     """Configure logging for SkillOps.
 
+    Safe to call repeatedly: the handler installed by a previous call is
+    replaced rather than duplicated, and an identical configuration is left
+    untouched.
+
     Args:
         verbose: If True, enable DEBUG level logging. Otherwise, INFO level.
+        log_format: "text" or "json". Defaults to SKILLOPS_LOG_FORMAT or "text".
     """
     level = logging.DEBUG if verbose else logging.INFO
 
     resolved_format = (log_format or os.getenv("SKILLOPS_LOG_FORMAT", "text")).lower()
+    root_logger = logging.getLogger()
+    installed = [h for h in root_logger.handlers if getattr(h, "_skillops", False)]
+    if installed and getattr(root_logger, "_skillops_config", None) == (
+        level,
+        resolved_format,
+    ):
+        return
+
     handler = logging.StreamHandler(sys.stderr)
     if resolved_format == "json":
         handler.setFormatter(JsonFormatter())
@@ -40,12 +81,14 @@ def setup_logging(verbose: bool = False, log_format: str | None = None) -> None:
         handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
+    handler._skillops = True  # type: ignore[attr-defined]
 
-    logging.basicConfig(level=level, handlers=[handler])
-
-    # Explicitly set root level so patched basicConfig still applies
-    root_logger = logging.getLogger()
+    for old_handler in installed:
+        root_logger.removeHandler(old_handler)
+        old_handler.close()
+    root_logger.addHandler(handler)
     root_logger.setLevel(level)
+    root_logger._skillops_config = (level, resolved_format)  # type: ignore[attr-defined]
 
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -1,68 +1,14 @@
 """Main entry point for SkillOps LMS CLI application."""
 
-# CRITICAL: Load environment variables FIRST, before any imports
+import inspect
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Sequence
 
-from dotenv import load_dotenv
+import typer
 
-load_dotenv()
-config_env = Path.home() / ".config" / "skillops" / "skillops.env"
-if config_env.exists():
-    load_dotenv(config_env, override=False)
-
-try:
-    from src.lms.secrets import load_keyring_secrets
-
-    load_keyring_secrets()
-except Exception:
-    pass
-
-import os  # noqa: E402
-import time  # noqa: E402
-from typing import Optional  # noqa: E402
-
-import typer  # noqa: E402
-
-from src.lms.commands import run_train, run_code, run_review, run_quiz  # noqa: E402
-from src.lms.commands.health import health_check  # noqa: E402
-from src.lms.commands.export import DataExporter  # noqa: E402
-from src.lms.commands.data_import import DataImporter  # noqa: E402
-from src.lms.doctor import run_doctor  # noqa: E402
-from src.lms.monitoring import (  # noqa: E402
-    ErrorAggregator,
-    MetricsCollector,
-    send_alert_from_aggregator,
-)
-from src.lms.display import display_info_panel  # noqa: E402
-from src.lms.steps.notify import notify_step  # noqa: E402
-from src.lms.steps.share import share_step  # noqa: E402
-from src.lms.commands.setup_wizard import setup_command  # noqa: E402
-from src.lms.steps.migrate import migrate as migrate_legacy_data  # noqa: E402
-from src.lms.chaos import ChaosConfig, run_chaos  # noqa: E402
-from src.lms.chaos_templates import (  # noqa: E402
-    apply_chaos,
-    get_ai_feedback,
-    pick_chaos_template,
-    record_chaos_history,
-    upsert_learning_profile,
-)
-from src.lms.dashboard import (  # noqa: E402
-    display_dashboard,
-    display_recommendations,
-)
-from rich.console import Console  # noqa: E402
-from rich.panel import Panel  # noqa: E402
-from rich.prompt import Prompt  # noqa: E402
-from src.lms.oncall import oncall_step  # noqa: E402
-from src.lms.postmortem import postmortem_step  # noqa: E402
-from src.lms.books import (  # noqa: E402
-    check_books_command,
-    submit_books_command,
-    fetch_books_command,
-    import_books_command,
-    process_pipeline_command,
-)
-from src.lms.database import cleanup_old_records  # noqa: E402
+from src.lms import launcher
+from src.lms.launcher import VERSION_BANNER
 
 app = typer.Typer(
     name="skillops",
@@ -70,7 +16,37 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+# Commands that never read configuration skip loading .env and keyring
+_NO_ENV_COMMANDS = frozenset({"version"})
+
+
+@lru_cache(maxsize=1)
+def _ensure_env() -> None:
+    """Load .env files and keyring secrets into the environment, once."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    config_env = Path.home() / ".config" / "skillops" / "skillops.env"
+    if config_env.exists():
+        load_dotenv(config_env, override=False)
+
+    try:
+        from src.lms.secrets import load_keyring_secrets
+
+        load_keyring_secrets()
+    except Exception:
+        pass
+
+
+@app.callback()
+def _load_environment(ctx: typer.Context) -> None:
+    """Load configuration before a command's options are parsed.
+
+    Runs before the subcommand resolves envvar-backed options, and only
+    once a command is actually invoked, so ``--help`` does no file I/O.
+    """
+    if ctx.invoked_subcommand not in _NO_ENV_COMMANDS:
+        _ensure_env()
 
 
 def pagerduty_check() -> bool:
@@ -123,11 +99,6 @@ def secret_unset(key: str = typer.Argument(..., help="Secret key name")):
     typer.echo("✅ Secret removed from keyring")
 
 
-def _alert_type() -> str:
-    """Resolve alert type from environment (email/webhook/both)."""
-    return os.getenv("SKILLOPS_ALERT_TYPE", "email")
-
-
 @app.command()
 def train(
     topic: str = typer.Argument(..., help="Sujet d'apprentissage"),
@@ -137,6 +108,8 @@ def train(
     ),
 ):
     """Apprentissage rapide avec quiz."""
+    from src.lms.commands import run_train
+
     run_train(topic=topic, questions=questions, storage_path=storage_path)
 
 
@@ -147,6 +120,8 @@ def code(
     ),
 ):
     """Session code (tracking passif en Phase 3)."""
+    from src.lms.commands import run_code
+
     run_code(storage_path=storage_path)
 
 
@@ -158,6 +133,8 @@ def review(
     ),
 ):
     """Afficher les stats du jour et le streak."""
+    from src.lms.commands import run_review
+
     run_review(storage_path=storage_path)
 
 
@@ -170,13 +147,15 @@ def quiz(
     ),
 ):
     """Quiz local (SQLite) sans AnkiConnect."""
+    from src.lms.commands import run_quiz
+
     run_quiz(topic=topic, count=count, storage_path=storage_path)
 
 
 @app.command()
 def version():
     """Display the SkillOps version and build info."""
-    typer.echo("SkillOps LMS v0.5.0 (Labs & Polish)")
+    typer.echo(VERSION_BANNER)
 
 
 @app.command()
@@ -189,12 +168,16 @@ def health():
         • Storage access
         • Required dependencies
     """
+    from src.lms.commands.health import health_check
+
     health_check()
 
 
 @app.command()
 def doctor():
     """Run preflight checks for configuration and environment."""
+    from src.lms.doctor import run_doctor
+
     success = run_doctor()
     if not success:
         raise typer.Exit(code=1)
@@ -203,6 +186,8 @@ def doctor():
 @app.command()
 def migrate():
     """Migrate legacy JSON files to SQLite."""
+    from src.lms.steps.migrate import migrate as migrate_legacy_data
+
     migrate_legacy_data()
 
 
@@ -220,6 +205,8 @@ def retention(
     ),
 ):
     """Run data retention cleanup manually."""
+    from src.lms.database import cleanup_old_records
+
     deleted = cleanup_old_records(
         storage_path=storage_path, retention_days=days, vacuum=vacuum
     )
@@ -235,6 +222,7 @@ def metrics(
 ):
     """Display a summary of execution metrics."""
     from rich.table import Table
+    from src.lms.monitoring import MetricsCollector
 
     collector = MetricsCollector(storage_path=storage_path)
     overall = collector.get_overall_stats()
@@ -307,6 +295,8 @@ def dashboard(
     ),
 ):
     """Display interactive learning dashboard with analytics (Phase 4)."""
+    from src.lms.dashboard import display_dashboard, display_recommendations
+
     display_dashboard(storage_path=storage_path)
     display_recommendations(storage_path=storage_path)
 
@@ -367,6 +357,20 @@ def chaos(
     ),
 ):
     """Adaptive chaos templates with bug injection."""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from src.lms.chaos_templates import (
+        apply_chaos,
+        get_ai_feedback,
+        pick_chaos_template,
+        record_chaos_history,
+        upsert_learning_profile,
+    )
+    from src.lms.display import display_info_panel
+
+    console = Console()
+
     if topics:
         topic_list = [t.strip() for t in topics.split(",") if t.strip()]
         if topic_list:
@@ -481,6 +485,8 @@ def chaos_run(
     ),
 ):
     """Run legacy SkillOps Chaos Monkey scenarios."""
+    from src.lms.chaos import ChaosConfig, run_chaos
+
     config = ChaosConfig(
         level=level,
         mode=mode,
@@ -516,6 +522,8 @@ def oncall(
         skillops oncall
         skillops oncall --storage-path ./storage
     """
+    from src.lms.oncall import oncall_step
+
     success = oncall_step(storage_path=storage_path)
     if not success:
         raise typer.Exit(code=1)
@@ -536,6 +544,8 @@ def post_mortem(
         skillops post-mortem
         skillops post-mortem --storage-path ./storage
     """
+    from src.lms.postmortem import postmortem_step
+
     success = postmortem_step(storage_path=storage_path)
     if not success:
         raise typer.Exit(code=1)
@@ -562,47 +572,14 @@ def notify(
     ),
 ):
     """Send today's notification to Telegram."""
-    if verbose:
-        from src.lms.logging_config import setup_logging
-
-        setup_logging(verbose=True)
+    from src.lms._main_impl import run_notify
 
-    from src.lms.logging_config import get_logger
-
-    logger = get_logger(__name__)
-    aggregator = ErrorAggregator() if enable_monitoring else None
-    metrics = MetricsCollector() if enable_monitoring else None
-    alert_type = _alert_type() if enable_monitoring else "email"
-    started_at = time.monotonic()
-    success = False
-    logger.debug(
-        "Starting notify_step with storage_path=%s, respect_schedule=%s",
-        storage_path,
-        respect_schedule,
+    return run_notify(
+        verbose=verbose,
+        storage_path=storage_path,
+        respect_schedule=respect_schedule,
+        enable_monitoring=enable_monitoring,
     )
-    try:
-        success = notify_step(
-            storage_path=storage_path, respect_schedule=respect_schedule
-        )
-        if success:
-            logger.debug("notify_step completed successfully")
-        else:
-            logger.warning("notify_step completed without sending notification")
-    except Exception as exc:  # pragma: no cover - passthrough to Typer
-        if aggregator:
-            is_new = aggregator.record_error(exc, "notify")
-            if is_new:
-                send_alert_from_aggregator(aggregator, alert_type)
-        raise
-    finally:
-        if metrics:
-            metrics.record_step_execution(
-                "notify",
-                time.monotonic() - started_at,
-                success,
-                metadata={"respect_schedule": respect_schedule},
-            )
-    return success
 
 
 @app.command()
@@ -629,73 +606,15 @@ def share(
     ),
 ):
     """Share lab projects to GitHub with automatic README generation."""
-    if verbose:
-        from src.lms.logging_config import setup_logging
-
-        setup_logging(verbose=True)
-
-    from src.lms.logging_config import get_logger
-
-    logger = get_logger(__name__)
-    aggregator = ErrorAggregator() if enable_monitoring else None
-    metrics = MetricsCollector() if enable_monitoring else None
-    alert_type = _alert_type() if enable_monitoring else "email"
-    started_at = time.monotonic()
-    success = False
-    logger.debug(
-        "Starting share_step with labs_path=%s, github_username=%s",
-        labs_path,
-        github_username,
+    from src.lms._main_impl import run_share
+
+    run_share(
+        verbose=verbose,
+        labs_path=labs_path,
+        github_token=github_token,
+        github_username=github_username,
+        enable_monitoring=enable_monitoring,
     )
-    try:
-        success = share_step(
-            labs_path=labs_path,
-            github_token=github_token,
-            github_username=github_username,
-        )
-        if success:
-            logger.debug("share_step completed successfully")
-        else:
-            logger.error("share_step failed")
-            if aggregator:
-                is_new = aggregator.record_error(
-                    RuntimeError("share_step returned False"),
-                    "share",
-                    context={
-                        "labs_path": labs_path,
-                        "github_username": github_username,
-                    },
-                )
-                if is_new:
-                    send_alert_from_aggregator(aggregator, alert_type)
-    except Exception as exc:  # pragma: no cover - passthrough to Typer
-        logger.error("share_step raised exception: %s", exc)
-        if aggregator:
-            is_new = aggregator.record_error(
-                exc,
-                "share",
-                context={
-                    "labs_path": labs_path,
-                    "github_username": github_username,
-                },
-            )
-            if is_new:
-                send_alert_from_aggregator(aggregator, alert_type)
-        raise
-    finally:
-        if metrics:
-            metrics.record_step_execution(
-                "share",
-                time.monotonic() - started_at,
-                success,
-                metadata={
-                    "labs_path": labs_path,
-                    "github_username": github_username,
-                },
-            )
-
-    if not success:
-        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -713,6 +632,7 @@ def setup(
     ),
 ):
     """Guided setup to create a .env file and validate configuration."""
+    from src.lms.commands.setup_wizard import setup_command
 
     setup_command(output=output, skip_health=skip_health)
 
@@ -749,61 +669,9 @@ def export(
         skillops export --format csv --output ./exports/
         skillops export -f json -o ~/backups/$(date +%Y%m%d).json
     """
-    from rich.console import Console
-    from rich.panel import Panel
-
-    console = Console()
+    from src.lms._main_impl import run_export
 
-    try:
-        exporter = DataExporter()
-
-        if export_format.lower() == "json":
-            result = exporter.export_to_json(output_path=output)
-            console.print(f"\n[green]✓ Exported to {result}[/green]\n")
-        elif export_format.lower() == "csv":
-            results = exporter.export_to_csv(output_dir=output)
-            console.print(f"\n[green]✓ Exported {len(results)} CSV files[/green]\n")
-        else:
-            console.print("[red]✗ Invalid format. Use 'json' or 'csv'[/red]\n")
-            raise typer.Exit(code=1)
-
-        exporter.display_export_summary()
-
-    except FileNotFoundError as exc:
-        error_panel = Panel(
-            f"[red]Directory not found:[/red] {exc}\n\n"
-            "[yellow]Suggestion:[/yellow] Ensure the output directory "
-            "exists or create it first:\n"
-            f"  mkdir -p {output if output else './skillops_exports'}",
-            title="[red]❌ Export Failed[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1)
-    except PermissionError as exc:
-        error_panel = Panel(
-            "[red]Permission denied:[/red] Cannot write to output "
-            "location\n\n"
-            "[yellow]Suggestion:[/yellow] Check write permissions or "
-            "choose a different directory:\n"
-            "  skillops export -f json -o ~/skillops_backup.json",
-            title="[red]❌ Export Failed[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1) from exc
-    except Exception as exc:
-        error_panel = Panel(
-            f"[red]Export failed:[/red] {str(exc)}\n\n"
-            f"[yellow]Tips:[/yellow]\n"
-            f"  • Use --verbose flag for detailed error logs\n"
-            f"  • Ensure all API keys are configured\n"
-            f"  • Check available disk space",
-            title="[red]❌ Export Error[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1) from exc
+    run_export(export_format=export_format, output=output)
 
 
 @app.command()
@@ -835,123 +703,9 @@ def import_data(
         skillops import-data ./exports/ --format csv
         skillops import-data skillops_export.json --merge
     """
-    from rich.console import Console
-    from rich.prompt import Confirm
-    from rich.panel import Panel
-
-    console = Console()
+    from src.lms._main_impl import run_import_data
 
-    if not file.exists():
-        error_panel = Panel(
-            f"[red]File not found:[/red] {file}\n\n"
-            f"[yellow]Suggestions:[/yellow]\n"
-            f"  • Double-check the file path\n"
-            f"  • Try: skillops export -f json -o backup.json\n"
-            f"  • Use absolute path: /home/user/backups/skillops_export.json",
-            title="[red]❌ Import Failed[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1)
-
-    try:
-        importer = DataImporter()
-
-        # Auto-detect format if not specified
-        if import_format is None:
-            if file.is_file() and file.suffix == ".json":
-                import_format = "json"
-            elif file.is_file() and file.suffix == ".csv":
-                import_format = "csv"
-            elif file.is_dir():
-                import_format = "csv"
-            else:
-                error_panel = Panel(
-                    f"[red]Could not auto-detect format[/red]\n\n"
-                    f"[yellow]Please specify format:[/yellow]\n"
-                    f"  skillops import-data {file} --format json\n"
-                    f"  skillops import-data {file} --format csv",
-                    title="[red]❌ Format Detection Failed[/red]",
-                    border_style="red",
-                )
-                console.print(error_panel)
-                raise typer.Exit(code=1)
-
-        # Validate before importing
-        if not importer.validate_import(file):
-            error_panel = Panel(
-                f"[red]Invalid import file:[/red] {file}\n\n"
-                f"[yellow]Check:[/yellow]\n"
-                f"  • JSON files must be valid JSON\n"
-                f"  • CSV files must have: date, steps, time, cards\n"
-                f"  • File is not corrupted",
-                title="[red]❌ Validation Failed[/red]",
-                border_style="red",
-            )
-            console.print(error_panel)
-            raise typer.Exit(code=1)
-
-        # Show confirmation
-        merge_note = " (merging)" if merge else " (replacing existing data)"
-        console.print(f"\n[yellow]⚠️  Importing from {file}{merge_note}[/yellow]")
-        console.print(
-            "[dim]A backup of current data will be created before import[/dim]"
-        )
-
-        if not Confirm.ask("Continue with import?"):
-            console.print("[yellow]Import cancelled[/yellow]\n")
-            raise typer.Exit(code=0)
-
-        # Perform import
-        if import_format.lower() == "json":
-            success = importer.import_from_json(file, merge=merge, backup=True)
-        elif import_format.lower() == "csv":
-            success = importer.import_from_csv(file, merge=merge, backup=True)
-        else:
-            console.print("[red]✗ Invalid format. Use 'json' or 'csv'[/red]\n")
-            raise typer.Exit(code=1)
-
-        if success:
-            console.print("\n[green]✓ Import completed successfully[/green]\n")
-        else:
-            error_panel = Panel(
-                "[red]Import failed[/red]\n\n"
-                "[yellow]Try:[/yellow]\n"
-                "  • Check file format is correct\n"
-                "  • Use --verbose flag for details\n"
-                "  • Restore from backup in "
-                "~/.skillops/profiles/backups/",
-                title="[red]❌ Import Error[/red]",
-                border_style="red",
-            )
-            console.print(error_panel)
-            raise typer.Exit(code=1)
-
-    except typer.Exit:
-        raise
-    except FileNotFoundError as exc:
-        error_panel = Panel(
-            "[red]File access error: Unable to read file[/red]\n\n"
-            "[yellow]Ensure:[/yellow]\n"
-            "  • File has correct permissions\n"
-            "  • Directory exists and is readable",
-            title="[red]❌ File Access Failed[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1) from exc
-    except Exception as exc:
-        error_panel = Panel(
-            f"[red]Import failed:[/red] {str(exc)}\n\n"
-            "[yellow]Debug tips:[/yellow]\n"
-            "  • Run: skillops health (check system status)\n"
-            f"  • Run: skillops import-data {file} --verbose (logs)\n"
-            "  • Check file is not corrupted",
-            title="[red]❌ Unexpected Error[/red]",
-            border_style="red",
-        )
-        console.print(error_panel)
-        raise typer.Exit(code=1) from exc
+    run_import_data(file=file, import_format=import_format, merge=merge)
 
 
 @app.command(name="check-books")
@@ -968,6 +722,8 @@ def check_books():
     Example:
         skillops check-books
     """
+    from src.lms.books import check_books_command
+
     check_books_command()
 
 
@@ -1000,6 +756,8 @@ def submit_books(
         skillops submit-books
         skillops submit-books --api-key "your-api-key"
     """
+    from src.lms.books import submit_books_command
+
     submit_books_command(api_key)
 
 
@@ -1039,6 +797,8 @@ def fetch_books(
         skillops fetch-books
         skillops fetch-books --book networking-sysadmins
     """
+    from src.lms.books import fetch_books_command
+
     fetch_books_command(api_key, book_name)
 
 
@@ -1090,6 +850,8 @@ def import_books(
         skillops import-books
         skillops import-books --vault ~/MyVault --book docker-deep-dive
     """
+    from src.lms.books import import_books_command
+
     import_books_command(vault_path, book_name)
 
 
@@ -1149,13 +911,80 @@ def process_pipeline(
         • PDFs in books/pending/ (for submit)
         • Valid OBSIDIAN_VAULT_PATH or .skillopsvault
     """
+    from src.lms.books import process_pipeline_command
+
     process_pipeline_command(api_key, watch, interval)
 
 
+def _command_name(info: typer.models.CommandInfo) -> str:
+    """Return the name typer gives a registered command."""
+    return info.name or info.callback.__name__.lower().replace("_", "-")
+
+
+def _help_text() -> str:
+    """Return the top-level help: usage and a one-line summary per command."""
+    summaries = {
+        _command_name(info): (info.help or inspect.getdoc(info.callback) or "")
+        .strip()
+        .partition("\n")[0]
+        for info in app.registered_commands
+    }
+    width = max(map(len, summaries))
+    lines = [
+        "Usage: skillops [OPTIONS] COMMAND [ARGS]...",
+        "",
+        f"  {app.info.help}",
+        "",
+        "Options:",
+        f"  {'--help':<{width}}  Show this message and exit.",
+        "",
+        "Commands:",
+    ]
+    lines += [f"  {name:<{width}}  {summaries[name]}" for name in sorted(summaries)]
+    return "\n".join(lines)
+
+
+def _sniff_subcommand(argv: Sequence[str]) -> Optional[str]:
+    """Return the subcommand named on the command line, if any."""
+    return next((arg for arg in argv if not arg.startswith("-")), None)
+
+
+def _app_for(argv: Sequence[str]) -> typer.Typer:
+    """Return an app holding only the invoked command.
+
+    Typer builds a click command for every registered command on each
+    run; a single-command app skips that. Help requests and unknown
+    commands get the full app so help text and errors are complete.
+    """
+    name = _sniff_subcommand(argv)
+    if name is None or "--help" in argv:
+        return app
+
+    for info in app.registered_commands:
+        if _command_name(info) == name:
+            single = typer.Typer(
+                name=app.info.name, help=app.info.help, add_completion=False
+            )
+            single.registered_callback = app.registered_callback
+            single.registered_commands = [info]
+            return single
+    return app
+
+
+def run(argv: Sequence[str]) -> None:
+    """Dispatch argv to the typer app; version probes are handled upstream."""
+    # Plain text: rendering typer's rich help panels costs more than the
+    # rest of the CLI startup. Command help is still rendered by typer.
+    if argv == ["--help"]:
+        print(_help_text())
+        return
+    _app_for(argv)()
+
+
 def main():
-    """Main entry point for console_scripts."""
-    app()
+    """Run the CLI through the console-script entry point."""
+    launcher.main()
 
 
 if __name__ == "__main__":
-    app()
+    main()
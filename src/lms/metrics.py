@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Any, Callable, Dict, Optional
 
 from src.lms.monitoring.metrics import MetricsCollector
 
 
+@lru_cache(maxsize=8)
+def _get_collector(storage_path: Optional[Path]) -> MetricsCollector:
+    """Return a collector per storage path, initialising its database once."""
+    return MetricsCollector(storage_path=storage_path)
+
+
 @dataclass
 class TimedOperation:
     """Simple record for an operation timing."""
@@ -29,7 +36,8 @@ def record_timed_operation(
     **kwargs: Any,
 ) -> TimedOperation:
     """Time a function and record metrics to the database."""
-    start = perf_counter()
+    meta = metadata if metadata is not None else {}
+    start_ns = perf_counter_ns()
     try:
         func(*args, **kwargs)
         success = True
@@ -37,20 +45,19 @@ def record_timed_operation(
         success = False
         raise
     finally:
-        duration = perf_counter() - start
-        collector = MetricsCollector(storage_path=storage_path)
-        collector.record_step_execution(
+        duration = (perf_counter_ns() - start_ns) / 1e9
+        _get_collector(storage_path).record_step_execution(
             step_id=name,
             duration_seconds=duration,
             success=success,
-            metadata=metadata or {},
+            metadata=meta,
         )
 
     return TimedOperation(
         name=name,
         duration_seconds=duration,
         success=success,
-        metadata=metadata or {},
+        metadata=meta,
     )
 
 
@@ -1,17 +1,65 @@
-"""SkillOps monitoring and observability modules."""
+"""SkillOps monitoring and observability modules.
 
-from src.lms.monitoring.alerter import EmailAlerter
-from src.lms.monitoring.alerter import WebhookAlerter
-from src.lms.monitoring.alerter import send_alert_from_aggregator
-from src.lms.monitoring.error_aggregator import ErrorAggregator
-from src.lms.monitoring.metrics import MetricsCollector
-from src.lms.monitoring.syslog_handler import setup_syslog_handler
+Submodules are imported on first attribute access (PEP 562), so that
+e.g. ``from src.lms.monitoring import MetricsCollector`` does not load
+the alerting stack (smtplib, email, requests).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.lms.monitoring.alerter import (
+        EmailAlerter,
+        PendingAlertBatcher,
+        WebhookAlerter,
+        schedule_alert_from_aggregator,
+        send_alert_from_aggregator,
+        send_alert_from_aggregator_async,
+    )
+    from src.lms.monitoring.error_aggregator import ErrorAggregator
+    from src.lms.monitoring.metrics import MetricsCollector, flush_metrics
+    from src.lms.monitoring.syslog_handler import setup_syslog_handler
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "EmailAlerter": "alerter",
+    "PendingAlertBatcher": "alerter",
+    "WebhookAlerter": "alerter",
+    "schedule_alert_from_aggregator": "alerter",
+    "send_alert_from_aggregator": "alerter",
+    "send_alert_from_aggregator_async": "alerter",
+    "ErrorAggregator": "error_aggregator",
+    "MetricsCollector": "metrics",
+    "flush_metrics": "metrics",
+    "setup_syslog_handler": "syslog_handler",
+}
 
 __all__ = [
     "EmailAlerter",
     "ErrorAggregator",
     "MetricsCollector",
+    "PendingAlertBatcher",
     "WebhookAlerter",
+    "flush_metrics",
+    "schedule_alert_from_aggregator",
     "send_alert_from_aggregator",
+    "send_alert_from_aggregator_async",
     "setup_syslog_handler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
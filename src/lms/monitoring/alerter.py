@@ -2,18 +2,60 @@
 
 from __future__ import annotations
 
+import atexit
 import os
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import escape
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
-import requests
 from src.lms.monitoring.error_aggregator import ErrorAggregator
 
+if TYPE_CHECKING:
+    import smtplib
+
+    import requests
+
+# Static parts of the HTML alert email; only the table rows vary
+_HTML_PREFIX = (
+    "<h2>SkillOps Monitoring Alert</h2>\n"
+    "<p>Critical errors detected in the past 24 hours.</p>\n"
+    "<table border='1' cellpadding='10'>\n"
+    "<tr><th>Step</th><th>Error Count</th><th>Types</th>\n"
+    "<th>Latest Message</th></tr>\n"
+)
+_HTML_SUFFIX = "</table>\n<p><em>Review logs with: journalctl -u skillops</em></p>"
+
+# An idle SMTP connection older than this is reopened rather than probed
+SMTP_REUSE_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _alert_env() -> Dict[str, str]:
+    """Snapshot the SKILLOPS_ALERT_* environment variables.
+
+    Read once per process; call ``_alert_env.cache_clear()`` after
+    changing them.
+    """
+    return {
+        name: value
+        for name, value in os.environ.items()
+        if name.startswith("SKILLOPS_ALERT_")
+    }
+
+
+def _getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Like os.getenv, for SKILLOPS_ALERT_* variables, from the snapshot."""
+    return _alert_env().get(name, default)
+
 
 class EmailAlerter:
     """Send email alerts for critical errors and metrics."""
@@ -42,42 +84,74 @@ class EmailAlerter:
             SKILLOPS_ALERT_SMTP_USER: SMTP username
             SKILLOPS_ALERT_SMTP_PASS: SMTP password
         """
-        self.smtp_host = os.getenv("SKILLOPS_ALERT_SMTP_HOST", smtp_host)
-        self.smtp_port = int(os.getenv("SKILLOPS_ALERT_SMTP_PORT", str(smtp_port)))
+        self.smtp_host = _getenv("SKILLOPS_ALERT_SMTP_HOST", smtp_host)
+        self.smtp_port = int(_getenv("SKILLOPS_ALERT_SMTP_PORT", str(smtp_port)))
         self.from_address = (
-            os.getenv("SKILLOPS_ALERT_FROM") or from_address or "skillops@localhost"
+            _getenv("SKILLOPS_ALERT_FROM") or from_address or "skillops@localhost"
         )
-        self.username = os.getenv("SKILLOPS_ALERT_SMTP_USER", username)
-        self.password = os.getenv("SKILLOPS_ALERT_SMTP_PASS", password)
+        self.username = _getenv("SKILLOPS_ALERT_SMTP_USER", username)
+        self.password = _getenv("SKILLOPS_ALERT_SMTP_PASS", password)
+        # Connection kept open across alerts, and when it was last used
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_ts = 0.0
+        # smtplib.SMTP is not thread-safe; alerts are sent from the pool
+        # worker and the batcher's timer thread
+        self._smtp_lock = threading.RLock()
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return a live SMTP connection, reusing the previous one if possible."""
+        import smtplib
+
+        now = time.monotonic()
+        if self._smtp is not None and now - self._smtp_ts <= SMTP_REUSE_SECONDS:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    self._smtp_ts = now
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+
+        self.close()
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
+        try:
+            if self.username and self.password:
+                # Authenticated SMTP; otherwise anonymous (localhost postfix, etc)
+                server.starttls()
+                server.login(self.username, self.password)
+        except BaseException:
+            server.close()
+            raise
+        self._smtp = server
+        self._smtp_ts = now
+        return server
+
+    def close(self) -> None:
+        """Close the cached SMTP connection, if any."""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+
+            import smtplib
+
+            server, self._smtp = self._smtp, None
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
 
     def _format_error_summary(self, summary: Dict[str, Dict[str, Any]]) -> str:
-        """Format error summary as HTML email body."""
-        html_parts = [
-            "<h2>SkillOps Monitoring Alert</h2>",
-            "<p>Critical errors detected in the past 24 hours.</p>",
-            "<table border='1' cellpadding='10'>",
-            "<tr><th>Step</th><th>Error Count</th><th>Types</th>",
-            "<th>Latest Message</th></tr>",
-        ]
-
-        for step_id, error_info in summary.items():
-            count = error_info.get("count", 0)
-            types = ", ".join(error_info.get("types", []))
-            message = error_info.get("sample_message", "")
-
-            html_parts.append(
-                f"<tr>"
-                f"<td>{step_id}</td>"
-                f"<td>{count}</td>"
-                f"<td>{types}</td>"
-                f"<td>{message[:100]}</td>"
-                f"</tr>"
-            )
+        """Format error summary as HTML email body.
 
-        html_parts.append("</table>")
-        html_parts.append("<p><em>Review logs with: journalctl -u skillops</em></p>")
-
-        return "\n".join(html_parts)
+        Fields are HTML-escaped, as messages come straight from exceptions.
+        """
+        rows = "".join(
+            f"<tr><td>{escape(step_id)}</td>"
+            f"<td>{error_info.get('count', 0)}</td>"
+            f"<td>{escape(', '.join(error_info.get('types', [])))}</td>"
+            f"<td>{escape(error_info.get('sample_message', '')[:100])}</td></tr>\n"
+            for step_id, error_info in summary.items()
+        )
+        return _HTML_PREFIX + rows + _HTML_SUFFIX
 
     def send_alert(
         self,
@@ -100,12 +174,17 @@ class EmailAlerter:
             SKILLOPS_ALERT_RECIPIENTS: Comma-separated list of recipients
         """
         if recipients is None:
-            recipients_str = os.getenv("SKILLOPS_ALERT_RECIPIENTS", "")
+            recipients_str = _getenv("SKILLOPS_ALERT_RECIPIENTS", "")
             recipients = [r.strip() for r in recipients_str.split(",") if r.strip()]
 
         if not recipients:
             return False
 
+        # Imported here: only needed once an email is actually sent
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         try:
             # Build email message
             msg = MIMEMultipart("alternative")
@@ -123,21 +202,13 @@ class EmailAlerter:
             msg.attach(text_part)
             msg.attach(html_part)
 
-            # Send email
-            if self.username and self.password:
-                # Authenticated SMTP
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
-                    server.starttls()
-                    server.login(self.username, self.password)
-                    server.send_message(msg)
-            else:
-                # Anonymous SMTP (localhost postfix, etc)
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
-                    server.send_message(msg)
-
+            # Send email; one SMTP conversation at a time
+            with self._smtp_lock:
+                self._get_connection().send_message(msg)
             return True
 
         except (smtplib.SMTPException, OSError) as e:
+            self.close()
             # Log error but don't crash
             print(
                 f"[ALERT] Failed to send email alert: {e}",
@@ -158,7 +229,23 @@ class WebhookAlerter:
         Environment Variables:
             SKILLOPS_ALERT_WEBHOOK_URL: Webhook endpoint
         """
-        self.webhook_url = webhook_url or os.getenv("SKILLOPS_ALERT_WEBHOOK_URL", "")
+        self.webhook_url = webhook_url or _getenv("SKILLOPS_ALERT_WEBHOOK_URL", "")
+        # Keep-alive session, created on first send
+        self._session: Optional[requests.Session] = None
+
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session, so repeated alerts reuse the connection."""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
+    def close(self) -> None:
+        """Close the HTTP session, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _format_slack_message(
         self, subject: str, errors: Dict[str, Any]
@@ -225,9 +312,11 @@ class WebhookAlerter:
         if not url:
             return False
 
+        import requests
+
         try:
             payload = self._format_slack_message(subject, errors)
-            response = requests.post(
+            response = self._get_session().post(
                 url,
                 json=payload,
                 timeout=5,
@@ -238,6 +327,34 @@ class WebhookAlerter:
             return False
 
 
+@lru_cache(maxsize=1)
+def _email_alerter() -> EmailAlerter:
+    """Return the process-wide email alerter, whose connection is reused."""
+    return EmailAlerter()
+
+
+@lru_cache(maxsize=1)
+def _webhook_alerter() -> WebhookAlerter:
+    """Return the process-wide webhook alerter, whose session is reused."""
+    return WebhookAlerter()
+
+
+def _close_alerters() -> None:
+    """Close the shared alerters' connections, if any were made."""
+    for alerter in (_email_alerter, _webhook_alerter):
+        if alerter.cache_info().currsize:
+            alerter().close()
+
+
+# Registered before the flushes below so that it runs after them at exit
+atexit.register(_close_alerters)
+
+# Alerts are pure network I/O; send them off the CLI thread, one at a time
+_ALERT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="skillops-alert")
+# Flush pending alerts before the interpreter exits
+atexit.register(_ALERT_POOL.shutdown, wait=True)
+
+
 def send_alert_from_aggregator(
     aggregator: ErrorAggregator,
     alert_type: str = "email",
@@ -251,26 +368,122 @@ def send_alert_from_aggregator(
     Returns:
         True if at least one alert sent successfully
     """
-    summary = aggregator.get_summary_by_step()
+    return _send_summary_alert(aggregator.get_summary_by_step(), alert_type)
+
+
+def _send_summary_alert(summary: Dict[str, Dict], alert_type: str) -> bool:
+    """Send an alert for an error summary taken from an aggregator.
+
+    Only the summary is passed to background threads: ErrorAggregator is
+    not thread-safe and keeps recording errors on the calling thread.
+    """
     if not summary:
         return False
 
     alerts_sent = False
 
     if alert_type in ("email", "both"):
-        emailer = EmailAlerter()
-        if emailer.send_alert(
+        if _email_alerter().send_alert(
             "SkillOps: Critical Errors Detected",
             summary,
         ):
             alerts_sent = True
 
     if alert_type in ("webhook", "both"):
-        webhooker = WebhookAlerter()
-        if webhooker.send_alert(
+        if _webhook_alerter().send_alert(
             "SkillOps: Critical Errors Detected",
             summary,
         ):
             alerts_sent = True
 
     return alerts_sent
+
+
+def send_alert_from_aggregator_async(
+    aggregator: ErrorAggregator,
+    alert_type: str = "email",
+) -> Future:
+    """Send an alert from the error aggregator in the background.
+
+    Returns immediately; pending alerts are flushed at interpreter exit.
+
+    Args:
+        aggregator: ErrorAggregator instance
+        alert_type: 'email', 'webhook', or 'both'
+
+    Returns:
+        Future resolving to the result of send_alert_from_aggregator
+    """
+    return _ALERT_POOL.submit(
+        _send_summary_alert, aggregator.get_summary_by_step(), alert_type
+    )
+
+
+class PendingAlertBatcher:
+    """Coalesce bursts of new errors into a single alert.
+
+    Each call to schedule() (re)starts a debounce timer and replaces the
+    pending summary, taken on the calling thread; when the timer fires,
+    one alert is sent with the latest summary, which already includes
+    every error recorded during the burst.
+    """
+
+    def __init__(self, delay_seconds: float = 5.0):
+        """Initialize the batcher.
+
+        Args:
+            delay_seconds: Quiet period before the pending alert is sent
+        """
+        self.delay_seconds = delay_seconds
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending: Optional[Tuple[Dict[str, Dict], str]] = None
+
+    def schedule(self, aggregator: ErrorAggregator, alert_type: str = "email") -> None:
+        """Queue an alert, extending the current debounce window."""
+        # Snapshot here: the timer thread must not read the aggregator while
+        # the caller keeps recording errors into it
+        summary = aggregator.get_summary_by_step()
+        with self._lock:
+            self._pending = (summary, alert_type)
+            if self._timer is not None:
+                self._timer.cancel()
+            # Daemon: a pending alert must not keep the CLI alive; flush()
+            # is also registered at exit
+            self._timer = threading.Timer(self.delay_seconds, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Send the pending alert now, if any.
+
+        Returns:
+            True if an alert was sent successfully
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if pending is None:
+            return False
+        return _send_summary_alert(*pending)
+
+
+_BATCHER = PendingAlertBatcher()
+atexit.register(_BATCHER.flush)
+
+
+def schedule_alert_from_aggregator(
+    aggregator: ErrorAggregator,
+    alert_type: str = "email",
+) -> None:
+    """Send a debounced alert from the error aggregator.
+
+    Several new errors within a few seconds result in a single alert.
+
+    Args:
+        aggregator: ErrorAggregator instance
+        alert_type: 'email', 'webhook', or 'both'
+    """
+    _BATCHER.schedule(aggregator, alert_type)
@@ -2,17 +2,60 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timedelta
-from hashlib import md5
+import time
+from bisect import bisect_right, insort
+from datetime import datetime
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from src.lms.json_utils import dump_json_bytes, json_loads
+
+# Errors older than this fall out of the deduplication window
+ERROR_WINDOW_SECONDS = 24 * 3600
+
+# The in-memory log is not re-pruned more often than this
+PRUNE_INTERVAL_SECONDS = 60
+
+# Occurrences kept per error for context; older ones in the window only
+# keep their timestamp, for the count
+RECENT_OCCURRENCES = 5
+
+# Appended occurrences after which the log is rewritten in full
+COMPACT_AFTER_APPENDS = 100
+
+
+def _jsonable(value: Any) -> Any:
+    """Coerce a context value to JSON-native types (unknown types -> str).
+
+    Done once when an error is recorded, so the log serializes without a
+    ``default`` fallback.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+def _file_state(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (size, mtime in ns) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
 
 
 class ErrorAggregator:
     """Aggregates and deduplicates errors to prevent alert spam.
 
     Same error within 24h window = single alert instead of multiple.
+    Each distinct error is stored as one summary entry holding the
+    timestamps of its occurrences in the window and only the last few full
+    occurrences, so the log does not grow with every context payload.
     """
 
     def __init__(self, storage_path: Optional[Path] = None):
@@ -28,46 +71,210 @@ class ErrorAggregator:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.error_log_file = self.storage_path / ".errors.json"
+        # Occurrences recorded since the last full rewrite, one per line
+        self.append_log_file = self.storage_path / ".errors.jsonl"
+        self._errors: Optional[Dict[str, Dict]] = None
+        self._appended = 0
+        # Bytes of the append log folded into self._errors, and the
+        # (size, mtime) of the JSON file it was loaded from; other
+        # processes (git hooks, a second CLI run) write the same files
+        self._append_offset = 0
+        self._log_state: Optional[Tuple[int, int]] = None
+        # time.monotonic() of the last prune of self._errors
+        self._last_pruned = float("-inf")
 
     def _compute_error_hash(self, error_type: str, step_id: str, message: str) -> str:
-        """Create hash fingerprint for error deduplication."""
+        """Create hash fingerprint for error deduplication.
+
+        Only used as a dictionary key, so a 64-bit digest is enough.
+        """
         fingerprint = f"{error_type}:{step_id}:{message}"
-        return md5(fingerprint.encode()).hexdigest()
+        return blake2b(fingerprint.encode(), digest_size=8).hexdigest()
 
-    def _load_errors(self) -> Dict[str, List[Dict]]:
-        """Load error log from JSON file."""
-        if not self.error_log_file.exists():
-            return {}
+    def _load_errors(self) -> Dict[str, Dict]:
+        """Load the error log, re-reading only what changed on disk.
 
+        Occurrences other processes appended since the last call are
+        folded into the cached log; a rewritten JSON file or a truncated
+        append log forces a full reload.
+        """
+        if self._errors is not None and (
+            _file_state(self.error_log_file) == self._log_state
+        ):
+            appended = _file_state(self.append_log_file)
+            size = appended[0] if appended else 0
+            if size == self._append_offset:
+                return self._errors
+            if size > self._append_offset:
+                self._read_appends(self._errors)
+                return self._errors
+
+        errors: Dict[str, Dict] = {}
+        self._log_state = _file_state(self.error_log_file)
         try:
-            with open(self.error_log_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-
-    def _save_errors(self, errors: Dict[str, List[Dict]]) -> None:
-        """Save error log to JSON file."""
-        with open(self.error_log_file, "w") as f:
-            json.dump(errors, f, indent=2, default=str)
-
-    def _prune_old_errors(self, errors: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
-        """Remove errors older than 24 hours."""
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        pruned = {}
+            errors = json_loads(self.error_log_file.read_bytes())
+        except (ValueError, OSError):
+            pass
+        migrated = self._migrate_legacy_errors(errors)
+
+        self._appended = 0
+        self._append_offset = 0
+        self._read_appends(errors)
+
+        if migrated:
+            # Rewrite once so later loads skip the conversion
+            self._save_errors(errors)
+        self._errors = errors
+        self._last_pruned = float("-inf")
+        return errors
+
+    def _read_appends(self, errors: Dict[str, Dict]) -> None:
+        """Fold complete lines appended past self._append_offset into errors."""
+        try:
+            with open(self.append_log_file, "rb") as f:
+                f.seek(self._append_offset)
+                data = f.read()
+        except OSError:
+            return
+        # A trailing partial line is still being written by another process
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                error_hash, occurrence = json_loads(line)
+            except ValueError:
+                continue  # Torn write from an interrupted process
+            self._add_occurrence(errors, error_hash, occurrence)
+            self._appended += 1
+        self._append_offset += end
+
+    def _save_errors(self, errors: Dict[str, Dict]) -> None:
+        """Rewrite the full error log, folding in appended occurrences.
+
+        Occurrences appended by other processes since the last read are
+        merged first, so removing the append log does not lose them.
+        """
+        self._read_appends(errors)
+        self.error_log_file.write_bytes(dump_json_bytes(errors))
+        self.append_log_file.unlink(missing_ok=True)
+        self._errors = errors
+        self._appended = 0
+        self._append_offset = 0
+        self._log_state = _file_state(self.error_log_file)
+        self._last_pruned = float("-inf")
+
+    def _append_error(self, error_hash: str, occurrence: Dict) -> None:
+        """Append one occurrence without rewriting the whole log."""
+        line = dump_json_bytes([error_hash, occurrence]) + b"\n"
+        with open(self.append_log_file, "ab") as f:
+            f.write(line)
+            end = f.tell()
+        self._appended += 1
+        if end - len(line) == self._append_offset:
+            self._append_offset = end
+        else:
+            # Another process appended in between; reload from disk so
+            # neither its lines nor ours are counted twice
+            self._errors = None
+
+    @staticmethod
+    def _add_occurrence(
+        errors: Dict[str, Dict], error_hash: str, occurrence: Dict
+    ) -> None:
+        """Fold one occurrence into the summary entry for its hash."""
+        timestamp = occurrence["timestamp"]
+        entry = errors.get(error_hash)
+        if entry is None:
+            errors[error_hash] = {
+                "count": 1,
+                "type": occurrence["type"],
+                "step_id": occurrence["step_id"],
+                "sample_message": occurrence["message"],
+                "first_seen": timestamp,
+                "last_seen": timestamp,
+                "occurrence_times": [timestamp],
+                "recent_occurrences": [occurrence],
+            }
+            return
+
+        # Kept sorted: other processes' appends may arrive out of order
+        times = entry["occurrence_times"]
+        insort(times, timestamp)
+        entry["count"] = len(times)
+        entry["first_seen"] = times[0]
+        entry["last_seen"] = times[-1]
+        recent = entry["recent_occurrences"]
+        recent.append(occurrence)
+        del recent[:-RECENT_OCCURRENCES]
+
+    @classmethod
+    def _migrate_legacy_errors(cls, errors: Dict[str, Any]) -> bool:
+        """Convert older logs (a list of every occurrence per hash) in place.
+
+        Occurrences whose timestamp cannot be read are dropped.
 
-        for error_hash, occurrences in errors.items():
-            recent = []
+        Returns:
+            True if any entry was converted
+        """
+        legacy = {
+            error_hash: occurrences
+            for error_hash, occurrences in errors.items()
+            if isinstance(occurrences, list)
+        }
+        for error_hash, occurrences in legacy.items():
+            del errors[error_hash]
             for occurrence in occurrences:
-                occurrence_time = datetime.fromisoformat(
-                    occurrence.get("timestamp", "")
-                )
-                if occurrence_time > cutoff_time:
-                    recent.append(occurrence)
-
-            if recent:
-                pruned[error_hash] = recent
+                if not isinstance(occurrence, dict):
+                    continue
+                occurrence.setdefault("type", "")
+                occurrence.setdefault("step_id", "")
+                occurrence.setdefault("message", "")
+                timestamp = occurrence.get("timestamp", 0.0)
+                try:
+                    if isinstance(timestamp, str):
+                        # Logs written before epoch timestamps store ISO strings
+                        timestamp = datetime.fromisoformat(timestamp).timestamp()
+                    timestamp = float(timestamp)
+                except (TypeError, ValueError):
+                    continue
+                occurrence["timestamp"] = timestamp
+                cls._add_occurrence(errors, error_hash, occurrence)
+        return bool(legacy)
+
+    def _prune_old_errors(self, errors: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Remove errors not seen in the past 24 hours.
+
+        Occurrences older than that are dropped from the remaining entries
+        (in place), so each count covers the window only.
+
+        Returns ``errors`` itself when no entry was removed, or when it is
+        the in-memory log and was pruned less than a minute ago.
+        """
+        if not errors:
+            return errors
+        is_cached = errors is self._errors
+        if is_cached and time.monotonic() - self._last_pruned < PRUNE_INTERVAL_SECONDS:
+            return errors
 
-        return pruned
+        cutoff_time = time.time() - ERROR_WINDOW_SECONDS
+        pruned = {}
+        for error_hash, entry in errors.items():
+            if entry["last_seen"] <= cutoff_time:
+                continue
+            times = entry["occurrence_times"]
+            if times[0] <= cutoff_time:
+                del times[: bisect_right(times, cutoff_time)]
+                entry["count"] = len(times)
+                entry["first_seen"] = times[0]
+                entry["recent_occurrences"] = [
+                    occurrence
+                    for occurrence in entry["recent_occurrences"]
+                    if occurrence["timestamp"] > cutoff_time
+                ]
+            pruned[error_hash] = entry
+
+        if is_cached:
+            self._last_pruned = time.monotonic()
+        return pruned if len(pruned) != len(errors) else errors
 
     def record_error(
         self,
@@ -91,67 +298,61 @@ class ErrorAggregator:
         message = str(error)
         error_hash = self._compute_error_hash(error_type, step_id, message)
 
-        errors = self._load_errors()
-        errors = self._prune_old_errors(errors)
+        loaded = self._load_errors()
+        errors = self._prune_old_errors(loaded)
 
         is_new = error_hash not in errors
-        if not errors.get(error_hash):
-            errors[error_hash] = []
-
         occurrence = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "type": error_type,
             "step_id": step_id,
             "message": message,
             "retry_count": retry_count,
-            "context": context or {},
+            "context": _jsonable(context) if context else {},
         }
-        errors[error_hash].append(occurrence)
-
-        self._save_errors(errors)
+        self._add_occurrence(errors, error_hash, occurrence)
+
+        # Append while the on-disk log is still accurate; rewrite it after
+        # pruning or once enough occurrences have piled up
+        if errors is loaded and self._appended < COMPACT_AFTER_APPENDS:
+            self._append_error(error_hash, occurrence)
+        else:
+            self._save_errors(errors)
         return is_new
 
-    def get_daily_summary(self) -> Dict[str, List[Dict]]:
-        """Get all errors from past 24 hours grouped by hash.
+    def get_daily_summary(self) -> Dict[str, Dict]:
+        """Get all errors seen in the past 24 hours, keyed by hash.
+
+        Counts and timestamps only cover occurrences within the window.
 
         Returns:
-            Dict of {error_hash: [occurrences]}
+            Dict of {error_hash: {count, type, step_id, sample_message,
+                                  first_seen, last_seen, occurrence_times,
+                                  recent_occurrences}}
         """
-        errors = self._load_errors()
-        return self._prune_old_errors(errors)
+        self._errors = self._prune_old_errors(self._load_errors())
+        return self._errors
 
     def get_summary_by_step(self) -> Dict[str, Dict]:
         """Get error summary grouped by step.
 
+        Reads each error's precomputed count, so this is O(distinct errors).
+
         Returns:
             Dict of {step_id: {count: int, types: [error_type],
-                               sample: str}}
+                               sample_message: str}}
         """
-        summary = {}
-        errors = self.get_daily_summary()
-
-        for error_hash, occurrences in errors.items():
-            if not occurrences:
-                continue
-
-            step_id = occurrences[0]["step_id"]
-            error_type = occurrences[0]["type"]
-            message = occurrences[0]["message"]
-            if step_id not in summary:
-                summary[step_id] = {
-                    "count": 0,
-                    "types": [],
-                    "sample_message": "",
-                }
-
-            count_val = summary[step_id]["count"]
-            assert isinstance(count_val, int)
-            summary[step_id]["count"] = count_val + len(occurrences)
-            types_list = summary[step_id]["types"]
-            assert isinstance(types_list, list)
-            if error_type not in types_list:
-                types_list.append(error_type)
-            summary[step_id]["sample_message"] = message
+        summary: Dict[str, Dict] = {}
+
+        for entry in self.get_daily_summary().values():
+            step = summary.setdefault(
+                entry["step_id"],
+                {"count": 0, "types": [], "sample_message": ""},
+            )
+            step["count"] += entry["count"]
+            if entry["type"] not in step["types"]:
+                step["types"].append(entry["type"])
+            step["sample_message"] = entry["sample_message"]
 
         return summary
 
@@ -165,8 +366,11 @@ class ErrorAggregator:
 
     def clear_errors(self) -> None:
         """Clear all recorded errors."""
-        if self.error_log_file.exists():
-            self.error_log_file.unlink()
+        self.error_log_file.unlink(missing_ok=True)
+        self.append_log_file.unlink(missing_ok=True)
+        self._errors = None
+        self._appended = 0
+        self._append_offset = 0
 
     def get_error_count(self) -> int:
         """Get total unique errors in 24h window."""
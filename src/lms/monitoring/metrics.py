@@ -2,13 +2,116 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import queue
+import threading
 from datetime import datetime, timedelta
-from statistics import mean, stdev
+from math import sqrt
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from src.lms.database import get_connection, init_db
+from src.lms.database import epoch_micros, get_connection, init_db
+
+logger = logging.getLogger(__name__)
+
+# Columns read back into execution dicts, in _execution_from_row order
+_EXECUTION_COLUMNS = (
+    "timestamp, step_id, duration_seconds, success, api_calls, "
+    "items_processed, metadata"
+)
+
+# Rows inserted per transaction by the background writer
+WRITE_BATCH_SIZE = 100
+
+# (storage_path, row) pairs waiting to be written; put() blocks when full
+_WRITE_QUEUE: "queue.Queue[Tuple[Optional[Path], tuple]]" = queue.Queue(maxsize=1024)
+_WRITER: Optional[threading.Thread] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def _execution_row(
+    step_id: str,
+    duration_seconds: float,
+    success: bool,
+    api_calls: int = 0,
+    items_processed: int = 0,
+    metadata: Optional[Dict] = None,
+) -> tuple:
+    """Build a performance_metrics row, timestamped now."""
+    return (
+        epoch_micros(),
+        step_id,
+        float(duration_seconds),
+        bool(success),
+        int(api_calls),
+        int(items_processed),
+        json.dumps(metadata or {}),
+    )
+
+
+def _insert_rows(storage_path: Optional[Path], rows: List[tuple]) -> None:
+    """Insert execution rows in a single transaction."""
+    conn = get_connection(storage_path)
+    try:
+        conn.executemany(
+            """
+            INSERT INTO performance_metrics
+            (timestamp, step_id, duration_seconds, success, api_calls, items_processed, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _drain() -> None:
+    """Write queued rows in batches, forever (runs on the writer thread)."""
+    while True:
+        batch = [_WRITE_QUEUE.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(_WRITE_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        by_path: Dict[Optional[Path], List[tuple]] = {}
+        for storage_path, row in batch:
+            by_path.setdefault(storage_path, []).append(row)
+        try:
+            for storage_path, rows in by_path.items():
+                _insert_rows(storage_path, rows)
+        except Exception:  # Metrics are best effort; keep the writer alive
+            logger.warning("Failed to write %d metric rows", len(batch), exc_info=True)
+        finally:
+            for _ in batch:
+                _WRITE_QUEUE.task_done()
+
+
+def _enqueue(storage_path: Optional[Path], row: tuple) -> None:
+    """Queue a row for the writer thread, starting it on first use."""
+    global _WRITER
+
+    if _WRITER is None:
+        with _WRITER_LOCK:
+            if _WRITER is None:
+                _WRITER = threading.Thread(
+                    target=_drain, name="skillops-metrics", daemon=True
+                )
+                _WRITER.start()
+    _WRITE_QUEUE.put((storage_path, row))
+
+
+def flush_metrics() -> None:
+    """Block until every queued execution has been written."""
+    _WRITE_QUEUE.join()
+
+
+# Daemon thread: make sure queued rows reach the database before exit
+atexit.register(flush_metrics)
 
 
 class MetricsCollector:
@@ -25,36 +128,28 @@ class MetricsCollector:
         self.storage_path = storage_path
         init_db(self.storage_path)
 
-    def _load_executions(self) -> list[dict]:
-        conn = get_connection(self.storage_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT timestamp, step_id, duration_seconds, success, api_calls, "
-            "items_processed, metadata FROM performance_metrics"
-        )
-        rows = cursor.fetchall()
-        conn.close()
+    @staticmethod
+    def _execution_from_row(row: tuple) -> dict:
+        """Build an execution dict from a _EXECUTION_COLUMNS row."""
+        metadata = {}
+        if row[6]:
+            try:
+                metadata = json.loads(row[6])
+            except json.JSONDecodeError:
+                metadata = {}
+        return {
+            "timestamp": datetime.fromtimestamp(row[0] / 1e6).isoformat(),
+            "step_id": row[1],
+            "duration_seconds": float(row[2]),
+            "success": bool(row[3]),
+            "api_calls": int(row[4] or 0),
+            "items_processed": int(row[5] or 0),
+            "metadata": metadata,
+        }
 
-        executions = []
-        for row in rows:
-            metadata = {}
-            if row[6]:
-                try:
-                    metadata = json.loads(row[6])
-                except json.JSONDecodeError:
-                    metadata = {}
-            executions.append(
-                {
-                    "timestamp": row[0],
-                    "step_id": row[1],
-                    "duration_seconds": float(row[2]),
-                    "success": bool(row[3]),
-                    "api_calls": int(row[4] or 0),
-                    "items_processed": int(row[5] or 0),
-                    "metadata": metadata,
-                }
-            )
-        return executions
+    def _load_executions(self) -> list[dict]:
+        rows = self._query(f"SELECT {_EXECUTION_COLUMNS} FROM performance_metrics")
+        return [self._execution_from_row(row) for row in rows]
 
     def _load_metrics(self) -> Dict[str, list]:
         """Backward-compatible wrapper for legacy tests."""
@@ -69,77 +164,99 @@ class MetricsCollector:
         items_processed: int = 0,
         metadata: Optional[Dict] = None,
     ) -> None:
-        """Record step execution metrics."""
-        conn = get_connection(self.storage_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO performance_metrics
-            (timestamp, step_id, duration_seconds, success, api_calls, items_processed, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                datetime.now().isoformat(),
+        """Record step execution metrics.
+
+        The row is written by a background thread; readers of this
+        collector see it, other code should call flush_metrics() first.
+        """
+        _enqueue(
+            self.storage_path,
+            _execution_row(
                 step_id,
-                float(duration_seconds),
-                bool(success),
-                int(api_calls),
-                int(items_processed),
-                json.dumps(metadata or {}),
+                duration_seconds,
+                success,
+                api_calls,
+                items_processed,
+                metadata,
             ),
         )
-        conn.commit()
-        conn.close()
+
+    def record_step_executions(self, executions: Iterable[tuple]) -> int:
+        """Record several step executions in a single transaction.
+
+        Args:
+            executions: Tuples of record_step_execution() arguments, i.e.
+                (step_id, duration_seconds, success[, api_calls,
+                items_processed, metadata])
+
+        Returns:
+            Number of executions written
+        """
+        rows = [_execution_row(*execution) for execution in executions]
+        if rows:
+            # Keep insertion order behind rows already queued
+            flush_metrics()
+            _insert_rows(self.storage_path, rows)
+        return len(rows)
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        """Run a read query against the metrics table, after queued writes."""
+        flush_metrics()
+        conn = get_connection(self.storage_path)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
 
     def get_daily_metrics(self, hours: int = 24) -> Dict[str, Dict]:
         """Get aggregated metrics for past N hours."""
         cutoff = datetime.now() - timedelta(hours=hours)
-        executions = [
-            e
-            for e in self._load_executions()
-            if datetime.fromisoformat(e["timestamp"]) > cutoff
-        ]
-
-        if not executions:
-            return {}
-
-        by_step: Dict[str, list] = {}
-        for execution in executions:
-            by_step.setdefault(execution["step_id"], []).append(execution)
+        rows = self._query(
+            "SELECT step_id, COUNT(*), SUM(success), AVG(duration_seconds), "
+            "MIN(duration_seconds), MAX(duration_seconds), "
+            "SUM(duration_seconds * duration_seconds), SUM(api_calls), "
+            "SUM(items_processed) "
+            "FROM performance_metrics WHERE timestamp > ? GROUP BY step_id",
+            (epoch_micros(cutoff),),
+        )
 
         stats = {}
-        for step_id, step_execs in by_step.items():
-            durations = [e["duration_seconds"] for e in step_execs]
-            successful = sum(1 for e in step_execs if e["success"])
-            total = len(step_execs)
-
+        for step_id, total, successful, avg, min_, max_, sum_sq, api, items in rows:
+            successful = int(successful or 0)
+            # Sample standard deviation from the sum of squares
+            variance = (sum_sq - total * avg * avg) / (total - 1) if total > 1 else 0
             stats[step_id] = {
                 "executions": total,
                 "successful": successful,
                 "failed": total - successful,
-                "success_rate": successful / total if total > 0 else 0,
-                "avg_duration_seconds": mean(durations) if durations else 0,
-                "min_duration_seconds": min(durations) if durations else 0,
-                "max_duration_seconds": max(durations) if durations else 0,
-                "std_dev_seconds": stdev(durations) if len(durations) > 1 else 0,
-                "total_api_calls": sum(e.get("api_calls", 0) for e in step_execs),
-                "total_items_processed": sum(
-                    e.get("items_processed", 0) for e in step_execs
-                ),
+                "success_rate": successful / total,
+                "avg_duration_seconds": avg,
+                "min_duration_seconds": min_,
+                "max_duration_seconds": max_,
+                "std_dev_seconds": sqrt(max(variance, 0.0)),
+                "total_api_calls": int(api or 0),
+                "total_items_processed": int(items or 0),
             }
 
         return stats
 
     def get_step_history(self, step_id: str, limit: int = 10) -> list:
-        """Get execution history for specific step."""
-        executions = [e for e in self._load_executions() if e["step_id"] == step_id]
-        return executions[-limit:][::-1]
+        """Get execution history for specific step, most recent first."""
+        rows = self._query(
+            f"SELECT {_EXECUTION_COLUMNS} FROM performance_metrics "
+            "WHERE step_id = ? ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (step_id, limit),
+        )
+        return [self._execution_from_row(row) for row in rows]
 
     def get_overall_stats(self) -> Dict:
         """Get overall application statistics."""
-        executions = self._load_executions()
+        ((total, successful, avg, api, items),) = self._query(
+            "SELECT COUNT(*), SUM(success), AVG(duration_seconds), "
+            "SUM(api_calls), SUM(items_processed) FROM performance_metrics"
+        )
 
-        if not executions:
+        if not total:
             return {
                 "total_executions": 0,
                 "total_successful": 0,
@@ -148,24 +265,20 @@ class MetricsCollector:
                 "avg_duration_seconds": 0,
             }
 
-        durations = [e["duration_seconds"] for e in executions]
-        successful = sum(1 for e in executions if e["success"])
-        total = len(executions)
-
+        successful = int(successful or 0)
         return {
             "total_executions": total,
             "total_successful": successful,
             "total_failed": total - successful,
-            "success_rate": successful / total if total > 0 else 0,
-            "avg_duration_seconds": mean(durations),
-            "total_api_calls": sum(e.get("api_calls", 0) for e in executions),
-            "total_items_processed": sum(
-                e.get("items_processed", 0) for e in executions
-            ),
+            "success_rate": successful / total,
+            "avg_duration_seconds": avg,
+            "total_api_calls": int(api or 0),
+            "total_items_processed": int(items or 0),
         }
 
     def clear_metrics(self) -> None:
         """Clear all recorded metrics."""
+        flush_metrics()
         conn = get_connection(self.storage_path)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM performance_metrics")
@@ -70,7 +70,7 @@ def setup_syslog_handler(
         # Syslog not available (e.g., on some systems or containers)
         # Graceful fallback: return logger without syslog
         # (caller should add file handler if needed)
-        logger.warning(f"Syslog not available ({e}): logging to stderr only")
+        logger.warning("Syslog not available (%s): logging to stderr only", e)
         return logger
 
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Any, Callable, Dict, List, Optional
 
 from src.lms.monitoring.metrics import MetricsCollector
@@ -75,9 +75,9 @@ class PerformanceMonitor:
         metadata: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        start = perf_counter()
+        start_ns = perf_counter_ns()
         result = func(*args, **kwargs)
-        duration = perf_counter() - start
+        duration = (perf_counter_ns() - start_ns) / 1e9
         alert = self.record_timing(
             name=name,
             duration_seconds=duration,
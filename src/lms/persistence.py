@@ -5,7 +5,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 
-from .database import get_connection, get_current_session_id, get_logical_date
+from .database import (
+    epoch_micros,
+    get_connection,
+    get_current_session_id,
+    get_logical_date,
+)
+from .monitoring.metrics import flush_metrics
 
 # --- Context Management ---
 
@@ -258,14 +264,16 @@ def get_step_durations_for_date(
     date_str: str, storage_path: Optional[Path] = None
 ) -> Dict[int, int]:
     """Return step execution durations (seconds) for a given date."""
+    day_start = datetime.strptime(date_str, "%Y-%m-%d")
+    flush_metrics()
     conn = get_connection(storage_path)
     cursor = conn.cursor()
     cursor.execute(
         "SELECT step_id, SUM(duration_seconds) "
         "FROM performance_metrics "
-        "WHERE date(timestamp) = ? AND step_id LIKE 'step_%' "
+        "WHERE timestamp >= ? AND timestamp < ? AND step_id LIKE 'step_%' "
         "GROUP BY step_id",
-        (date_str,),
+        (epoch_micros(day_start), epoch_micros(day_start + timedelta(days=1))),
     )
     rows = cursor.fetchall()
     conn.close()
@@ -6,13 +6,21 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from src.lms.database import get_connection
+from src.lms.database import (
+    code_session_insert_sql,
+    get_connection,
+    validate_commit_time,
+)
 
 
 def batch_insert_code_sessions(
     commits: Iterable[Dict[str, Any]], storage_path: Optional[Path] = None
 ) -> int:
-    """Insert multiple commit records in a single transaction."""
+    """Insert multiple commit records in a single transaction.
+
+    Returns:
+        Number of commits inserted (already-known hashes are skipped)
+    """
     rows = []
     for commit in commits:
         required = {
@@ -26,7 +34,7 @@ def batch_insert_code_sessions(
         if not required.issubset(commit.keys()):
             raise ValueError("Missing required commit fields")
         commit_time = str(commit["commit_time"])
-        commit_date = commit_time.split("T")[0]
+        validate_commit_time(commit_time)
         rows.append(
             (
                 commit["commit_hash"],
@@ -35,7 +43,6 @@ def batch_insert_code_sessions(
                 int(commit["files_changed"]),
                 int(commit["lines_added"]),
                 int(commit["lines_deleted"]),
-                commit_date,
             )
         )
 
@@ -44,17 +51,10 @@ def batch_insert_code_sessions(
 
     conn = get_connection(storage_path)
     cursor = conn.cursor()
-    cursor.executemany(
-        """
-        INSERT OR IGNORE INTO code_sessions
-        (commit_hash, commit_time, commit_msg, files_changed, lines_added, lines_deleted, date)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        rows,
-    )
+    cursor.executemany(code_session_insert_sql(conn), rows)
     conn.commit()
     conn.close()
-    return len(rows)
+    return max(cursor.rowcount, 0)
 
 
 def stream_tracking_summary(
@@ -358,7 +358,7 @@ class TestMetadataUpdate:
 class TestFetchBooksWithMocks:
     """Tests for fetch_completed_books with mocked API."""
 
-    @patch("src.lms.books.manager.genai.Client")
+    @patch("google.genai.Client")
     def test_fetch_completed_books_no_processing(
         self, mock_client_class, manager, capsys
     ):
@@ -368,7 +368,7 @@ class TestFetchBooksWithMocks:
         captured = capsys.readouterr()
         assert "No books currently processing" in captured.out
 
-    @patch("src.lms.books.manager.genai.Client")
+    @patch("google.genai.Client")
     def test_fetch_completed_books_with_specific_book(
         self, mock_client_class, manager, tmp_path, capsys
     ):
@@ -0,0 +1,111 @@
+"""Tests for exercise generator parsing and caching."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from src.lms.integrations.exercise_generator import ExerciseGenerator
+
+
+@pytest.fixture
+def generator():
+    """Create an exercise generator without a Gemini client."""
+    return ExerciseGenerator.__new__(ExerciseGenerator)
+
+
+EXERCISE_JSON = (
+    '{"title": "Docker", "objectives": "o", '
+    '"requirements": "r", "success_criteria": "s"}'
+)
+
+
+class TestParseExerciseResponse:
+    """Tests for ExerciseGenerator._parse_exercise_response."""
+
+    def test_plain_json(self, generator):
+        """Test parsing a bare JSON response."""
+        exercise = generator._parse_exercise_response(EXERCISE_JSON)
+        assert exercise["title"] == "Docker"
+
+    def test_fenced_json(self, generator):
+        """Test parsing a response wrapped in a ```json fence."""
+        exercise = generator._parse_exercise_response(
+            f"  ```json\n{EXERCISE_JSON}\n```  "
+        )
+        assert exercise["requirements"] == "r"
+
+    def test_unclosed_fence(self, generator):
+        """Test parsing a response with only an opening fence."""
+        exercise = generator._parse_exercise_response(f"```\n{EXERCISE_JSON}")
+        assert exercise["objectives"] == "o"
+
+    def test_invalid_json(self, generator):
+        """Test invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            generator._parse_exercise_response("```json\nnot json\n```")
+
+    def test_missing_field(self, generator):
+        """Test missing required field raises ValueError."""
+        with pytest.raises(ValueError, match="Missing required field"):
+            generator._parse_exercise_response('{"title": "x"}')
+
+
+class TestExerciseCache:
+    """Tests for exercise cache round-trip."""
+
+    def test_cache_round_trip(self, generator, tmp_path):
+        """Test cached exercises load back unchanged."""
+        content = {"title": "Débutant Docker", "hints": "EXPOSE"}
+        generator.cache_exercise("ex-1", content, tmp_path)
+
+        assert generator.load_cached_exercise("ex-1", tmp_path) == content
+
+    def test_missing_cache(self, generator, tmp_path):
+        """Test missing cache file returns None."""
+        assert generator.load_cached_exercise("missing", tmp_path) is None
+
+    def test_corrupt_cache(self, generator, tmp_path):
+        """Test corrupt cache file returns None."""
+        (tmp_path / "bad.json").write_bytes(b"{not json")
+        assert generator.load_cached_exercise("bad", tmp_path) is None
+
+
+class TestGenerateExerciseCache:
+    """Tests for prompt-hash caching in generate_exercise."""
+
+    def _make(self, response_text):
+        generator = ExerciseGenerator.__new__(ExerciseGenerator)
+        generator._memory_cache = {}
+        generator.client = MagicMock()
+        generator.client.models.generate_content.return_value = MagicMock(
+            text=response_text
+        )
+        return generator
+
+    def test_memory_cache_skips_gemini(self):
+        """Test identical requests only call Gemini once."""
+        generator = self._make(EXERCISE_JSON)
+
+        first = generator.generate_exercise("Docker", completion_count=1)
+        second = generator.generate_exercise("Docker", completion_count=1)
+
+        assert first == second
+        assert generator.client.models.generate_content.call_count == 1
+
+    def test_disk_cache_shared_across_instances(self, tmp_path):
+        """Test exercises persisted to cache_dir are reused by new instances."""
+        generator = self._make(EXERCISE_JSON)
+        generator.generate_exercise("Docker", cache_dir=tmp_path)
+
+        other = self._make("not json")
+        exercise = other.generate_exercise("Docker", cache_dir=tmp_path)
+
+        assert exercise["title"] == "Docker"
+        other.client.models.generate_content.assert_not_called()
+
+    def test_prompt_is_memoized(self):
+        """Test prompt building returns the cached string for equal inputs."""
+        first = ExerciseGenerator._build_exercise_prompt("K8s", "Avancé", "30min", 4)
+        second = ExerciseGenerator._build_exercise_prompt("K8s", "Avancé", "30min", 4)
+
+        assert first is second
+        assert "Expert" in first
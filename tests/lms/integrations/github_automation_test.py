@@ -174,3 +174,44 @@ def test_get_current_commit_invalid_path():
     automation = GitHubAutomation("token", "user")
     commit = automation.get_current_commit("/nonexistent/path")
     assert commit is None
+
+
+@patch("src.lms.integrations.github_automation.requests.post")
+def test_create_remote_repositories_preserves_order(mock_post):
+    """Test bulk creation returns one result per spec, in order."""
+
+    def fake_post(url, json, headers, timeout):
+        response = MagicMock()
+        if json["name"] == "broken":
+            response.status_code = 422
+            response.text = ""
+            return response
+        response.status_code = 201
+        response.json.return_value = {
+            "html_url": f"https://github.com/test_user/{json['name']}",
+            "clone_url": f"https://github.com/test_user/{json['name']}.git",
+            "ssh_url": f"git@github.com:test_user/{json['name']}.git",
+        }
+        return response
+
+    mock_post.side_effect = fake_post
+
+    automation = GitHubAutomation("token", "test_user")
+    results = automation.create_remote_repositories(
+        [
+            {"repo_name": "repo_a", "description": "A"},
+            {"repo_name": "broken"},
+            {"repo_name": "repo_c", "private": True},
+        ]
+    )
+
+    assert results[0]["html_url"].endswith("/repo_a")
+    assert results[1] is None
+    assert results[2]["html_url"].endswith("/repo_c")
+    assert mock_post.call_count == 3
+
+
+def test_create_remote_repositories_empty():
+    """Test bulk creation with no specs makes no requests."""
+    automation = GitHubAutomation("token", "test_user")
+    assert automation.create_remote_repositories([]) == []
@@ -1,9 +1,12 @@
 """Tests for learner profiler."""
 
+import os
+
 import pytest
 from src.lms.integrations.learner_profiler import (
     LearnerProfiler,
     LearnerLevel,
+    SkillAssessment,
 )
 
 
@@ -108,6 +111,28 @@ class TestLearnerProfiler:
         assert profile.current_level in [LearnerLevel.INTERMEDIATE, LearnerLevel.SENIOR]
         assert profile.overall_score >= 70
 
+    def test_evaluate_cohort_matches_single_evaluation(
+        self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
+    ):
+        """Test cohort evaluation keeps order and per-learner results."""
+        batch = [
+            {
+                "reinforce_stats": sample_reinforce_stats,
+                "anki_stats": sample_anki_stats,
+                "github_activity": sample_github_stats,
+            },
+            {"github_activity": {"username": "newbie"}},
+        ]
+
+        profiles = profiler.evaluate_cohort(batch)
+
+        expected = profiler.evaluate_learner_level(
+            sample_reinforce_stats, sample_anki_stats, sample_github_stats
+        )
+        assert [p.username for p in profiles] == ["testuser", "newbie"]
+        assert profiles[0].to_dict() == expected.to_dict()
+        assert profiles[1].overall_score == 40
+
     def test_save_and_load_profile(
         self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
     ):
@@ -124,6 +149,85 @@ class TestLearnerProfiler:
         assert loaded is not None
         assert loaded.username == "testuser"
         assert loaded.current_level == profile.current_level
+        assert loaded.skills == profile.skills
+        assert loaded.to_dict() == profile.to_dict()
+
+    def test_save_profiles_batch(
+        self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
+    ):
+        """Test batch saving writes every profile without temp leftovers."""
+        profiles = []
+        for name in ("alice", "bob"):
+            github = {**sample_github_stats, "username": name}
+            profiles.append(
+                profiler.evaluate_learner_level(
+                    sample_reinforce_stats, sample_anki_stats, github
+                )
+            )
+
+        assert profiler.save_profiles(profiles) is True
+
+        assert profiler.load_profile("alice").username == "alice"
+        assert profiler.load_profile("bob").username == "bob"
+        assert not list(profiler.storage_path.glob("*.tmp"))
+
+    def test_profile_synced_before_rename(
+        self,
+        profiler,
+        sample_reinforce_stats,
+        sample_anki_stats,
+        sample_github_stats,
+        monkeypatch,
+    ):
+        """Test the temporary file reaches disk before replacing the profile."""
+        profile = profiler.evaluate_learner_level(
+            sample_reinforce_stats, sample_anki_stats, sample_github_stats
+        )
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+        monkeypatch.setattr(
+            os, "fsync", lambda fd: (calls.append("fsync"), real_fsync(fd))[1]
+        )
+        monkeypatch.setattr(
+            os,
+            "replace",
+            lambda src, dst: (calls.append("replace"), real_replace(src, dst))[1],
+        )
+
+        assert profiler.save_profile(profile) is True
+
+        assert calls[:2] == ["fsync", "replace"]
+
+    def test_failed_write_keeps_old_profile(
+        self,
+        profiler,
+        sample_reinforce_stats,
+        sample_anki_stats,
+        sample_github_stats,
+        monkeypatch,
+    ):
+        """Test a failed write leaves the previous profile and no temp file."""
+        profile = profiler.evaluate_learner_level(
+            sample_reinforce_stats, sample_anki_stats, sample_github_stats
+        )
+        assert profiler.save_profile(profile) is True
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+
+        assert profiler.save_profile(profile) is False
+        assert not list(profiler.storage_path.glob("*.tmp"))
+        assert profiler.load_profile(profile.username) is not None
+
+    def test_load_profile_with_unexpected_fields(self, profiler):
+        """Test malformed profile files are rejected instead of raising."""
+        (profiler.storage_path / "broken.json").write_text(
+            '{"username": "broken", "unknown_field": 1}'
+        )
+
+        assert profiler.load_profile("broken") is None
 
     def test_is_ready_for_mission_yes(
         self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
@@ -227,6 +331,32 @@ class TestLearnerProfiler:
         assert len(profile.learning_gaps) > 0
         assert isinstance(profile.learning_gaps, list)
 
+    def test_learning_gaps_are_deterministic(self, profiler):
+        """Test gaps list sorted missing skills then weak skills in order."""
+        skills = [
+            SkillAssessment("Python", 90, 10, None, "high"),
+            SkillAssessment("Ansible", 30, 2, None, "low"),
+            SkillAssessment("Docker", 55, 5, None, "medium"),
+            SkillAssessment("Helm", 40, 1, None, "low"),
+        ]
+
+        gaps = profiler._identify_gaps({}, skills)
+
+        assert gaps == ["Bash", "CI/CD", "Git", "Ansible", "Docker"]
+
+    def test_skills_by_name_is_cached(
+        self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
+    ):
+        """Test the skill index is built once and reused."""
+        profile = profiler.evaluate_learner_level(
+            sample_reinforce_stats, sample_anki_stats, sample_github_stats
+        )
+
+        index = profile.skills_by_name
+
+        assert index is profile.skills_by_name
+        assert set(index) == {s.skill_name for s in profile.skills}
+
     def test_profile_serialization(
         self, profiler, sample_reinforce_stats, sample_anki_stats, sample_github_stats
     ):
@@ -243,6 +373,13 @@ class TestLearnerProfiler:
         assert "skills" in profile_dict
         assert isinstance(profile_dict["skills"], list)
 
+    def test_component_scores(self, profiler, sample_reinforce_stats):
+        """Test component scores, including the neutral default for no data."""
+        assert profiler._calculate_reinforce_score(sample_reinforce_stats) == 79
+        assert profiler._calculate_anki_score({"retention_rate": 78, "decks": 3}) == 79
+        assert profiler._calculate_github_score({"commits_per_week": 8}) == 4
+        assert profiler._calculate_github_score({}) == 50
+
     def test_score_to_level_boundaries(self, profiler):
         """Test score to level conversion at boundaries."""
         assert profiler._score_to_level(0) == LearnerLevel.JUNIOR
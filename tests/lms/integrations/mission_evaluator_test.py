@@ -1,5 +1,8 @@
 """Tests for mission evaluator."""
 
+import os
+from unittest.mock import MagicMock
+
 import pytest
 from src.lms.integrations.mission_evaluator import MissionEvaluator
 
@@ -48,6 +51,19 @@ class TestMissionEvaluator:
         assert MissionEvaluator.calculate_stars(75) == 4
         assert MissionEvaluator.calculate_stars(95) == 5
 
+    def test_score_boundaries(self):
+        """Test thresholds are inclusive upper bounds."""
+        assert MissionEvaluator.calculate_level_from_score(40) == "junior"
+        assert MissionEvaluator.calculate_level_from_score(41) == "intermediate"
+        assert MissionEvaluator.calculate_level_from_score(75) == "intermediate"
+        assert MissionEvaluator.calculate_level_from_score(76) == "senior"
+        assert [MissionEvaluator.calculate_stars(s) for s in (20, 21, 80, 81)] == [
+            1,
+            2,
+            4,
+            5,
+        ]
+
     def test_evaluation_response_parsing(self, evaluator):
         """Test parsing of evaluation response."""
         response_text = """{
@@ -93,6 +109,19 @@ class TestMissionEvaluator:
 
         assert parsed["overall_score"] == 75
 
+    def test_evaluation_response_parsing_with_prose(self, evaluator):
+        """Test parsing ignores text around the JSON object."""
+        response_text = (
+            'Here is the evaluation:\n```json\n{"overall_score": 64, '
+            '"feedback": "Uses ``` in text"}\n```\nGood luck!'
+        )
+
+        parsed = evaluator._parse_evaluation_response(response_text)
+
+        assert parsed["overall_score"] == 64
+        assert parsed["feedback"] == "Uses ``` in text"
+        assert parsed["stars"] == 1
+
     def test_evaluation_prompt_building(self, evaluator, sample_mission_spec):
         """Test evaluation prompt building."""
         project_info = {
@@ -145,6 +174,64 @@ class TestMissionEvaluator:
         assert stats["total_lines"] > 0
         assert stats["test_files"] >= 1
 
+    def test_walk_collects_nested_files(self, evaluator, tmp_path):
+        """Test a single walk returns file types and code stats together."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("a = 1\nb = 2\n")
+        (tmp_path / "src" / "test_app.py").write_text("def test_a():\n    pass\n")
+        (tmp_path / "Dockerfile").write_text("FROM python:3.12\n")
+
+        files, stats, _ = evaluator._walk(tmp_path)
+
+        assert files == {".py": 2, "no_extension": 1}
+        assert stats == {"total_lines": 5, "test_files": 1, "config_files": 1}
+
+    def test_line_count_skips_binaries(self, evaluator, tmp_path):
+        """Test only source files are counted, including unterminated lines."""
+        (tmp_path / "app.py").write_bytes(b"a = 1\nb = 2")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG\n\n\n\n")
+
+        stats = evaluator._analyze_code_stats(tmp_path)
+
+        assert stats["total_lines"] == 2
+
+    def test_walk_prunes_dependency_dirs(self, evaluator, tmp_path):
+        """Test VCS, dependency and hidden directories are not walked."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        for skipped in (".git", "node_modules/pkg", ".venv/lib", ".cache"):
+            (tmp_path / skipped).mkdir(parents=True)
+            (tmp_path / skipped / "vendored.js").write_text("a\nb\nc\n")
+
+        files, stats, _ = evaluator._walk(tmp_path)
+
+        assert files == {".py": 1}
+        assert stats["total_lines"] == 1
+
+    def test_walk_does_not_follow_symlinks(self, evaluator, tmp_path):
+        """Test linked directories and files are not traversed or counted."""
+        outside = tmp_path / "outside.py"
+        outside.write_text("a\nb\nc\n")
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        (project / "src" / "app.py").write_text("x = 1\n")
+        (project / "src" / "loop").symlink_to(project, target_is_directory=True)
+        (project / "linked.py").symlink_to(outside)
+
+        files, stats, _ = evaluator._walk(project)
+
+        assert files == {".py": 1}
+        assert stats["total_lines"] == 1
+
+    def test_walk_counts_large_projects_in_parallel(self, evaluator, tmp_path):
+        """Test projects above the pool threshold give the same totals."""
+        for i in range(250):
+            (tmp_path / f"mod_{i}.py").write_text("a = 1\nb = 2\n")
+
+        files, stats, _ = evaluator._walk(tmp_path)
+
+        assert files == {".py": 250}
+        assert stats["total_lines"] == 500
+
     def test_default_evaluation_on_parse_error(self, evaluator):
         """Test fallback evaluation on parse error."""
         bad_response = "This is not JSON {{{[ invalid"
@@ -154,3 +241,133 @@ class TestMissionEvaluator:
         assert "overall_score" in parsed
         assert parsed["overall_score"] == 50  # Default score
         assert "junior" in parsed["level_achieved"]
+
+
+class TestEvaluationCache:
+    """Tests for on-disk evaluation caching."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project = tmp_path / "project"
+        project.mkdir()
+        return project
+
+    @pytest.fixture
+    def cached_evaluator(self, tmp_path):
+        evaluator = MissionEvaluator(api_key="test-key", cache_dir=tmp_path / "cache")
+        evaluator.client = MagicMock()
+        evaluator.client.models.generate_content.return_value = MagicMock(
+            text='{"overall_score": 82, "feedback": "Solid"}'
+        )
+        return evaluator
+
+    def test_unchanged_project_uses_cache(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test re-evaluating an unchanged project skips Gemini."""
+        (project / "app.py").write_text("print('hi')\n")
+
+        first = cached_evaluator.evaluate_project(
+            str(project), sample_mission_spec, "junior"
+        )
+        second = cached_evaluator.evaluate_project(
+            str(project), sample_mission_spec, "junior"
+        )
+
+        assert first == second
+        assert first["overall_score"] == 82
+        assert cached_evaluator.client.models.generate_content.call_count == 1
+
+    def test_force_refresh_and_changes_bypass_cache(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test force_refresh and project changes trigger a new evaluation."""
+        (project / "app.py").write_text("print('hi')\n")
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+
+        cached_evaluator.evaluate_project(
+            str(project), sample_mission_spec, "junior", force_refresh=True
+        )
+        (project / "extra.py").write_text("x = 1\n")
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+
+        assert cached_evaluator.client.models.generate_content.call_count == 3
+
+    def test_edited_code_bypasses_cache(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test edits that keep file and line counts still re-evaluate."""
+        app = project / "app.py"
+        app.write_text("print('hi')\n")
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+
+        app.write_text("print('yo')\n")
+        os.utime(app, ns=(app.stat().st_atime_ns, app.stat().st_mtime_ns + 10**9))
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+
+        assert cached_evaluator.client.models.generate_content.call_count == 2
+
+    def test_parse_failure_not_cached(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test fallback evaluations are not written to the cache."""
+        cached_evaluator.client.models.generate_content.return_value = MagicMock(
+            text="not json"
+        )
+        (project / "app.py").write_text("print('hi')\n")
+
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+        cached_evaluator.evaluate_project(str(project), sample_mission_spec, "junior")
+
+        assert cached_evaluator.client.models.generate_content.call_count == 2
+
+    def test_empty_or_missing_project_skips_gemini(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test submissions without any files are scored locally."""
+        empty = cached_evaluator.evaluate_project(
+            str(project), sample_mission_spec, "junior"
+        )
+        missing = cached_evaluator.evaluate_project(
+            str(project / "nope"), sample_mission_spec, "junior"
+        )
+
+        assert empty["overall_score"] == 0
+        assert empty["feedback"] == "Empty project"
+        assert "not found" in missing["feedback"]
+        cached_evaluator.client.models.generate_content.assert_not_called()
+
+    def test_project_outside_code_allowlist_is_evaluated(
+        self, cached_evaluator, sample_mission_spec, project
+    ):
+        """Test languages without counted lines are still sent to Gemini."""
+        (project / "src").mkdir()
+        (project / "src" / "Main.java").write_text("class Main {}\n")
+        (project / "pom.xml").write_text("<project/>\n")
+
+        evaluation = cached_evaluator.evaluate_project(
+            str(project), sample_mission_spec, "junior"
+        )
+
+        assert evaluation["overall_score"] == 82
+        cached_evaluator.client.models.generate_content.assert_called_once()
+
+    def test_prompt_reused_for_same_inputs(
+        self, cached_evaluator, sample_mission_spec, project, monkeypatch
+    ):
+        """Test forced re-evaluations reuse the already built prompt."""
+        (project / "app.py").write_text("print('hi')\n")
+        calls = []
+        build = cached_evaluator._build_evaluation_prompt
+        monkeypatch.setattr(
+            cached_evaluator,
+            "_build_evaluation_prompt",
+            lambda *args: calls.append(args) or build(*args),
+        )
+
+        for _ in range(2):
+            cached_evaluator.evaluate_project(
+                str(project), sample_mission_spec, "junior", force_refresh=True
+            )
+
+        assert len(calls) == 1
@@ -1,7 +1,18 @@
 """Tests for mission generator."""
 
+from unittest.mock import MagicMock
+
 import pytest
-from src.lms.integrations.mission_generator import MissionGenerator
+from src.lms.integrations.mission_generator import (
+    AI_SUGGESTED_PREAMBLE,
+    PO_PREAMBLE,
+    MissionGenerator,
+)
+
+
+def _stream(*texts):
+    """Build a fake Gemini response stream yielding the given texts."""
+    return [MagicMock(text=text) for text in texts]
 
 
 @pytest.fixture
@@ -73,6 +84,22 @@ class TestMissionGenerator:
         assert is_feasible is False
         assert len(missing) > 0
 
+    def test_validate_mission_feasibility_skips_known_skills(self, generator):
+        """Test skills the learner has are matched case-insensitively."""
+        mission = {
+            "learning_needs": [
+                {"skill": "Kubernetes", "priority": "high"},
+                {"skill": "terraform", "priority": "high"},
+            ],
+        }
+
+        is_feasible, missing = generator.validate_mission_feasibility(
+            mission, iter(["TERRAFORM", "Docker"])
+        )
+
+        assert is_feasible is True
+        assert missing == ["Kubernetes"]
+
     def test_mission_response_parsing(self, generator):
         """Test parsing of mission response."""
         response_text = """{
@@ -114,6 +141,56 @@ class TestMissionGenerator:
         assert parsed["project_name"] == "Test Project"
         assert parsed["estimated_hours"] == 20
 
+    def test_mission_response_parsing_ignores_trailing_text(self, generator):
+        """Test text after the closing fence is dropped."""
+        response_text = '```\n{"project_name": "Fenced"}\n```\nGood luck!'
+
+        parsed = generator._parse_mission_response(response_text)
+
+        assert parsed["project_name"] == "Fenced"
+
+    def test_mission_response_normalizes_learning_needs(self, generator):
+        """Test bare skill names become learning need dicts."""
+        response_text = (
+            '{"project_name": "P", "learning_needs": '
+            '["Terraform", {"skill": "AWS", "priority": "high", "hours": 5}]}'
+        )
+
+        parsed = generator._parse_mission_response(response_text)
+
+        assert parsed["learning_needs"] == [
+            {"skill": "Terraform", "priority": "low"},
+            {"skill": "AWS", "priority": "high", "hours": 5},
+        ]
+        assert parsed["tech_stack"] == []
+
+    def test_mission_response_accepts_named_learning_needs(self, generator):
+        """Test learning needs keyed by name instead of skill are accepted."""
+        response_text = (
+            '{"project_name": "P", "learning_needs": [{"name": "Terraform"}]}'
+        )
+
+        parsed = generator._parse_mission_response(response_text)
+
+        assert parsed["project_name"] == "P"
+        assert parsed["learning_needs"][0]["skill"] == "Terraform"
+        assert parsed["learning_needs"][0]["priority"] == "low"
+
+    def test_mission_response_splits_string_tech_stack(self, generator):
+        """Test comma-separated strings are accepted for list fields."""
+        response_text = '{"project_name": "P", "tech_stack": "Python, Docker"}'
+
+        parsed = generator._parse_mission_response(response_text)
+
+        assert parsed["project_name"] == "P"
+        assert parsed["tech_stack"] == ["Python", "Docker"]
+
+    def test_mission_response_missing_name_falls_back(self, generator):
+        """Test responses that do not match the schema use the default mission."""
+        parsed = generator._parse_mission_response('{"tech_stack": ["Go"]}')
+
+        assert parsed["project_name"] == "Default Project"
+
     def test_ai_suggested_prompt_building(self, generator):
         """Test AI-suggested prompt building."""
         role_info = MissionGenerator.ROLES["cloud_engineer"]
@@ -124,7 +201,7 @@ class TestMissionGenerator:
         assert "cloud_engineer" in prompt.lower() or "cloud" in prompt.lower()
         assert "intermediate" in prompt.lower()
         assert "Docker" in prompt
-        assert "JSON" in prompt
+        assert "JSON" in AI_SUGGESTED_PREAMBLE
 
     def test_po_prompt_building(self, generator):
         """Test Product Owner prompt building."""
@@ -135,4 +212,132 @@ class TestMissionGenerator:
         assert "backend" in prompt.lower()
         assert "junior" in prompt.lower()
         assert "REST API" in prompt
-        assert "JSON" in prompt
+        assert "JSON" in PO_PREAMBLE
+
+
+class TestMissionCache:
+    """Tests for Gemini response caching."""
+
+    @pytest.fixture
+    def cached_generator(self, tmp_path):
+        generator = MissionGenerator(
+            api_key="test-key",
+            cache_dir=tmp_path / "cache",
+            cache={},
+        )
+        generator.client = MagicMock()
+        generator.client.models.generate_content_stream.return_value = _stream(
+            '{"project_name": "Cached", "estimated_hours": 10}'
+        )
+        return generator
+
+    def test_repeat_request_uses_cache(self, cached_generator):
+        """Test identical requests call Gemini once, regardless of skill order."""
+        first = cached_generator.generate_mission("sre", "junior", ["Docker", "Git"])
+        second = cached_generator.generate_mission("sre", "junior", ["Git", "Docker"])
+
+        assert first == second
+        assert first["project_name"] == "Cached"
+        assert cached_generator.client.models.generate_content_stream.call_count == 1
+
+    def test_streamed_chunks_joined_and_reported(self, cached_generator):
+        """Test streamed pieces are reassembled and passed to on_chunk."""
+        cached_generator.client.models.generate_content_stream.return_value = _stream(
+            '{"project_name": ', "", '"Streamed"}'
+        )
+        seen = []
+
+        mission = cached_generator.generate_mission(
+            "sre", "junior", [], on_chunk=seen.append
+        )
+
+        assert mission["project_name"] == "Streamed"
+        assert seen == ['{"project_name": ', '"Streamed"}']
+
+    def test_disk_cache_survives_new_instance(self, cached_generator, tmp_path):
+        """Test a fresh generator reads responses persisted by another."""
+        cached_generator.generate_mission("sre", "junior", ["Docker"])
+
+        other = MissionGenerator(api_key="test-key", cache_dir=tmp_path / "cache")
+        other.client = MagicMock()
+        mission = other.generate_mission("sre", "junior", ["Docker"])
+
+        assert mission["project_name"] == "Cached"
+        other.client.models.generate_content_stream.assert_not_called()
+
+    def test_expired_or_forced_requests_call_gemini(self, tmp_path):
+        """Test force_refresh and expired disk entries bypass the cache."""
+        generator = MissionGenerator(
+            api_key="test-key",
+            cache_dir=tmp_path / "cache",
+            cache_ttl=-1,
+        )
+        generator.client = MagicMock()
+        generator.client.models.generate_content_stream.return_value = _stream(
+            '{"project_name": "Fresh"}'
+        )
+
+        generator.generate_mission("sre", "junior", [])
+        generator.cache.clear()
+        generator.generate_mission("sre", "junior", [])
+        generator.generate_mission("sre", "junior", [], force_refresh=True)
+
+        assert generator.client.models.generate_content_stream.call_count == 3
+
+    def test_unparseable_response_not_cached(self, cached_generator):
+        """Test fallback missions are regenerated on the next request."""
+        cached_generator.client.models.generate_content_stream.return_value = _stream(
+            "not json"
+        )
+
+        cached_generator.generate_mission("sre", "junior", [])
+        cached_generator.generate_mission("sre", "junior", [])
+
+        assert cached_generator.client.models.generate_content_stream.call_count == 2
+
+    def test_invalid_schema_not_cached(self, cached_generator):
+        """Test valid JSON that fails validation is not cached either."""
+        cached_generator.client.models.generate_content_stream.return_value = _stream(
+            '{"learning_needs": []}'
+        )
+
+        mission = cached_generator.generate_mission("sre", "junior", [])
+        cached_generator.generate_mission("sre", "junior", [])
+
+        assert mission["project_name"] == "Default Project"
+        assert cached_generator.client.models.generate_content_stream.call_count == 2
+
+
+class TestBatchGeneration:
+    """Tests for concurrent mission generation."""
+
+    def test_batch_preserves_order(self, tmp_path):
+        """Test missions come back in spec order."""
+        generator = MissionGenerator(api_key="test-key", cache_dir=tmp_path)
+        generator.client = MagicMock()
+        generator.client.models.generate_content_stream.side_effect = (
+            lambda **kwargs: _stream('{"project_name": "P"}')
+        )
+        specs = [
+            {"role": role, "learner_level": "junior", "learner_skills": []}
+            for role in ("sre", "cloud_engineer", "devops_engineer")
+        ]
+
+        missions = generator.generate_missions_batch(specs)
+
+        assert [m["role"] for m in missions] == [
+            "sre",
+            "cloud_engineer",
+            "devops_engineer",
+        ]
+        assert generator.client.models.generate_content_stream.call_count == 3
+
+    def test_batch_empty_and_invalid(self, tmp_path):
+        """Test empty batches are a no-op and bad specs raise."""
+        generator = MissionGenerator(api_key="test-key", cache_dir=tmp_path)
+
+        assert generator.generate_missions_batch([]) == []
+        with pytest.raises(ValueError):
+            generator.generate_missions_batch(
+                [{"role": "wizard", "learner_level": "junior", "learner_skills": []}]
+            )
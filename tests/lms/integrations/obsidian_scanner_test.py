@@ -45,6 +45,18 @@ def test_obsidian_scanner_scan_vault_with_files(tmp_path):
     assert len(files) == 3
 
 
+def test_obsidian_scanner_scan_vault_skips_hidden_dirs(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "note.md").write_text("content")
+    for hidden in (".obsidian", ".trash", "node_modules/pkg"):
+        (vault / hidden).mkdir(parents=True)
+        (vault / hidden / "ignored.md").write_text("content")
+
+    scanner = ObsidianScanner(str(vault))
+    assert scanner.scan_vault() == [vault / "note.md"]
+
+
 def test_extract_flashcards_from_file_q_a_format(tmp_path):
     vault = tmp_path / "vault"
     vault.mkdir()
@@ -68,6 +80,33 @@ A: Container orchestration system
     assert cards[1].question == "What is Kubernetes?"
 
 
+def test_extract_flashcards_mixed_formats_deduplicated(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    note_file = vault / "mixed.md"
+    note_file.write_text(
+        """#flashcard
+Q: What is Docker?
+A: Containers
+
+Q:: What is Kubernetes?
+A:: Orchestration
+
+Terraform:: IaC tool
+Q: What is Docker?
+A: Containers
+"""
+    )
+
+    scanner = ObsidianScanner(str(vault))
+    cards = scanner.extract_flashcards_from_file(note_file)
+    assert [(c.question, c.answer) for c in cards] == [
+        ("What is Docker?", "Containers"),
+        ("What is Kubernetes?", "Orchestration"),
+        ("Terraform", "IaC tool"),
+    ]
+
+
 def test_extract_flashcards_ignores_files_without_tag(tmp_path):
     vault = tmp_path / "vault"
     vault.mkdir()
@@ -83,6 +122,18 @@ A: A containerization platform
     assert len(cards) == 0
 
 
+def test_extract_flashcards_tag_is_case_insensitive(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    note_file = vault / "notes.md"
+    note_file.write_text("#FlashCard\nQ: Qué es Docker?\nA: Contenedores\n")
+
+    scanner = ObsidianScanner(str(vault))
+    cards = scanner.extract_flashcards_from_file(note_file)
+    assert [c.question for c in cards] == ["Qué es Docker?"]
+    assert scanner.extract_flashcards_from_file(vault / "missing.md") == []
+
+
 def test_extract_all_flashcards(tmp_path):
     vault = tmp_path / "vault"
     vault.mkdir()
@@ -92,3 +143,18 @@ def test_extract_all_flashcards(tmp_path):
     scanner = ObsidianScanner(str(vault))
     cards = scanner.extract_all_flashcards()
     assert len(cards) == 2
+
+
+def test_extract_all_flashcards_large_vault(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    for i in range(150):
+        (vault / f"note{i:03}.md").write_text(f"#flashcard\nQ: Q{i}\nA: A{i}\n")
+
+    scanner = ObsidianScanner(str(vault))
+    cards = scanner.extract_all_flashcards()
+
+    assert len(cards) == 150
+    assert [c.question for c in cards] == [
+        f"Q{int(p.stem[4:])}" for p in scanner.scan_vault()
+    ]
@@ -25,7 +25,7 @@ def test_send_message_success(monkeypatch):
         assert json["text"] == "hello"
         return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr(client._session, "post", fake_post)
 
     assert client.send_message("hello") is True
 
@@ -37,6 +37,81 @@ def test_test_connection_success(monkeypatch):
         assert "getMe" in url
         return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(client._session, "get", fake_get)
 
     assert client.test_connection() is True
+
+
+def test_session_reused_and_closed(monkeypatch):
+    calls = []
+
+    def fake_post(url, json, timeout):
+        calls.append(url)
+        return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
+
+    closed = []
+    with TelegramClient(token="abc", chat_id="1") as client:
+        monkeypatch.setattr(client._session, "post", fake_post)
+        monkeypatch.setattr(client._session, "close", lambda: closed.append(True))
+        assert client.send_message("one") is True
+        assert client.send_message("two") is True
+        adapter = client._session.get_adapter("https://api.telegram.org")
+        assert adapter.max_retries.total == 3
+
+    assert len(calls) == 2
+    assert closed == [True]
+
+
+def test_send_many_returns_results_in_order(monkeypatch):
+    client = TelegramClient(token="abc", chat_id="1")
+
+    def fake_post(url, json, timeout):
+        return SimpleNamespace(
+            status_code=200, json=lambda: {"ok": json["text"] != "bad"}
+        )
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    assert client.send_many(["a", "bad", "c"]) == [True, False, True]
+    assert client.send_many([]) == []
+
+
+def test_send_digest_packs_lines(monkeypatch):
+    client = TelegramClient(token="abc", chat_id="1")
+    sent = []
+
+    def fake_post(url, json, timeout):
+        sent.append(json["text"])
+        assert json["parse_mode"] == "Markdown"
+        return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    assert client.send_digest(["a", "b", "c"]) is True
+    assert sent == ["a\n\nb\n\nc"]
+
+    sent.clear()
+    assert client.send_digest(["x" * 3000, "y" * 3000, "z" * 9000]) is True
+    assert [len(text) for text in sent] == [3000, 3000, 4000, 4000, 1000]
+    assert all(len(text) <= 4096 for text in sent)
+
+
+def test_send_digest_splits_formatted_line_on_whitespace(monkeypatch):
+    client = TelegramClient(token="abc", chat_id="1")
+    sent = []
+
+    def fake_post(url, json, timeout):
+        sent.append((json["text"], json.get("parse_mode")))
+        return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+    words = " ".join(["word"] * 1200)
+    line = f"*Report* {words} *{words}*"
+
+    assert client.send_digest([line]) is True
+
+    texts = [text for text, _ in sent]
+    assert all(len(text) <= 4000 for text in texts)
+    assert " ".join(texts) == line
+    # Pieces opening or closing the split bold entity are sent without Markdown
+    assert [mode for _, mode in sent] == ["Markdown", None, "Markdown", None]
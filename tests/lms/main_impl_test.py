@@ -0,0 +1,71 @@
+"""Tests for the CLI command implementations."""
+
+from unittest.mock import patch
+
+import pytest
+from src.lms._main_impl import _aggregator, _alert_type, _metrics, _monitored
+
+
+@pytest.fixture
+def monitoring():
+    """Patch the monitoring classes imported by _monitored."""
+    with patch("src.lms.monitoring.ErrorAggregator") as aggregator:
+        with patch("src.lms.monitoring.MetricsCollector") as metrics:
+            with patch("src.lms.monitoring.schedule_alert_from_aggregator") as alert:
+                for cached in (_aggregator, _alert_type, _metrics):
+                    cached.cache_clear()
+                yield aggregator.return_value, metrics.return_value, alert
+    for cached in (_aggregator, _metrics):
+        cached.cache_clear()
+
+
+class TestMonitored:
+    """Tests for step monitoring."""
+
+    def test_disabled_does_no_bookkeeping(self, monitoring):
+        """Test nothing is recorded when monitoring is off."""
+        aggregator, metrics, alert = monitoring
+
+        with _monitored("notify", False, metadata={}) as run:
+            run.success = True
+
+        metrics.record_step_execution.assert_not_called()
+        aggregator.record_error.assert_not_called()
+
+    def test_records_duration_and_success(self, monitoring):
+        """Test metrics are recorded with the step outcome."""
+        _, metrics, alert = monitoring
+
+        with _monitored("notify", True, metadata={"respect_schedule": False}) as run:
+            run.success = True
+
+        step_id, duration, success = metrics.record_step_execution.call_args.args
+        assert (step_id, success) == ("notify", True)
+        assert duration >= 0
+        alert.assert_not_called()
+
+    def test_reported_error_sends_alert(self, monitoring):
+        """Test an error set on the run is recorded and alerted once new."""
+        aggregator, metrics, alert = monitoring
+        aggregator.record_error.return_value = True
+        error = RuntimeError("share_step returned False")
+
+        with _monitored("share", True, metadata={}, context={"labs_path": None}) as run:
+            run.error = error
+
+        aggregator.record_error.assert_called_once_with(
+            error, "share", context={"labs_path": None}
+        )
+        alert.assert_called_once()
+        assert metrics.record_step_execution.call_args.args[2] is False
+
+    def test_raised_error_is_recorded_and_propagates(self, monitoring):
+        """Test exceptions are recorded, then re-raised."""
+        aggregator, _, _ = monitoring
+        aggregator.record_error.return_value = False
+
+        with pytest.raises(ValueError):
+            with _monitored("notify", True, metadata={}):
+                raise ValueError("boom")
+
+        assert isinstance(aggregator.record_error.call_args.args[0], ValueError)
@@ -0,0 +1,33 @@
+"""Tests for the timed operation helpers."""
+
+from unittest.mock import patch
+
+import pytest
+from src.lms.metrics import _get_collector, record_timed_operation
+
+
+def test_record_timed_operation_reuses_collector(tmp_path):
+    _get_collector.cache_clear()
+    with patch("src.lms.metrics.MetricsCollector") as collector_cls:
+        first = record_timed_operation("create", lambda: None, storage_path=tmp_path)
+        record_timed_operation("create", lambda: None, storage_path=tmp_path)
+
+    collector_cls.assert_called_once_with(storage_path=tmp_path)
+    assert collector_cls.return_value.record_step_execution.call_count == 2
+    assert first.success is True
+    assert first.metadata == {}
+    _get_collector.cache_clear()
+
+
+def test_record_timed_operation_records_failure(tmp_path):
+    _get_collector.cache_clear()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        record_timed_operation("share", fail, storage_path=tmp_path)
+
+    stats = _get_collector(tmp_path).get_overall_stats()
+    assert stats["total_failed"] == 1
+    _get_collector.cache_clear()
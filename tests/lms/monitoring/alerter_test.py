@@ -1,16 +1,33 @@
 """Tests for alerting modules."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 from src.lms.monitoring.alerter import (
+    _alert_env,
+    _email_alerter,
+    _webhook_alerter,
     EmailAlerter,
+    PendingAlertBatcher,
     WebhookAlerter,
     send_alert_from_aggregator,
+    send_alert_from_aggregator_async,
 )
 from src.lms.monitoring.error_aggregator import ErrorAggregator
 
 
+@pytest.fixture(autouse=True)
+def fresh_alert_env():
+    """Re-read the alert environment variables in every test."""
+    for cached in (_alert_env, _email_alerter, _webhook_alerter):
+        cached.cache_clear()
+    yield
+    for cached in (_alert_env, _email_alerter, _webhook_alerter):
+        cached.cache_clear()
+
+
 class TestEmailAlerter:
     """Tests for email alerting."""
 
@@ -25,6 +42,17 @@ class TestEmailAlerter:
         assert alerter.from_address == "alerts@example.com"
         assert alerter.smtp_port == 25
 
+    def test_alert_env_read_once(self, monkeypatch):
+        """Test environment variables are snapshotted on first use."""
+        monkeypatch.setenv("SKILLOPS_ALERT_SMTP_HOST", "mail.example.com")
+        assert EmailAlerter().smtp_host == "mail.example.com"
+
+        monkeypatch.setenv("SKILLOPS_ALERT_SMTP_HOST", "other.example.com")
+        assert EmailAlerter().smtp_host == "mail.example.com"
+
+        _alert_env.cache_clear()
+        assert EmailAlerter().smtp_host == "other.example.com"
+
     @patch.dict(
         "os.environ",
         {
@@ -65,11 +93,26 @@ class TestEmailAlerter:
         assert "ValueError" in html
         assert "journalctl" in html
 
+    def test_format_error_summary_escapes_fields(self):
+        """Test exception text cannot inject markup into the email."""
+        alerter = EmailAlerter()
+        summary = {
+            "share": {
+                "count": 1,
+                "types": ["ValueError"],
+                "sample_message": "<script>alert(1)</script>",
+            }
+        }
+
+        html = alerter._format_error_summary(summary)
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+
     @patch("smtplib.SMTP")
     def test_send_email_alert_localhost(self, mock_smtp):
         """Test sending email via localhost SMTP."""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
 
         alerter = EmailAlerter()
         summary = {
@@ -92,8 +135,7 @@ class TestEmailAlerter:
     @patch("smtplib.SMTP")
     def test_send_email_alert_authenticated(self, mock_smtp):
         """Test sending email with SMTP authentication."""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
 
         alerter = EmailAlerter(
             username="user@example.com",
@@ -117,8 +159,7 @@ class TestEmailAlerter:
     @patch("smtplib.SMTP")
     def test_send_email_alert_from_env(self, mock_smtp):
         """Test email recipients from environment variable."""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
 
         alerter = EmailAlerter()
         result = alerter.send_alert(
@@ -128,6 +169,67 @@ class TestEmailAlerter:
         assert result is True
         mock_server.send_message.assert_called_once()
 
+    @patch("smtplib.SMTP")
+    def test_smtp_connection_reused(self, mock_smtp):
+        """Test consecutive alerts share one live SMTP connection."""
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+        alerter = EmailAlerter(username="user@example.com", password="secret")
+        summary = {"test": {"count": 1, "types": ["Error"], "sample_message": ""}}
+
+        for _ in range(2):
+            alerter.send_alert("Test", summary, recipients=["admin@example.com"])
+        alerter.close()
+
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_concurrent_alerts_serialize_smtp(self, mock_smtp):
+        """Test alerts from several threads never share the session at once."""
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+        active, overlaps = [], []
+
+        def send_message(msg):
+            active.append(msg)
+            if len(active) > 1:
+                overlaps.append(msg)
+            threading.Event().wait(0.01)
+            active.remove(msg)
+
+        mock_server.send_message.side_effect = send_message
+        alerter = EmailAlerter()
+        summary = {"test": {"count": 1, "types": ["Error"], "sample_message": ""}}
+        threads = [
+            threading.Thread(
+                target=alerter.send_alert,
+                args=("Test", summary, ["admin@example.com"]),
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_server.send_message.call_count == 4
+        assert overlaps == []
+
+    @patch("smtplib.SMTP")
+    def test_dead_smtp_connection_replaced(self, mock_smtp):
+        """Test a connection failing the NOOP probe is reopened."""
+        mock_smtp.return_value.noop.return_value = (421, b"closing")
+        alerter = EmailAlerter()
+        summary = {"test": {"count": 1, "types": ["Error"], "sample_message": ""}}
+
+        for _ in range(2):
+            alerter.send_alert("Test", summary, recipients=["admin@example.com"])
+
+        assert mock_smtp.call_count == 2
+
     @patch("smtplib.SMTP")
     def test_send_email_no_recipients(self, mock_smtp):
         """Test email alert with no recipients specified."""
@@ -203,7 +305,7 @@ class TestWebhookAlerter:
         assert "blocks" in payload
         assert payload["blocks"][0]["text"]["text"] == "*Test Alert*"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_webhook_alert(self, mock_post):
         """Test sending webhook alert."""
         mock_response = MagicMock()
@@ -227,7 +329,21 @@ class TestWebhookAlerter:
         assert call_args[0][0] == "https://hooks.example.com"
         assert "json" in call_args[1]
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    def test_webhook_session_reused(self, mock_post):
+        """Test consecutive webhook alerts share one HTTP session."""
+        mock_post.return_value.status_code = 200
+        alerter = WebhookAlerter(webhook_url="https://hooks.example.com")
+
+        with patch("requests.Session", wraps=requests.Session) as session_cls:
+            alerter.send_alert("Alert", {})
+            alerter.send_alert("Alert", {})
+        alerter.close()
+
+        session_cls.assert_called_once()
+        assert mock_post.call_count == 2
+
+    @patch("requests.Session.post")
     def test_send_webhook_alert_failure(self, mock_post):
         """Test webhook alert handling non-200 response."""
         mock_response = MagicMock()
@@ -247,7 +363,7 @@ class TestWebhookAlerter:
 
         assert result is False
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_webhook_no_url(self, mock_post):
         """Test webhook alert with no URL configured."""
         alerter = WebhookAlerter()
@@ -264,7 +380,7 @@ class TestWebhookAlerter:
         assert result is False
         mock_post.assert_not_called()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_webhook_network_error(self, mock_post):
         """Test webhook alert handling network errors."""
         mock_post.side_effect = requests.RequestException("Connection timeout")
@@ -335,3 +451,52 @@ class TestSendAlertFromAggregator:
         assert result is True
         mock_email.assert_called_once()
         mock_webhook.assert_called_once()
+
+    @patch("src.lms.monitoring.alerter.EmailAlerter.send_alert")
+    def test_send_alert_from_aggregator_async(self, mock_send, tmp_path):
+        """Test alerts can be sent in the background."""
+        mock_send.return_value = True
+
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Test"), step_id="create")
+
+        future = send_alert_from_aggregator_async(aggregator, alert_type="email")
+
+        assert future.result(timeout=5) is True
+        mock_send.assert_called_once()
+
+
+class TestPendingAlertBatcher:
+    """Tests for debounced alerting."""
+
+    @patch("src.lms.monitoring.alerter._send_summary_alert")
+    def test_burst_sends_single_alert(self, mock_send):
+        """Test several schedules within the window send one alert."""
+        batcher = PendingAlertBatcher(delay_seconds=60)
+        aggregator = MagicMock()
+        aggregator.get_summary_by_step.side_effect = [{"a": 1}, {"b": 2}, {"c": 3}]
+
+        for _ in range(3):
+            batcher.schedule(aggregator, "webhook")
+        mock_send.assert_not_called()
+
+        batcher.flush()
+        batcher.flush()
+
+        mock_send.assert_called_once_with({"c": 3}, "webhook")
+
+    @patch("src.lms.monitoring.alerter._send_summary_alert")
+    def test_timer_sends_alert(self, mock_send):
+        """Test the pending alert is sent once the window elapses."""
+        sent = threading.Event()
+        mock_send.side_effect = lambda *args: sent.set()
+        batcher = PendingAlertBatcher(delay_seconds=0.01)
+        aggregator = MagicMock()
+        aggregator.get_summary_by_step.return_value = {"create": {"count": 1}}
+
+        batcher.schedule(aggregator)
+
+        assert sent.wait(timeout=5)
+        mock_send.assert_called_once_with({"create": {"count": 1}}, "email")
+        # The summary was taken on this thread, not the timer thread
+        aggregator.get_summary_by_step.assert_called_once_with()
@@ -1,5 +1,6 @@
 """Tests for monitoring modules."""
 
+import json
 from datetime import datetime
 from datetime import timedelta
 from unittest.mock import MagicMock
@@ -7,7 +8,10 @@ from unittest.mock import patch
 
 import pytest
 from src.lms.monitoring.error_aggregator import ErrorAggregator
+from src.lms.monitoring.error_aggregator import RECENT_OCCURRENCES
 from src.lms.monitoring.metrics import MetricsCollector
+from src.lms.monitoring.metrics import _insert_rows
+from src.lms.monitoring.metrics import flush_metrics
 from src.lms.monitoring.syslog_handler import setup_syslog_handler
 
 
@@ -64,7 +68,8 @@ class TestErrorAggregator:
         summary = aggregator.get_daily_summary()
 
         assert len(summary) == 2
-        assert all(isinstance(errors, list) for errors in summary.values())
+        assert {entry["step_id"] for entry in summary.values()} == {"create", "share"}
+        assert all(entry["count"] == 1 for entry in summary.values())
 
     def test_get_summary_by_step(self, tmp_path):
         """Test retrieving error summary grouped by step."""
@@ -101,6 +106,21 @@ class TestErrorAggregator:
         summary = aggregator.get_daily_summary()
         assert len(summary) == 1
 
+    def test_error_context_made_json_native(self, tmp_path):
+        """Test non-JSON context values are stored as strings and lists."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        context = {"labs_path": tmp_path, "tags": ("a",), 1: None}
+
+        aggregator.record_error(ValueError("Error"), step_id="share", context=context)
+
+        reloaded = ErrorAggregator(storage_path=tmp_path)
+        (entry,) = reloaded.get_daily_summary().values()
+        assert entry["recent_occurrences"][0]["context"] == {
+            "labs_path": str(tmp_path),
+            "tags": ["a"],
+            "1": None,
+        }
+
     def test_error_with_retry_count(self, tmp_path):
         """Test recording error with retry information."""
         aggregator = ErrorAggregator(storage_path=tmp_path)
@@ -129,18 +149,157 @@ class TestErrorAggregator:
         # Record an error
         aggregator.record_error(ValueError("Old error"), step_id="create")
 
-        # Manually modify timestamp to be 25 hours old
+        # Manually mark the error as last seen 25 hours ago
         errors = aggregator._load_errors()
-        for error_hash, occurrences in errors.items():
-            for occurrence in occurrences:
-                old_time = datetime.now() - timedelta(hours=25)
-                occurrence["timestamp"] = old_time.isoformat()
+        for entry in errors.values():
+            old_time = datetime.now() - timedelta(hours=25)
+            entry["last_seen"] = old_time.timestamp()
         aggregator._save_errors(errors)
 
         # Retrieve summary should prune the old error
         summary = aggregator.get_daily_summary()
         assert len(summary) == 0
 
+    def test_count_covers_past_24_hours_only(self, tmp_path):
+        """Test a recurring error only counts occurrences in the window."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Flaky"), step_id="share")
+        aggregator.record_error(ValueError("Flaky"), step_id="share")
+
+        # Age the first occurrence past the window
+        errors = aggregator._load_errors()
+        (entry,) = errors.values()
+        old_time = (datetime.now() - timedelta(hours=25)).timestamp()
+        entry["occurrence_times"][0] = old_time
+        entry["recent_occurrences"][0]["timestamp"] = old_time
+        aggregator._save_errors(errors)
+
+        (entry,) = ErrorAggregator(storage_path=tmp_path).get_daily_summary().values()
+        assert entry["count"] == 1
+        assert entry["first_seen"] > old_time
+        assert len(entry["recent_occurrences"]) == 1
+
+    def test_records_are_appended_and_reloaded(self, tmp_path):
+        """Test occurrences are appended, then replayed by a new instance."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Error 1"), step_id="create")
+        aggregator.record_error(ValueError("Error 1"), step_id="create")
+        aggregator.record_error(TypeError("Error 2"), step_id="share")
+
+        assert not aggregator.error_log_file.exists()
+        assert len(aggregator.append_log_file.read_text().splitlines()) == 3
+
+        reloaded = ErrorAggregator(storage_path=tmp_path)
+        assert reloaded.get_summary_by_step()["create"]["count"] == 2
+        assert reloaded.record_error(TypeError("Error 2"), step_id="share") is False
+
+    def test_append_log_compacted(self, tmp_path, monkeypatch):
+        """Test the append log is folded into the JSON file periodically."""
+        monkeypatch.setattr(
+            "src.lms.monitoring.error_aggregator.COMPACT_AFTER_APPENDS", 2
+        )
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        for i in range(3):
+            aggregator.record_error(ValueError(f"Error {i}"), step_id="create")
+
+        assert not aggregator.append_log_file.exists()
+        assert ErrorAggregator(storage_path=tmp_path).get_error_count() == 3
+
+    def test_other_process_appends_survive_compaction(self, tmp_path, monkeypatch):
+        """Test occurrences appended by another process are not lost."""
+        monkeypatch.setattr(
+            "src.lms.monitoring.error_aggregator.COMPACT_AFTER_APPENDS", 2
+        )
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Mine"), step_id="create")
+
+        # e.g. a git hook recording an error while this process runs
+        ErrorAggregator(storage_path=tmp_path).record_error(
+            TypeError("Hook"), step_id="share"
+        )
+        aggregator.record_error(ValueError("Mine"), step_id="create")
+        aggregator.record_error(ValueError("Mine"), step_id="create")
+
+        assert aggregator.error_log_file.exists()
+        summary = ErrorAggregator(storage_path=tmp_path).get_summary_by_step()
+        assert summary["create"]["count"] == 3
+        assert summary["share"]["count"] == 1
+
+    def test_cache_picks_up_other_process_writes(self, tmp_path):
+        """Test the cached log is refreshed when the files change on disk."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Mine"), step_id="create")
+
+        other = ErrorAggregator(storage_path=tmp_path)
+        other.record_error(TypeError("Hook"), step_id="share")
+        assert aggregator.get_error_count() == 2
+
+        other.clear_errors()
+        other.record_error(KeyError("Fresh"), step_id="notify")
+        other._save_errors(other._load_errors())
+        assert list(aggregator.get_summary_by_step()) == ["notify"]
+
+    def test_legacy_log_migrated(self, tmp_path):
+        """Test per-occurrence logs with ISO timestamps are converted once."""
+        first = datetime.now() - timedelta(hours=2)
+        last = datetime.now() - timedelta(hours=1)
+        (tmp_path / ".errors.json").write_text(
+            json.dumps(
+                {
+                    "abc": [
+                        {"timestamp": first.isoformat(), "step_id": "create"},
+                        {"timestamp": last.isoformat(), "step_id": "create"},
+                    ]
+                }
+            )
+        )
+
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+
+        assert aggregator.get_summary_by_step()["create"]["count"] == 2
+        stored = json.loads((tmp_path / ".errors.json").read_text())
+        assert stored["abc"]["first_seen"] == first.timestamp()
+        assert stored["abc"]["last_seen"] == last.timestamp()
+
+    def test_legacy_log_with_bad_timestamps(self, tmp_path):
+        """Test unreadable legacy occurrences are dropped, not raised."""
+        now = datetime.now()
+        (tmp_path / ".errors.json").write_text(
+            json.dumps(
+                {
+                    "abc": [
+                        {"timestamp": "not a date", "step_id": "create"},
+                        {"timestamp": None, "step_id": "create"},
+                        {"timestamp": now.isoformat(), "step_id": "create"},
+                    ]
+                }
+            )
+        )
+
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+
+        assert aggregator.get_summary_by_step()["create"]["count"] == 1
+        assert aggregator.record_error(ValueError("New"), step_id="share") is True
+
+    def test_recent_occurrences_bounded(self, tmp_path):
+        """Test repeated errors keep a count, not every occurrence."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        for _ in range(RECENT_OCCURRENCES + 3):
+            aggregator.record_error(ValueError("Flaky"), step_id="share")
+
+        (entry,) = ErrorAggregator(storage_path=tmp_path).get_daily_summary().values()
+        assert entry["count"] == RECENT_OCCURRENCES + 3
+        assert len(entry["recent_occurrences"]) == RECENT_OCCURRENCES
+
+    def test_cached_log_not_repruned_within_interval(self, tmp_path):
+        """Test the in-memory log is pruned at most once per interval."""
+        aggregator = ErrorAggregator(storage_path=tmp_path)
+        aggregator.record_error(ValueError("Error"), step_id="create")
+        for entry in aggregator.get_daily_summary().values():
+            entry["last_seen"] = 0.0
+
+        assert len(aggregator.get_daily_summary()) == 1
+
 
 class TestMetricsCollector:
     """Tests for metrics collection."""
@@ -209,6 +368,7 @@ class TestMetricsCollector:
         assert stats["min_duration_seconds"] == 5.0
         assert stats["max_duration_seconds"] == 15.0
         assert stats["avg_duration_seconds"] == pytest.approx(10.0)
+        assert stats["std_dev_seconds"] == pytest.approx(5.0)
 
     def test_get_step_history(self, tmp_path):
         """Test retrieving step execution history."""
@@ -221,6 +381,7 @@ class TestMetricsCollector:
 
         assert len(history) == 3
         assert all(h["step_id"] == "create" for h in history)
+        assert [h["duration_seconds"] for h in history] == [5.0, 4.0, 3.0]
 
     def test_get_overall_stats(self, tmp_path):
         """Test retrieving overall application statistics."""
@@ -263,6 +424,38 @@ class TestMetricsCollector:
         hourly = collector.get_daily_metrics(hours=1)
         assert "create" in hourly
 
+    def test_record_step_executions_batch(self, tmp_path):
+        """Test bulk recording writes all rows in one insert."""
+        collector = MetricsCollector(storage_path=tmp_path)
+        with patch(
+            "src.lms.monitoring.metrics._insert_rows", wraps=_insert_rows
+        ) as insert:
+            written = collector.record_step_executions(
+                [
+                    ("create", 1.0, True),
+                    ("share", 2.0, False, 3, 4, {"retry": 1}),
+                ]
+            )
+
+        assert written == 2
+        insert.assert_called_once()
+        history = collector.get_step_history("share")
+        assert history[0]["api_calls"] == 3
+        assert history[0]["metadata"] == {"retry": 1}
+
+    def test_queued_writes_flushed(self, tmp_path):
+        """Test queued executions are all written once flushed."""
+        collector = MetricsCollector(storage_path=tmp_path)
+        with patch(
+            "src.lms.monitoring.metrics._insert_rows", wraps=_insert_rows
+        ) as insert:
+            for i in range(250):
+                collector.record_step_execution("create", float(i), True)
+            flush_metrics()
+
+        assert sum(len(call.args[1]) for call in insert.call_args_list) == 250
+        assert collector.get_overall_stats()["total_executions"] == 250
+
 
 class TestSyslogHandler:
     """Tests for syslog integration."""
@@ -0,0 +1,32 @@
+"""Tests for the lazy monitoring package exports."""
+
+import subprocess
+import sys
+
+import pytest
+import src.lms.monitoring as monitoring
+
+
+def test_metrics_import_does_not_load_alerter():
+    """Test importing MetricsCollector leaves the alerting stack unloaded."""
+    code = (
+        "import sys; from src.lms.monitoring import MetricsCollector;"
+        "print('src.lms.monitoring.alerter' in sys.modules)"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_exports_resolve_and_unknown_names_raise():
+    """Test every public name resolves and others raise AttributeError."""
+    from src.lms.monitoring.alerter import send_alert_from_aggregator
+
+    assert monitoring.send_alert_from_aggregator is send_alert_from_aggregator
+    assert all(getattr(monitoring, name) for name in monitoring.__all__)
+    assert set(monitoring.__all__) <= set(dir(monitoring))
+    with pytest.raises(AttributeError):
+        monitoring.NotAThing
@@ -1,9 +1,10 @@
 """Tests for Phase 5 database optimization helpers."""
 
 import sqlite3
+from datetime import datetime
 
 from src.lms.cache import TTLCache
-from src.lms.database import get_connection, init_db
+from src.lms.database import epoch_micros, get_connection, init_db
 from src.lms.database_optimization import (
     ConnectionPool,
     analyze_query_plan,
@@ -11,6 +12,58 @@ from src.lms.database_optimization import (
     ensure_tracking_indexes,
     vacuum_db,
 )
+from src.lms.persistence import get_step_durations_for_date
+
+
+def test_connection_pragmas(tmp_path):
+    conn = get_connection(tmp_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL, 2 == MEMORY
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+
+def test_performance_metrics_timestamps_migrated(tmp_path):
+    init_db(tmp_path)
+    conn = get_connection(tmp_path)
+    conn.executescript(
+        """
+        DROP TABLE performance_metrics;
+        CREATE TABLE performance_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            step_id TEXT NOT NULL,
+            duration_seconds REAL NOT NULL,
+            success BOOLEAN NOT NULL,
+            api_calls INTEGER DEFAULT 0,
+            items_processed INTEGER DEFAULT 0,
+            metadata TEXT
+        );
+        INSERT INTO performance_metrics (timestamp, step_id, duration_seconds, success)
+        VALUES ('2026-02-10T08:00:00.250000', 'step_1', 1.5, 1);
+        DELETE FROM schema_version WHERE version >= 9;
+        """
+    )
+    conn.close()
+
+    init_db(tmp_path)
+    conn = get_connection(tmp_path)
+    try:
+        (timestamp,) = conn.execute(
+            "SELECT timestamp FROM performance_metrics"
+        ).fetchone()
+        indexes = {
+            row[1] for row in conn.execute("PRAGMA index_list(performance_metrics)")
+        }
+    finally:
+        conn.close()
+    assert timestamp == epoch_micros(datetime(2026, 2, 10, 8, 0, 0, 250000))
+    assert "idx_performance_metrics_step_timestamp" in indexes
+    assert get_step_durations_for_date("2026-02-10", tmp_path) == {1: 1}
 
 
 def test_ensure_tracking_indexes(tmp_path):
@@ -1,39 +1,54 @@
 """Tests for logging configuration and verbose mode."""
 
+import json
 import logging
 from io import StringIO
 from unittest.mock import patch
 
-from src.lms.logging_config import setup_logging, get_logger
+import pytest
+
+from src.lms.logging_config import JsonFormatter, setup_logging, get_logger
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    """Restore root logger handlers and level changed by setup_logging."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    for handler in root.handlers[:]:
+        if handler not in handlers:
+            root.removeHandler(handler)
+    root.setLevel(level)
+    if hasattr(root, "_skillops_config"):
+        del root._skillops_config
+
+
+def _skillops_handlers(root: logging.Logger) -> list[logging.Handler]:
+    return [h for h in root.handlers if getattr(h, "_skillops", False)]
 
 
 class TestLoggingSetup:
     """Test logging configuration."""
 
-    def test_setup_logging_verbose_sets_debug_level(self) -> None:
+    def test_setup_logging_verbose_sets_debug_level(self, restore_root_logger) -> None:
         """Test that verbose mode sets DEBUG level."""
-        with patch("src.lms.logging_config.logging.basicConfig") as mock_config:
-            setup_logging(verbose=True)
-            # Get the level argument passed to basicConfig
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.DEBUG
+        setup_logging(verbose=True)
+        assert restore_root_logger.level == logging.DEBUG
 
-    def test_setup_logging_non_verbose_sets_info_level(self) -> None:
+    def test_setup_logging_non_verbose_sets_info_level(
+        self, restore_root_logger
+    ) -> None:
         """Test that non-verbose mode sets INFO level."""
-        with patch("src.lms.logging_config.logging.basicConfig") as mock_config:
-            setup_logging(verbose=False)
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.INFO
+        setup_logging(verbose=False)
+        assert restore_root_logger.level == logging.INFO
 
-    def test_setup_logging_configures_stream_handler(self) -> None:
+    def test_setup_logging_configures_stream_handler(self, restore_root_logger) -> None:
         """Test that setup_logging configures a StreamHandler."""
-        with patch("src.lms.logging_config.logging.basicConfig") as mock_config:
-            setup_logging(verbose=True)
-            call_kwargs = mock_config.call_args[1]
-            # Verify StreamHandler is in handlers list
-            handlers = call_kwargs["handlers"]
-            assert len(handlers) > 0
-            assert isinstance(handlers[0], logging.StreamHandler)
+        setup_logging(verbose=True)
+        handlers = _skillops_handlers(restore_root_logger)
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.StreamHandler)
 
     def test_setup_logging_reduces_library_noise(self) -> None:
         """Test that setup_logging reduces noise from third-party libraries."""
@@ -46,12 +61,24 @@ class TestLoggingSetup:
             assert "urllib3" in names
             assert "requests" in names
 
-    def test_setup_logging_default_is_non_verbose(self) -> None:
+    def test_setup_logging_default_is_non_verbose(self, restore_root_logger) -> None:
         """Test that setup_logging defaults to non-verbose."""
-        with patch("src.lms.logging_config.logging.basicConfig") as mock_config:
-            setup_logging()
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.INFO
+        setup_logging()
+        assert restore_root_logger.level == logging.INFO
+
+    def test_setup_logging_is_idempotent(self, restore_root_logger) -> None:
+        """Test repeated calls replace the handler instead of stacking them."""
+        setup_logging(verbose=True, log_format="text")
+        first = _skillops_handlers(restore_root_logger)
+        setup_logging(verbose=True, log_format="text")
+        assert _skillops_handlers(restore_root_logger) == first
+
+        setup_logging(verbose=False, log_format="json")
+        handlers = _skillops_handlers(restore_root_logger)
+        assert len(handlers) == 1
+        assert handlers != first
+        assert isinstance(handlers[0].formatter, JsonFormatter)
+        assert restore_root_logger.level == logging.INFO
 
 
 class TestGetLogger:
@@ -149,3 +176,47 @@ class TestVerboseLoggingIntegration:
 
             assert "Debug message" not in log_output
             assert "Info message" in log_output
+
+
+class TestJsonFormatter:
+    """Test structured JSON log output."""
+
+    def test_timestamp_uses_record_time(self) -> None:
+        """Test timestamps come from the record, including microseconds."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord("skillops", logging.INFO, "", 0, "hi", None, None)
+        record.created = 1767225600.25
+
+        payload = json.loads(formatter.format(record))
+
+        assert payload["timestamp"] == "2026-01-01T00:00:00.250000+00:00"
+        assert payload["message"] == "hi"
+
+    def test_non_ascii_kept_verbatim(self) -> None:
+        """Test messages are emitted as UTF-8 text, not escaped."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            "skillops", logging.INFO, "", 0, "réussi", None, None
+        )
+
+        output = formatter.format(record)
+
+        assert '"message":"réussi"' in output
+
+    def test_unencodable_message_does_not_raise(self) -> None:
+        """Test lone surrogates fall back to escaped JSON instead of raising."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            "skillops", logging.INFO, "", 0, "bad \udcff name", None, None
+        )
+
+        payload = json.loads(formatter.format(record))
+
+        assert payload["message"] == "bad \udcff name"
+
+    def test_timestamp_refreshes_on_new_second(self) -> None:
+        """Test the cached date/time prefix changes with the second."""
+        formatter = JsonFormatter()
+
+        assert formatter._timestamp(1767225600.0).startswith("2026-01-01T00:00:00.")
+        assert formatter._timestamp(1767225661.5) == "2026-01-01T00:01:01.500000+00:00"
@@ -1,11 +1,20 @@
 """Tests for Phase 3 passive tracking (git hooks + WakaTime)."""
 
-from src.lms.database import init_db, get_connection
+import io
+import shutil
+import subprocess
+
+import pytest
+
+from src.lms.database import init_db, get_connection, get_db_path
+from src.lms import git_hooks
 from src.lms.git_hooks import (
     record_commit_to_db,
     get_today_commits,
     calculate_session_metrics,
     install_post_commit_hook,
+    run_post_commit_hook,
+    backfill_commit_history,
 )
 from src.lms.passive_tracking import (
     collect_daily_tracking_data,
@@ -71,6 +80,78 @@ class TestGitHooks:
         commits = get_today_commits(storage_path=tmp_path)
         assert len(commits) == 3
 
+    def test_record_commit_creates_schema_once(self, tmp_path, monkeypatch):
+        """Test schema setup runs only on the first commit per database."""
+        calls = []
+        original = git_hooks._ensure_schema
+        monkeypatch.setattr(
+            git_hooks,
+            "_ensure_schema",
+            lambda conn: (calls.append(conn), original(conn)),
+        )
+
+        for i in range(3):
+            assert record_commit_to_db(
+                commit_hash=f"hash{i}",
+                commit_time="2026-02-12T10:30:00Z",
+                commit_msg=f"Commit {i}",
+                files_changed=1,
+                lines_added=1,
+                lines_deleted=0,
+                storage_path=tmp_path,
+            )
+
+        assert len(calls) == 1
+        assert str(get_db_path(tmp_path)) in git_hooks._SCHEMA_READY
+
+        conn = get_connection(tmp_path)
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(code_sessions)")}
+        count = conn.execute("SELECT COUNT(*) FROM code_sessions").fetchone()[0]
+        conn.close()
+        assert "idx_code_sessions_date_time" in indexes
+        assert count == 3
+
+    def test_insert_sql_looked_up_once(self, tmp_path, monkeypatch):
+        """Test the code_sessions schema is inspected once per database."""
+        lookups = []
+        original = git_hooks.code_session_insert_sql
+        monkeypatch.setattr(
+            git_hooks,
+            "code_session_insert_sql",
+            lambda conn: (lookups.append(conn), original(conn))[1],
+        )
+
+        for i in range(3):
+            assert record_commit_to_db(
+                commit_hash=f"hash{i}",
+                commit_time="2026-02-12T10:30:00Z",
+                commit_msg=f"Commit {i}",
+                files_changed=1,
+                lines_added=1,
+                lines_deleted=0,
+                storage_path=tmp_path,
+            )
+
+        assert len(lookups) == 1
+
+    def test_malformed_commit_time_rejected(self, tmp_path):
+        """Test commits whose timestamp has no valid date are not stored."""
+        init_db(tmp_path)
+        assert not record_commit_to_db(
+            commit_hash="bad",
+            commit_time="yesterday",
+            commit_msg="Commit",
+            files_changed=1,
+            lines_added=1,
+            lines_deleted=0,
+            storage_path=tmp_path,
+        )
+
+        conn = get_connection(tmp_path)
+        count = conn.execute("SELECT COUNT(*) FROM code_sessions").fetchone()[0]
+        conn.close()
+        assert count == 0
+
     def test_calculate_session_metrics_no_commits(self, tmp_path, monkeypatch):
         """Test metrics calculation with no commits."""
         monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
@@ -120,6 +201,86 @@ class TestGitHooks:
         assert metrics["total_changes"] == 95
 
 
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a git repository with a single commit."""
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    (repo / "app.py").write_text("a = 1\nb = 2\n")
+    (repo / "logo.bin").write_bytes(b"\x00\x01\x02")
+    git("add", ".")
+    git("commit", "-q", "-m", "Add app's first 'quoted' version")
+    return repo
+
+
+class TestPostCommitHook:
+    """Tests for the post-commit hook entry point."""
+
+    def test_run_post_commit_hook_records_head(self, git_repo, tmp_path):
+        """Test HEAD commit metadata is parsed and stored."""
+        storage = tmp_path / "storage"
+
+        assert run_post_commit_hook(repo_path=git_repo, storage_path=storage)
+
+        conn = get_connection(storage)
+        row = conn.execute(
+            "SELECT commit_msg, files_changed, lines_added, lines_deleted "
+            "FROM code_sessions"
+        ).fetchone()
+        conn.close()
+        assert row == ("Add app's first 'quoted' version", 2, 2, 0)
+
+    def test_backfill_commit_history(self, git_repo, tmp_path):
+        """Test historical commits are imported in chunks without duplicates."""
+        for i in range(3):
+            (git_repo / f"f{i}.txt").write_text("x\n" * (i + 1))
+            subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+            subprocess.run(
+                ["git", "commit", "-q", "-m", f"Commit {i}"], cwd=git_repo, check=True
+            )
+        storage = tmp_path / "storage"
+
+        inserted = backfill_commit_history(
+            repo_path=git_repo, storage_path=storage, chunk_size=2
+        )
+        again = backfill_commit_history(repo_path=git_repo, storage_path=storage)
+
+        conn = get_connection(storage)
+        added = conn.execute("SELECT SUM(lines_added) FROM code_sessions").fetchone()[0]
+        conn.close()
+        assert inserted == 4
+        assert again == 0
+        assert added == 2 + 1 + 2 + 3
+
+    def test_parse_git_log_stream_small_blocks(self):
+        """Test records split across read boundaries are reassembled."""
+        output = (
+            b"\x1eaaa\x002026-02-12T10:00:00+00:00\x00First\n\x00\n\n1\t0\ta.py\n"
+            b"\x1ebbb\x002026-02-11T09:00:00+00:00\x00Second\n\x00\n\n-\t-\tb.png\n"
+        )
+
+        rows = list(git_hooks._parse_git_log_stream(io.BytesIO(output), block_size=3))
+
+        assert rows == [
+            ("aaa", "2026-02-12T10:00:00+00:00", "First", 1, 1, 0),
+            ("bbb", "2026-02-11T09:00:00+00:00", "Second", 1, 0, 0),
+        ]
+
+    def test_run_post_commit_hook_outside_repo(self, tmp_path):
+        """Test hook returns False when git fails."""
+        assert run_post_commit_hook(repo_path=tmp_path, storage_path=tmp_path) is False
+
+
 class TestPassiveTracking:
     """Tests for passive tracking integration."""
 
@@ -275,3 +436,92 @@ class TestSchemaVersion:
         conn.close()
 
         assert version >= 7
+
+    def test_schema_v8_generates_commit_date(self, tmp_path, monkeypatch):
+        """Test code_sessions.date is derived from commit_time after v8."""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        init_db(tmp_path)
+
+        # Simulate a v7 database with a plain date column and existing data
+        conn = get_connection(tmp_path)
+        conn.executescript(
+            """
+            DROP TABLE code_sessions;
+            CREATE TABLE code_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                commit_hash TEXT UNIQUE NOT NULL,
+                commit_time TEXT NOT NULL,
+                commit_msg TEXT,
+                files_changed INTEGER,
+                lines_added INTEGER,
+                lines_deleted INTEGER,
+                recorded_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                date TEXT NOT NULL
+            );
+            CREATE INDEX idx_code_sessions_date ON code_sessions(date);
+            INSERT INTO code_sessions (commit_hash, commit_time, date)
+            VALUES ('old', '2026-02-10T08:00:00+01:00', '2026-02-10');
+            DELETE FROM schema_version WHERE version >= 8;
+            """
+        )
+        conn.close()
+
+        init_db(tmp_path)
+        record_commit_to_db(
+            commit_hash="new",
+            commit_time="2026-02-12T23:30:00-05:00",
+            commit_msg="Late commit",
+            files_changed=1,
+            lines_added=1,
+            lines_deleted=0,
+            storage_path=tmp_path,
+        )
+
+        conn = get_connection(tmp_path)
+        rows = conn.execute(
+            "SELECT commit_hash, date FROM code_sessions ORDER BY commit_hash"
+        ).fetchall()
+        conn.close()
+
+        assert rows == [("new", "2026-02-12"), ("old", "2026-02-10")]
+
+    def test_plain_date_column_still_filled(self, tmp_path, monkeypatch):
+        """Test inserts follow the schema when date is not a generated column."""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        init_db(tmp_path)
+
+        # A current database created by an SQLite without generated columns
+        conn = get_connection(tmp_path)
+        conn.executescript(
+            """
+            DROP TABLE code_sessions;
+            CREATE TABLE code_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                commit_hash TEXT UNIQUE NOT NULL,
+                commit_time TEXT NOT NULL,
+                commit_msg TEXT,
+                files_changed INTEGER,
+                lines_added INTEGER,
+                lines_deleted INTEGER,
+                recorded_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                date TEXT NOT NULL
+            );
+            """
+        )
+        conn.close()
+
+        assert record_commit_to_db(
+            commit_hash="plain",
+            commit_time="2026-02-12T23:30:00-05:00",
+            commit_msg="Commit",
+            files_changed=1,
+            lines_added=1,
+            lines_deleted=0,
+            storage_path=tmp_path,
+        )
+
+        conn = get_connection(tmp_path)
+        rows = conn.execute("SELECT commit_hash, date FROM code_sessions").fetchall()
+        conn.close()
+
+        assert rows == [("plain", "2026-02-12")]
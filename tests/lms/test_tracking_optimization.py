@@ -59,6 +59,20 @@ def test_batch_insert_missing_fields(tmp_path):
         batch_insert_code_sessions([{"commit_hash": "x"}], storage_path=tmp_path)
 
 
+def test_batch_insert_malformed_commit_time(tmp_path):
+    init_db(tmp_path)
+    commit = {
+        "commit_hash": "x",
+        "commit_time": "12/02/2026 10:00",
+        "commit_msg": "Test",
+        "files_changed": 1,
+        "lines_added": 1,
+        "lines_deleted": 0,
+    }
+    with pytest.raises(ValueError):
+        batch_insert_code_sessions([commit], storage_path=tmp_path)
+
+
 def test_stream_tracking_summary(tmp_path):
     init_db(tmp_path)
     conn = get_connection(tmp_path)
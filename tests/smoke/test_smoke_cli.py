@@ -1,6 +1,10 @@
+import subprocess
+import sys
+
+import pytest
 from typer.testing import CliRunner
 
-from src.lms.main import app
+from src.lms.main import VERSION_BANNER, _app_for, app, main, run
 
 
 runner = CliRunner()
@@ -15,3 +19,79 @@ def test_cli_version_smoke():
     result = runner.invoke(app, ["version"])
     assert result.exit_code == 0
     assert "SkillOps" in result.stdout
+
+
+def test_cli_loads_env_only_for_commands(monkeypatch):
+    calls = []
+    monkeypatch.setattr("src.lms.main._ensure_env", lambda: calls.append(True))
+
+    runner.invoke(app, ["--help"])
+    runner.invoke(app, ["version"])
+    assert calls == []
+
+    runner.invoke(app, ["check-books", "--help"])
+    assert calls == [True]
+
+
+def test_cli_registers_only_invoked_command():
+    single = _app_for(["stats", "--storage-path", "x"])
+
+    assert [info.name for info in single.registered_commands] == ["stats"]
+    assert _app_for(["post-mortem"]).registered_commands[0].name == "post-mortem"
+    assert _app_for(["import-data", "f.json"]) is not app
+    for argv in ([], ["--help"], ["version", "--help"], ["unknown"]):
+        assert _app_for(argv) is app
+
+    result = runner.invoke(_app_for(["version"]), ["version"])
+    assert result.exit_code == 0
+    assert "SkillOps" in result.stdout
+
+
+def test_main_answers_version_without_typer(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["skillops", "--version"])
+    monkeypatch.setattr(
+        "src.lms.main._app_for", lambda argv: pytest.fail("typer app was built")
+    )
+
+    main()
+
+    assert capsys.readouterr().out == VERSION_BANNER + "\n"
+
+
+def test_run_leaves_version_probes_to_launcher(monkeypatch):
+    built = []
+    monkeypatch.setattr(
+        "src.lms.main._app_for", lambda argv: built.append(argv) or (lambda: None)
+    )
+
+    run(["--version"])
+
+    assert built == [["--version"]]
+
+
+def test_launcher_version_does_not_import_typer():
+    code = (
+        "import sys; sys.argv = ['skillops', '--version'];"
+        "from src.lms.launcher import main; main();"
+        "print('typer' in sys.modules)"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines() == [VERSION_BANNER, "False"]
+
+
+def test_main_prints_plain_help(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["skillops", "--help"])
+    monkeypatch.setattr(
+        "src.lms.main._app_for", lambda argv: pytest.fail("typer app was built")
+    )
+
+    main()
+
+    out = capsys.readouterr().out
+    assert out.startswith("Usage: skillops")
+    assert "  import-data " in out
+    assert "Export progress and metrics data for backup or analysis." in out